@@ -1,4 +1,9 @@
+from collections import Counter
+
 from django.contrib import admin, messages
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import transaction
 from django.utils.html import format_html
 from django.urls import reverse, path
 from django.utils import timezone
@@ -7,7 +12,61 @@ from decimal import Decimal # Ensure Decimal is imported for commission percenta
 
 from .models import ContactMessage
 from .models import CustomUser, Profile, TeacherCourse, CourseCategory, CourseLevel, EnrolledCourse, AllowedCard
+from .models import CourseRanking, CourseRevenueSnapshot, Job
+from .catalog import invalidate_catalog
+from .search import filter_matching_courses
+from .jobs import retry_jobs
+from .ledger import record_enrollment, record_unenrollment
+from .payments import card_fingerprint, normalize_card_number
+from .applications import APPROVED, REJECTED, approve_teacher_applications, reject_teacher_applications
+from .notifications import (
+    notify_teacher_application_approved, notify_teacher_application_rejected, notify_teacher_deactivated,
+)
+from .forms import AllowedCardForm
 from .forms import TeacherCourseForm # Assuming this form still exists and is needed elsewhere
+from .pagination import ApproximateCountPaginator
+
+# Add ?exact_count=1 to a changelist URL to count its rows exactly
+EXACT_COUNT_PARAM = 'exact_count'
+
+
+class ExactCountChangeList(ChangeList):
+    """Keeps ?exact_count=1 on the changelist's pagination, sorting and filter links."""
+
+    def __init__(self, request, *args, **kwargs):
+        self.exact_count = getattr(request, 'exact_count', False)
+        super().__init__(request, *args, **kwargs)
+
+    def get_query_string(self, new_params=None, remove=None):
+        if self.exact_count:
+            new_params = {**(new_params or {}), EXACT_COUNT_PARAM: 1}
+        return super().get_query_string(new_params, remove)
+
+
+class ApproximateCountAdminMixin:
+    """
+    Changelists on large tables: the page count comes from planner estimates
+    (ApproximateCountPaginator) and the unfiltered total is not counted at all.
+    """
+    paginator = ApproximateCountPaginator
+    show_full_result_count = False
+
+    def get_changelist(self, request, **kwargs):
+        return ExactCountChangeList
+
+    def changelist_view(self, request, extra_context=None):
+        # Taken out of the query string before ChangeList reads it as a field lookup
+        if EXACT_COUNT_PARAM in request.GET:
+            request.GET = request.GET.copy()
+            del request.GET[EXACT_COUNT_PARAM]
+            request.exact_count = True
+        return super().changelist_view(request, extra_context)
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        if getattr(request, 'exact_count', False):
+            return Paginator(queryset, per_page, orphans, allow_empty_first_page)
+        return super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+
 
 # 1. Create an Inline Admin for the Profile model (No change needed here)
 class ProfileInline(admin.StackedInline):
@@ -48,7 +107,7 @@ class ProfileInline(admin.StackedInline):
 
 # --- Custom Admin for CustomUser (No change needed here) ---
 @admin.register(CustomUser)
-class CustomUserAdmin(admin.ModelAdmin):
+class CustomUserAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
     list_display = (
         'username',
         'email',
@@ -88,10 +147,14 @@ class CustomUserAdmin(admin.ModelAdmin):
     def is_teacher_approved_display(self, obj):
         return obj.profile.is_teacher_approved if hasattr(obj, 'profile') else False
 
+    def get_queryset(self, request):
+        # The name / approval columns read obj.profile on every row
+        return super().get_queryset(request).select_related('profile')
+
 
 # --- Custom Admin for Profile: The Core Changes ---
 @admin.register(Profile)
-class ProfileAdmin(admin.ModelAdmin):
+class ProfileAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
     change_form_template = 'accounts/change_form.html'
 
     list_display = (
@@ -166,12 +229,32 @@ class ProfileAdmin(admin.ModelAdmin):
             return read_only_fields + ('commission_percentage', 'rejection_reason', 'is_teacher_application_pending',)
 
 
-    actions = []
+    actions = ['approve_selected_applications', 'reject_selected_applications']
+
+    # --- Bulk application decisions (one transaction, notifications queued) ---
+    def _report_bulk_results(self, request, results, done):
+        counts = Counter(results.values())
+        skipped = len(results) - counts[done]
+        self.message_user(request, f"{counts[done]} teacher application(s) {done}.", messages.SUCCESS)
+        if skipped:
+            details = ', '.join(f"{count} {result.replace('_', ' ')}" for result, count in counts.items() if result != done)
+            self.message_user(request, f"{skipped} skipped ({details}).", messages.WARNING)
+
+    def approve_selected_applications(self, request, queryset):
+        # Keeps each profile's current commission percentage
+        results = approve_teacher_applications(queryset.values_list('id', flat=True), request.user)
+        self._report_bulk_results(request, results, APPROVED)
+    approve_selected_applications.short_description = "Approve selected teacher applications"
+
+    def reject_selected_applications(self, request, queryset):
+        results = reject_teacher_applications(queryset.values_list('id', flat=True), request.user, "Rejected by admin.")
+        self._report_bulk_results(request, results, REJECTED)
+    reject_selected_applications.short_description = "Reject selected teacher applications"
 
     # --- Utility methods for list_display (KEEP AS IS) ---
     def username_link(self, obj):
         link = reverse("admin:{}_{}_change".format(self.model._meta.app_label, self.model._meta.model_name), args=[obj.id])
-        return format_html('<a href="%s">%s</a>' % (link, obj.user.username))
+        return format_html('<a href="{}">{}</a>', link, obj.user.username)
     username_link.short_description = 'User'
     username_link.admin_order_field = 'user__username'
 
@@ -217,6 +300,7 @@ class ProfileAdmin(admin.ModelAdmin):
                 obj.commission_percentage = commission_percentage
                 messages.success(request, f"Teacher '{obj.user.username}' approved with {commission_percentage}% commission.")
                 obj.save()
+                notify_teacher_application_approved(obj)
                 return
 
             # --- Handle REJECTION for PENDING or DEACTIVATED teacher ---
@@ -237,6 +321,7 @@ class ProfileAdmin(admin.ModelAdmin):
                 obj.commission_percentage = Decimal('0.00') # Reset commission on rejection
                 messages.warning(request, f"Teacher '{obj.user.username}' application rejected.")
                 obj.save()
+                notify_teacher_application_rejected(obj)
                 return
 
             # --- Handle DEACTIVATION of APPROVED teacher ---
@@ -256,6 +341,7 @@ class ProfileAdmin(admin.ModelAdmin):
                 obj.commission_percentage = Decimal('0.00') # Reset commission to zero upon deactivation
                 messages.warning(request, f"Teacher '{obj.user.username}' has been deactivated.")
                 obj.save()
+                notify_teacher_deactivated(obj)
                 return
 
             # --- Handle General Save (if no specific button was pressed) ---
@@ -269,17 +355,17 @@ class ProfileAdmin(admin.ModelAdmin):
 
 # --- Remaining Admin Classes (KEEP AS IS) ---
 @admin.register(CourseCategory)
-class CourseCategoryAdmin(admin.ModelAdmin):
+class CourseCategoryAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
     list_display = ('name',)
     search_fields = ('name',)
 
 @admin.register(CourseLevel)
-class CourseLevelAdmin(admin.ModelAdmin):
+class CourseLevelAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
     list_display = ('name',)
     search_fields = ('name',)
 
 @admin.register(TeacherCourse)
-class TeacherCourseAdmin(admin.ModelAdmin):
+class TeacherCourseAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
     form = TeacherCourseForm
 
     list_display = (
@@ -292,6 +378,7 @@ class TeacherCourseAdmin(admin.ModelAdmin):
         'language',
         'featured',
         'status',
+        'enrollment_count',
         'created_at',
         'updated_at',
         
@@ -305,9 +392,8 @@ class TeacherCourseAdmin(admin.ModelAdmin):
         'created_at',
         'updated_at',
     )
+    # Title / description / category text goes through the full-text index (get_search_results)
     search_fields = (
-        'title',
-        'description',
         'teacher_profile__user__username',
         'language',
     )
@@ -344,7 +430,7 @@ class TeacherCourseAdmin(admin.ModelAdmin):
 
     def teacher_profile_link(self, obj):
         link = reverse("admin:%s_%s_change" % (obj.teacher_profile._meta.app_label, obj.teacher_profile._meta.model_name), args=[obj.teacher_profile.id])
-        return format_html('<a href="%s">%s</a>' % (link, obj.teacher_profile.user.username))
+        return format_html('<a href="{}">{}</a>', link, obj.teacher_profile.user.username)
     teacher_profile_link.short_description = 'Teacher'
     teacher_profile_link.admin_order_field = 'teacher_profile__user__username'
 
@@ -352,33 +438,54 @@ class TeacherCourseAdmin(admin.ModelAdmin):
         return ", ".join([category.name for category in obj.categories.all()])
     get_categories_display.short_description = 'Categories'
 
+    def get_queryset(self, request):
+        # Teacher link, level and categories columns: two queries per page instead of three per row
+        return (
+            super().get_queryset(request)
+            .select_related('teacher_profile__user', 'level')
+            .prefetch_related('categories')
+        )
+
+    def get_search_results(self, request, queryset, search_term):
+        field_matches, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if not search_term:
+            return field_matches, may_have_duplicates
+        # Full-text matches over courses of any status, within the active list filters
+        return field_matches | filter_matching_courses(queryset, search_term), may_have_duplicates
+
+    # update() skips auto_now, so every action moves updated_at itself: the course ETags
+    # and Last-Modified are built from it
     actions = ['mark_as_pending_review', 'mark_as_approved', 'mark_as_rejected', 'mark_as_published']
 
     def mark_as_pending_review(self, request, queryset):
-        queryset.update(status='pending')
+        queryset.update(status='pending', updated_at=timezone.now())
+        invalidate_catalog() # update() bypasses the post_save signal
         self.message_user(request, "Selected courses marked as 'Pending Review'.")
     mark_as_pending_review.short_description = "Mark selected as Pending Review"
 
     def mark_as_approved(self, request, queryset):
-        queryset.update(status='approved')
+        queryset.update(status='approved', updated_at=timezone.now())
+        invalidate_catalog() # update() bypasses the post_save signal
         self.message_user(request, "Selected courses marked as 'Approved'.")
     mark_as_approved.short_description = "Mark selected as Approved"
 
     def mark_as_rejected(self, request, queryset):
-        queryset.update(status='rejected')
+        queryset.update(status='rejected', updated_at=timezone.now())
+        invalidate_catalog() # update() bypasses the post_save signal
         self.message_user(request, "Selected courses marked as 'Rejected'.")
     mark_as_rejected.short_description = "Mark selected as Rejected"
 
     def mark_as_published(self, request, queryset):
-        updated_count = queryset.filter(status__in=['approved', 'pending']).update(status='published')
+        updated_count = queryset.filter(status__in=['approved', 'pending']).update(status='published', updated_at=timezone.now())
         if updated_count > 0:
+            invalidate_catalog() # update() bypasses the post_save signal
             self.message_user(request, f"{updated_count} course(s) successfully marked as 'Published'.")
         else:
             self.message_user(request, "No eligible courses selected for publishing (must be Approved or Pending).", level='warning')
     mark_as_published.short_description = "Mark selected as Published (Available to Customers)"
 
 @admin.register(EnrolledCourse)
-class EnrolledCourseAdmin(admin.ModelAdmin):
+class EnrolledCourseAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
     list_display = ('student_username', 'course_title', 'enrolled_at')
     list_filter = ('enrolled_at', 'course__level', 'course__categories')
     search_fields = ('student__user__username', 'course__title')
@@ -394,17 +501,72 @@ class EnrolledCourseAdmin(admin.ModelAdmin):
     course_title.short_description = 'Course Title'
     course_title.admin_order_field = 'course__title'
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('student__user', 'course')
+
+    # Enrollments edited here go through the revenue ledger and course totals like checkout;
+    # deletes are covered by the post_delete signal (accounts.signals)
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            previous = EnrolledCourse.objects.get(pk=obj.pk) if change else None
+            super().save_model(request, obj, form, change)
+            if previous is not None:
+                record_unenrollment(previous)
+            record_enrollment(obj)
+
+
+@admin.register(CourseRevenueSnapshot)
+class CourseRevenueSnapshotAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
+    list_display = ('course', 'date', 'enrollment_count', 'revenue', 'updated_at')
+    list_filter = ('date',)
+    search_fields = ('course__title',)
+    raw_id_fields = ('course',)
+    date_hierarchy = 'date'
+    # The ledger is maintained by accounts.ledger and the rebuild_revenue_ledger command
+    readonly_fields = ('course', 'date', 'enrollment_count', 'revenue', 'updated_at')
+
+
+@admin.register(CourseRanking)
+class CourseRankingAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
+    list_display = ('course', 'score', 'recent_enrollments', 'window_enrollments', 'computed_at')
+    list_select_related = ('course__teacher_profile__user',)
+    readonly_fields = ('course', 'score', 'recent_enrollments', 'window_enrollments', 'computed_at')
+
+    def has_add_permission(self, request):
+        return False # Rows are written by `manage.py refresh_course_rankings`
+
 
 @admin.register(AllowedCard)
-class AllowedCardAdmin(admin.ModelAdmin):
-    list_display = ('card_number', 'expiry_month', 'expiry_year', 'added_at')
-    search_fields = ('card_number',)
+class AllowedCardAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
+    form = AllowedCardForm
+    list_display = ('__str__', 'expiry_month', 'expiry_year', 'added_at')
+    search_fields = ('card_last4',)
     list_filter = ('expiry_year',)
 
+    def get_search_results(self, request, queryset, search_term):
+        # A full card number is matched through its fingerprint (unique index), not stored digits
+        card_number = normalize_card_number(search_term)
+        if len(card_number) > 4 and card_number.isdigit():
+            return queryset.filter(card_fingerprint=card_fingerprint(card_number)), False
+        return super().get_search_results(request, queryset, search_term)
+
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
     list_display = ('name', 'email', 'phone_number', 'submitted_at')
     search_fields = ('name', 'email', 'message')
     list_filter = ('submitted_at',)
     readonly_fields = ('name', 'email', 'phone_number', 'message', 'submitted_at')
-    date_hierarchy = 'submitted_at'
\ No newline at end of file
+    date_hierarchy = 'submitted_at'
+
+
+@admin.register(Job)
+class JobAdmin(ApproximateCountAdminMixin, admin.ModelAdmin):
+    list_display = ('id', 'name', 'status', 'attempts', 'max_attempts', 'run_after', 'created_at')
+    list_filter = ('status', 'name')
+    readonly_fields = ('name', 'payload', 'attempts', 'locked_by', 'locked_at', 'last_error', 'created_at')
+    actions = ['retry_failed_jobs']
+
+    def retry_failed_jobs(self, request, queryset):
+        count = retry_jobs(queryset)
+        self.message_user(request, f"{count} failed job(s) queued again.", messages.SUCCESS)
+    retry_failed_jobs.short_description = "Retry selected failed jobs"
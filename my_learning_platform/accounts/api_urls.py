@@ -1,6 +1,7 @@
 # auth_system/accounts/api_urls.py (Corrected)
 
 from django.urls import path
+from . import async_views
 from .api_views import ( # Renamed from api_views to views for clarity, but use your actual file name
     LoginAPIView,
     LogoutAPIView,
@@ -10,12 +11,19 @@ from .api_views import ( # Renamed from api_views to views for clarity, but use
     StudentRegisterAPIView, # <-- Make sure this is also imported if you have it
     TeacherCourseListCreateAPIView,
     TeacherCourseDetailAPIView,
+    TeacherCourseBulkAPIView,
+    CourseSearchAPIView,
+    CatalogAPIView,
+    CatalogCourseDetailAPIView,
     CourseCategoryListAPIView,
     CourseLevelListAPIView,
     MyEnrolledCoursesListAPIView,
     TeacherApplicationListAPIView,
     TeacherApplicationApproveRejectAPIView,
+    TeacherApplicationBulkStatusAPIView,
     TeacherCourseReportAPIView,
+    TeacherCourseSummaryAPIView,
+    CatalogCacheStatsAPIView,
 )
 
 urlpatterns = [
@@ -34,6 +42,18 @@ urlpatterns = [
     # Teacher Course Management
     path('courses/', TeacherCourseListCreateAPIView.as_view(), name='api_teacher_course_list_create'),
     path('courses/<int:pk>/', TeacherCourseDetailAPIView.as_view(), name='api_teacher_course_detail'),
+    path('courses/bulk/', TeacherCourseBulkAPIView.as_view(), name='api_teacher_course_bulk'),
+
+    # Public Course Search
+    path('courses/search/', CourseSearchAPIView.as_view(), name='api_course_search'),
+    path('catalog/', CatalogAPIView.as_view(), name='api_catalog'),
+    path('catalog/<int:pk>/', CatalogCourseDetailAPIView.as_view(), name='api_catalog_detail'),
+
+    # Async (ASGI) read-only variants
+    path('async/categories/', async_views.course_category_list, name='api_async_course_categories'),
+    path('async/levels/', async_views.course_level_list, name='api_async_course_levels'),
+    path('async/catalog/', async_views.catalog_course_list, name='api_async_catalog'),
+    path('async/catalog/<int:pk>/', async_views.catalog_course_detail, name='api_async_catalog_detail'),
 
     # Public Course Data (Categories & Levels)
     path('categories/', CourseCategoryListAPIView.as_view(), name='api_course_categories'),
@@ -44,6 +64,11 @@ urlpatterns = [
 
     # Admin - Teacher Application Workflow
     path('admin/teacher-applications/', TeacherApplicationListAPIView.as_view(), name='api_admin_teacher_applications'),
+    path('admin/teacher-applications/bulk-status/', TeacherApplicationBulkStatusAPIView.as_view(), name='api_admin_teacher_application_bulk_status'),
     path('admin/teacher-applications/<int:pk>/status/', TeacherApplicationApproveRejectAPIView.as_view(), name='api_admin_teacher_application_status'),
     path('teachers/<int:pk>/courses/', TeacherCourseReportAPIView.as_view(), name='api_teacher_course_report'),
+    path('teachers/<int:pk>/reports/summary/', TeacherCourseSummaryAPIView.as_view(), name='api_teacher_course_summary'),
+
+    # Admin - Cache Monitoring
+    path('admin/catalog/cache-stats/', CatalogCacheStatsAPIView.as_view(), name='api_admin_catalog_cache_stats'),
 ]
\ No newline at end of file
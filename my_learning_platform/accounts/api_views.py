@@ -1,12 +1,17 @@
+import csv
+import io
 import logging
 from django.contrib.auth import authenticate, login, logout, get_user_model
 from django.db import IntegrityError
-from django.db.models import Q # For OR conditions in lookups
+from django.db.models import Q, Count, Max # For OR conditions in lookups / conditional GET validators
+from django.http import StreamingHttpResponse
 from django.utils import timezone # For approval/rejection dates
 
 from rest_framework import generics, status, permissions
+from rest_framework.parsers import JSONParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.authtoken.models import Token as AuthToken # Renamed to avoid conflict
 
 from .models import CustomUser, Profile, TeacherCourse, CourseCategory, CourseLevel, EnrolledCourse # Import all relevant models
@@ -21,6 +26,26 @@ from .serializers import (
     CourseCategorySerializer,    # For listing course categories
     CourseLevelSerializer,       # For listing course levels
     EnrolledCourseSerializer,    # For student's enrolled courses
+    CourseSummarySerializer,     # For per-course teacher report rows
+    CatalogFilterSerializer,     # For catalog facet query parameters
+    TeacherApplicationBulkActionSerializer,  # For bulk approve / reject
+)
+from .reports import build_course_summary
+from .catalog import get_catalog_cache_stats
+from .mixins import SerializerQuerysetOptimizationMixin, ConditionalGetMixin, optimize_queryset_for_serializer
+from .search import search_course_ids
+from .notifications import notify_teacher_application_approved, notify_teacher_application_rejected
+from .applications import approve_teacher_applications, reject_teacher_applications
+from .facets import FacetSelection, catalog_queryset, filter_catalog, get_facet_counts
+from .course_io import (
+    CourseImportError, detect_format, export_course_rows, import_courses, iter_course_rows,
+    iter_courses_csv, iter_courses_jsonl,
+)
+from .pagination import (
+    TeacherCourseCursorPagination,
+    EnrolledCourseCursorPagination,
+    ProfileCursorPagination,
+    CourseSearchPagination,
 )
 
 # Initialize logger for this module
@@ -125,19 +150,9 @@ class LoginAPIView(APIView):
         username_or_email = serializer.validated_data['username_or_email']
         password = serializer.validated_data['password']
 
-        user = None
-        # Try to authenticate by username first
+        # One lookup by username or email, one password hash (accounts.backends.UsernameOrEmailBackend)
         user = authenticate(request, username=username_or_email, password=password)
 
-        if user is None:
-            # If not found by username, try by email
-            try:
-                # Case-insensitive email lookup
-                user_by_email = User.objects.get(email__iexact=username_or_email)
-                user = authenticate(request, username=user_by_email.username, password=password)
-            except User.DoesNotExist:
-                pass # user remains None if not found by email either
-
         if user is not None:
             # User is valid, log them in and get/create token
             login(request, user) # This sets the session, useful if SessionAuthentication is also used
@@ -242,13 +257,15 @@ class DeleteUserByEmailAPIView(APIView):
 
 
 # --- Teacher Course Management Views ---
-class TeacherCourseListCreateAPIView(generics.ListCreateAPIView):
+class TeacherCourseListCreateAPIView(ConditionalGetMixin, SerializerQuerysetOptimizationMixin, generics.ListCreateAPIView):
     """
     API endpoint for teachers to list their own courses and create new ones.
     Admins can list all courses.
+    GET supports If-None-Match: the ETag covers the course count and latest updated_at.
     """
     serializer_class = TeacherCourseSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = TeacherCourseCursorPagination
 
     def get_queryset(self):
         # Teachers see only their own courses
@@ -260,6 +277,11 @@ class TeacherCourseListCreateAPIView(generics.ListCreateAPIView):
         # Other user types (e.g., students) see no courses here
         return TeacherCourse.objects.none()
 
+    def get_etag_parts(self):
+        # COUNT catches deletions, MAX(updated_at) catches edits and additions
+        validators = self.get_queryset().aggregate(count=Count('id'), last_updated=Max('updated_at'))
+        return (validators['count'], validators['last_updated'])
+
     def perform_create(self, serializer):
         # Ensure only teachers can create courses and link to their profile
         if self.request.user.user_type == 'teacher':
@@ -270,24 +292,36 @@ class TeacherCourseListCreateAPIView(generics.ListCreateAPIView):
             raise permissions.PermissionDenied("Only teachers can create courses.")
 
 
-class TeacherCourseDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
+class TeacherCourseDetailAPIView(ConditionalGetMixin, SerializerQuerysetOptimizationMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API endpoint for teachers to retrieve, update, or delete their specific courses.
     Admins can also perform these actions on any course.
+    GET sends ETag / Last-Modified from the course's updated_at and honours conditional requests.
     """
     serializer_class = TeacherCourseSerializer
     permission_classes = [permissions.IsAuthenticated]
-    queryset = TeacherCourse.objects.all() # Start with all, then filter in get_object
+    queryset = TeacherCourse.objects.select_related('teacher_profile__user') # Owner is checked in get_object
 
     def get_object(self):
+        # Memoized: the conditional GET validators and retrieve() share one lookup
+        if getattr(self, '_course', None) is not None:
+            return self._course
+
         obj = super().get_object() # Get the course object based on PK from URL
 
         # Ensure user can only access/update/delete their own courses or if they are an admin
         if obj.teacher_profile.user != self.request.user and self.request.user.user_type != 'admin':
             logger.warning(f"User '{self.request.user.username}' (ID: {self.request.user.id}) attempted unauthorized access to course '{obj.title}' (ID: {obj.id}).")
             raise permissions.PermissionDenied("You do not have permission to access this course.")
+        self._course = obj
         return obj
 
+    def get_etag_parts(self):
+        return (self.get_object().pk, self.get_object().updated_at.isoformat())
+
+    def get_last_modified(self):
+        return self.get_object().updated_at
+
     def perform_update(self, serializer):
         # Prevent non-admins from changing course status
         if 'status' in serializer.validated_data and self.request.user.user_type != 'admin':
@@ -307,6 +341,65 @@ class TeacherCourseDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
 
 
 # --- Public Course Data Views (Accessible to anyone) ---
+class CatalogAPIView(SerializerQuerysetOptimizationMixin, generics.ListAPIView):
+    """
+    API endpoint for browsing published courses by facet.
+    GET /api/catalog/?category=<id>&level=<id>&language=<code>&price=<range> (each repeatable).
+    Returns the matching courses (cursor-paginated) plus per-option counts for every facet.
+    """
+    serializer_class = TeacherCourseSerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = TeacherCourseCursorPagination
+
+    def get_selection(self):
+        if not hasattr(self, '_selection'):
+            filters = CatalogFilterSerializer(data=self.request.query_params)
+            filters.is_valid(raise_exception=True)
+            self._selection = FacetSelection(**filters.validated_data)
+        return self._selection
+
+    def get_queryset(self):
+        return filter_catalog(self.get_selection())
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.data['facets'] = get_facet_counts(self.get_selection())
+        return response
+
+
+class CatalogCourseDetailAPIView(SerializerQuerysetOptimizationMixin, generics.RetrieveAPIView):
+    """
+    API endpoint for a single published course.
+    GET /api/catalog/<pk>/
+    """
+    serializer_class = TeacherCourseSerializer
+    permission_classes = [permissions.AllowAny]
+
+    def get_queryset(self):
+        return catalog_queryset()
+
+
+class CourseSearchAPIView(generics.GenericAPIView):
+    """
+    API endpoint for full-text search over published courses (title, description, category names).
+    GET /api/courses/search/?q=<terms>&page=<n>; results are ordered by relevance.
+    """
+    serializer_class = TeacherCourseSerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = CourseSearchPagination
+
+    def get(self, request, *args, **kwargs):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"detail": "A search query ('q') is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Rank and paginate ids only, then load full rows for the requested page
+        page_ids = self.paginate_queryset(search_course_ids(query))
+        courses = optimize_queryset_for_serializer(TeacherCourse.objects.all(), self.serializer_class).in_bulk(page_ids)
+        serializer = self.get_serializer([courses[course_id] for course_id in page_ids if course_id in courses], many=True)
+        return self.get_paginated_response(serializer.data)
+
+
 class CourseCategoryListAPIView(generics.ListAPIView):
     """
     API endpoint to list all available course categories.
@@ -327,12 +420,13 @@ class CourseLevelListAPIView(generics.ListAPIView):
 
 
 # --- Student Enrolled Courses View ---
-class MyEnrolledCoursesListAPIView(generics.ListAPIView):
+class MyEnrolledCoursesListAPIView(SerializerQuerysetOptimizationMixin, generics.ListAPIView):
     """
     API endpoint for students to view the courses they are enrolled in.
     """
     serializer_class = EnrolledCourseSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = EnrolledCourseCursorPagination
 
     def get_queryset(self):
         # Students should only see their own enrolled courses
@@ -345,12 +439,13 @@ class MyEnrolledCoursesListAPIView(generics.ListAPIView):
 
 
 # --- Admin Views for Teacher Application Approval Workflow ---
-class TeacherApplicationListAPIView(generics.ListAPIView):
+class TeacherApplicationListAPIView(SerializerQuerysetOptimizationMixin, generics.ListAPIView):
     """
     API endpoint for administrators to list teacher applications that are pending approval.
     """
     serializer_class = ProfileSerializer # Use ProfileSerializer to display application details
     permission_classes = [permissions.IsAdminUser] # Only admins can view this list
+    pagination_class = ProfileCursorPagination
 
     def get_queryset(self):
         logger.info(f"Admin '{self.request.user.username}' fetching pending teacher applications.")
@@ -361,7 +456,7 @@ class TeacherApplicationListAPIView(generics.ListAPIView):
         )
 
 
-class TeacherApplicationApproveRejectAPIView(generics.UpdateAPIView):
+class TeacherApplicationApproveRejectAPIView(SerializerQuerysetOptimizationMixin, generics.UpdateAPIView):
     """
     API endpoint for administrators to approve or reject a specific teacher application.
     Expected data: {"action": "approve"} or {"action": "reject", "rejection_reason": "..."}
@@ -389,6 +484,7 @@ class TeacherApplicationApproveRejectAPIView(generics.UpdateAPIView):
             profile.rejection_date = None
             profile.rejection_reason = None
             profile.save()
+            notify_teacher_application_approved(profile)
             logger.info(f"Teacher '{profile.user.username}' (ID: {profile.user.id}) application APPROVED by admin '{request.user.username}'.")
             return Response({"message": "Teacher application approved successfully."}, status=status.HTTP_200_OK)
 
@@ -409,17 +505,49 @@ class TeacherApplicationApproveRejectAPIView(generics.UpdateAPIView):
             profile.approved_by = None
             profile.approval_date = None
             profile.save()
+            notify_teacher_application_rejected(profile)
             logger.info(f"Teacher '{profile.user.username}' (ID: {profile.user.id}) application REJECTED by admin '{request.user.username}'. Reason: '{reason}'")
             return Response({"message": "Teacher application rejected successfully."}, status=status.HTTP_200_OK)
         else:
             return Response({"detail": "Invalid action. Must be 'approve' or 'reject'."}, status=status.HTTP_400_BAD_REQUEST)
-class TeacherCourseReportAPIView(generics.ListAPIView):
+
+
+class TeacherApplicationBulkStatusAPIView(APIView):
+    """
+    API endpoint for administrators to approve or reject many teacher applications at once.
+    Expected data: {"action": "approve", "ids": [1, 2], "commission_percentage": "10.00"}
+                or {"action": "reject", "ids": [3], "rejection_reason": "..."}
+    Runs in one transaction and answers with the outcome per profile id; the
+    notification emails are sent by the background worker.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = TeacherApplicationBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        if data['action'] == 'approve':
+            results = approve_teacher_applications(
+                data['ids'], request.user, commission_percentage=data.get('commission_percentage')
+            )
+        else:
+            results = reject_teacher_applications(data['ids'], request.user, data['rejection_reason'].strip())
+
+        return Response(
+            {"results": [{"id": profile_id, "result": result} for profile_id, result in results.items()]},
+            status=status.HTTP_200_OK,
+        )
+
+
+class TeacherCourseReportAPIView(SerializerQuerysetOptimizationMixin, generics.ListAPIView):
     """
     API endpoint to retrieve all courses for a specific teacher (by profile ID).
     Accessible by admins and the teacher themselves.
     """
     serializer_class = TeacherCourseSerializer
     permission_classes = [permissions.IsAuthenticated] # Requires authentication
+    pagination_class = TeacherCourseCursorPagination
 
     def get_queryset(self):
         teacher_profile_id = self.kwargs['pk'] # Get the teacher's profile ID from the URL
@@ -440,3 +568,109 @@ class TeacherCourseReportAPIView(generics.ListAPIView):
         else:
             logger.warning(f"User '{self.request.user.username}' (ID: {self.request.user.id}) attempted unauthorized access to teacher report for profile ID: {teacher_profile_id}.")
             raise permissions.PermissionDenied("You do not have permission to access this teacher's report.")
+
+
+class TeacherCourseSummaryAPIView(APIView):
+    """
+    API endpoint returning the per-course summary report (students, fees, commission, profit)
+    for a specific teacher (by profile ID). Same data as the teacher reports page.
+    Accessible by admins and the teacher themselves.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk, *args, **kwargs):
+        try:
+            teacher_profile = Profile.objects.get(id=pk, user__user_type='teacher')
+        except Profile.DoesNotExist:
+            logger.warning(f"Teacher profile with ID {pk} not found or is not a teacher.")
+            return Response({"detail": "Teacher profile not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        if request.user.user_type != 'admin' and request.user.profile != teacher_profile:
+            logger.warning(f"User '{request.user.username}' (ID: {request.user.id}) attempted unauthorized access to summary report for profile ID: {pk}.")
+            raise PermissionDenied("You do not have permission to access this teacher's report.")
+
+        report_data = build_course_summary(teacher_profile)
+        serializer = CourseSummarySerializer(report_data, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+# --- Bulk Course Import / Export ---
+class TeacherCourseBulkAPIView(APIView):
+    """
+    API endpoint for importing and exporting courses in bulk (see accounts.course_io).
+    POST: a JSON list of course rows, or a CSV / JSONL upload in the 'file' field.
+          Teachers import into their own profile as draft / pending, unfeatured courses;
+          admins give each row's teacher username. All or nothing: any invalid row -> 400.
+    GET:  streams the caller's courses (admins: all) as CSV, or JSONL with ?output=jsonl.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [JSONParser, MultiPartParser]
+
+    def get_import_options(self, request):
+        if request.user.user_type == 'teacher':
+            return {
+                'teacher_profile': request.user.profile,
+                'allowed_statuses': {'draft', 'pending'},
+                'allow_featured': False,
+            }
+        if request.user.user_type == 'admin':
+            return {}
+        raise PermissionDenied("Only teachers and admins can import courses.")
+
+    def post(self, request, *args, **kwargs):
+        options = self.get_import_options(request)
+
+        upload = request.FILES.get('file')
+        if upload:
+            stream = io.TextIOWrapper(upload.file, encoding='utf-8', newline='')
+            rows = iter_course_rows(stream, detect_format(upload.name))
+        elif isinstance(request.data, list):
+            rows = enumerate(request.data, start=1)
+        else:
+            return Response(
+                {"detail": "Send a JSON list of courses or upload a CSV / JSONL 'file'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            created = import_courses(
+                ((line, row if isinstance(row, dict) else {'_error': "expected an object"}) for line, row in rows),
+                **options,
+            )
+        except CourseImportError as e:
+            return Response({"detail": str(e), "errors": e.errors}, status=status.HTTP_400_BAD_REQUEST)
+        except UnicodeDecodeError:
+            return Response({"detail": "The file must be UTF-8 encoded."}, status=status.HTTP_400_BAD_REQUEST)
+        except csv.Error as e:
+            return Response({"detail": f"Malformed CSV file: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        logger.info(f"User '{request.user.username}' bulk-imported {created} course(s).")
+        return Response({"created": created}, status=status.HTTP_201_CREATED)
+
+    def get(self, request, *args, **kwargs):
+        if request.user.user_type == 'teacher':
+            courses = TeacherCourse.objects.filter(teacher_profile=request.user.profile)
+        elif request.user.user_type == 'admin':
+            courses = TeacherCourse.objects.all()
+        else:
+            raise PermissionDenied("Only teachers and admins can export courses.")
+
+        if request.query_params.get('output') == 'jsonl':
+            content, content_type, extension = iter_courses_jsonl, 'application/x-ndjson', 'jsonl'
+        else:
+            content, content_type, extension = iter_courses_csv, 'text/csv', 'csv'
+        response = StreamingHttpResponse(content(export_course_rows(courses)), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="courses.{extension}"'
+        return response
+
+
+# --- Admin Cache Monitoring ---
+class CatalogCacheStatsAPIView(APIView):
+    """
+    API endpoint for administrators exposing the course catalog cache counters
+    (hits, misses, hit ratio and current cache version).
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_catalog_cache_stats(), status=status.HTTP_200_OK)
@@ -0,0 +1,123 @@
+# auth_system/accounts/applications.py
+
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from .authentication import invalidate_cached_credentials_for_users
+from .models import Profile
+from .notifications import notify_teacher_applications_approved, notify_teacher_applications_rejected
+
+logger = logging.getLogger(__name__)
+
+# Per-id outcomes returned by the bulk functions
+APPROVED = 'approved'
+REJECTED = 'rejected'
+ALREADY_APPROVED = 'already_approved'
+NOT_PENDING = 'not_pending'
+NOT_FOUND = 'not_found'
+
+BULK_APPLICATION_LIMIT = 1000
+
+
+# --- Bulk Teacher Application Decisions ---
+def _teacher_profiles(profile_ids):
+    # Locked for the transaction so two admins cannot decide the same application at once
+    return {
+        profile.id: profile
+        for profile in Profile.objects.select_for_update(of=('self',))
+        .filter(id__in=profile_ids, user__user_type='teacher')
+        .select_related('user')
+    }
+
+
+def _apply(profiles, changes):
+    """
+    Writes the same decision to every profile with a single UPDATE of just the
+    decision fields, mirrors it on the loaded instances, then (after commit)
+    refreshes their cached credentials and queues the notification emails.
+    """
+    Profile.objects.filter(id__in=[profile.id for profile in profiles]).update(**changes)
+    for profile in profiles:
+        for field, value in changes.items():
+            setattr(profile, field, value)
+
+    # QuerySet.update() sends no post_save, which normally drops these cache entries
+    user_ids = [profile.user_id for profile in profiles]
+    transaction.on_commit(lambda: invalidate_cached_credentials_for_users(user_ids))
+
+
+@transaction.atomic
+def approve_teacher_applications(profile_ids, admin_user, commission_percentage=None):
+    """
+    Approves the pending applications among profile_ids in one transaction.
+    Returns {profile_id: outcome} for every requested id.
+    """
+    profile_ids = list(dict.fromkeys(profile_ids))
+    profiles = _teacher_profiles(profile_ids)
+
+    results, approved = {}, []
+    for profile_id in profile_ids:
+        profile = profiles.get(profile_id)
+        if profile is None:
+            results[profile_id] = NOT_FOUND
+        elif profile.is_teacher_approved:
+            results[profile_id] = ALREADY_APPROVED
+        elif not profile.is_teacher_application_pending:
+            results[profile_id] = NOT_PENDING
+        else:
+            results[profile_id] = APPROVED
+            approved.append(profile)
+
+    if approved:
+        changes = {
+            'is_teacher_application_pending': False,
+            'is_teacher_approved': True,
+            'approved_by': admin_user,
+            'approval_date': timezone.now(),
+            'rejected_by': None,
+            'rejection_date': None,
+            'rejection_reason': None,
+        }
+        if commission_percentage is not None:
+            changes['commission_percentage'] = commission_percentage
+        _apply(approved, changes)
+        notify_teacher_applications_approved(approved)
+        logger.info(f"{len(approved)} teacher application(s) APPROVED in bulk by admin '{admin_user.username}'.")
+    return results
+
+
+@transaction.atomic
+def reject_teacher_applications(profile_ids, admin_user, reason):
+    """
+    Rejects the applications among profile_ids that are not approved (approved teachers
+    must be deactivated instead). Returns {profile_id: outcome} for every requested id.
+    """
+    profile_ids = list(dict.fromkeys(profile_ids))
+    profiles = _teacher_profiles(profile_ids)
+
+    results, rejected = {}, []
+    for profile_id in profile_ids:
+        profile = profiles.get(profile_id)
+        if profile is None:
+            results[profile_id] = NOT_FOUND
+        elif profile.is_teacher_approved:
+            results[profile_id] = ALREADY_APPROVED
+        else:
+            results[profile_id] = REJECTED
+            rejected.append(profile)
+
+    if rejected:
+        _apply(rejected, {
+            'is_teacher_application_pending': False,
+            'is_teacher_approved': False,
+            'rejected_by': admin_user,
+            'rejection_date': timezone.now(),
+            'rejection_reason': reason,
+            'approved_by': None,
+            'approval_date': None,
+        })
+        notify_teacher_applications_rejected(rejected)
+        logger.info(f"{len(rejected)} teacher application(s) REJECTED in bulk by admin '{admin_user.username}'. Reason: '{reason}'")
+    return results
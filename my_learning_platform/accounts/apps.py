@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        from . import signals  # noqa: F401 (registers signal handlers)
+        from . import notifications  # noqa: F401 (registers background job handlers)
+        from . import checks  # noqa: F401 (registers system checks)
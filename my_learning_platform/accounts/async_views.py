@@ -0,0 +1,80 @@
+# auth_system/accounts/async_views.py
+#
+# Async (ASGI) variants of the public read-only API endpoints, using Django's async ORM.
+# DRF's APIView cannot run async handlers, so these are plain Django async views that
+# reuse the DRF serializers for identical payloads. Only served concurrently when the
+# app runs under ASGI (see gunicorn.conf.py); under WSGI they still work, one at a time.
+
+import logging
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+
+from .facets import FacetSelection, catalog_queryset, filter_catalog, get_facet_counts
+from .mixins import optimize_queryset_for_serializer
+from .models import CourseCategory, CourseLevel, TeacherCourse
+from .pagination import TeacherCourseCursorPagination
+from .serializers import (
+    CatalogFilterSerializer,
+    CourseCategorySerializer,
+    CourseLevelSerializer,
+    TeacherCourseSerializer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# --- Course Categories & Levels ---
+@require_GET
+async def course_category_list(request):
+    categories = [category async for category in CourseCategory.objects.all()]
+    return JsonResponse(CourseCategorySerializer(categories, many=True).data, safe=False)
+
+
+@require_GET
+async def course_level_list(request):
+    levels = [level async for level in CourseLevel.objects.all()]
+    return JsonResponse(CourseLevelSerializer(levels, many=True).data, safe=False)
+
+
+# --- Published Course Catalog ---
+# Same filters, cursor pagination, facet counts and payloads as CatalogAPIView and
+# CatalogCourseDetailAPIView, so the sync / async pairs do the same work.
+@require_GET
+async def catalog_course_list(request):
+    """
+    Published courses by facet: ?category=<id>&level=<id>&language=<code>&price=<range>
+    (each repeatable), cursor-paginated newest first, plus per-option counts for every facet.
+    """
+    filters = CatalogFilterSerializer(data=request.GET)
+    if not filters.is_valid():
+        return JsonResponse(filters.errors, status=400)
+    selection = FacetSelection(**filters.validated_data)
+
+    # DRF's cursor paginator reads the cursor from a DRF request and fetches the page
+    # synchronously, so it runs on a worker thread like the async ORM would
+    paginator = TeacherCourseCursorPagination()
+    queryset = optimize_queryset_for_serializer(filter_catalog(selection), TeacherCourseSerializer)
+    try:
+        courses = await sync_to_async(paginator.paginate_queryset)(queryset, Request(request))
+    except NotFound as e:
+        return JsonResponse({'detail': e.detail}, status=404)
+
+    serializer = TeacherCourseSerializer(courses, many=True, context={'request': request})
+    data = paginator.get_paginated_response(serializer.data).data
+    data['facets'] = await sync_to_async(get_facet_counts)(selection)
+    return JsonResponse(data)
+
+
+@require_GET
+async def catalog_course_detail(request, pk):
+    queryset = optimize_queryset_for_serializer(catalog_queryset(), TeacherCourseSerializer)
+    try:
+        course = await queryset.aget(pk=pk)
+    except TeacherCourse.DoesNotExist:
+        return JsonResponse({'detail': 'Not found.'}, status=404)
+    serializer = TeacherCourseSerializer(course, context={'request': request})
+    return JsonResponse(serializer.data)
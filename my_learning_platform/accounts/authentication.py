@@ -0,0 +1,134 @@
+# auth_system/accounts/authentication.py
+
+import hashlib
+import logging
+import secrets
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import BasicAuthentication, TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+logger = logging.getLogger(__name__)
+
+AUTH_TOKEN_CACHE_TIMEOUT = getattr(settings, 'AUTH_TOKEN_CACHE_TIMEOUT', 300)
+BASIC_AUTH_CACHE_TIMEOUT = getattr(settings, 'BASIC_AUTH_CACHE_TIMEOUT', 60)
+
+
+def auth_cache_enabled():
+    return getattr(settings, 'AUTH_CACHE_ENABLED', True)
+
+
+def token_cache_key(key):
+    # The raw token is a credential; only its digest goes into the cache key
+    return 'auth:token:' + hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def invalidate_cached_token(key):
+    cache.delete(token_cache_key(key))
+
+
+def basic_credentials_cache_key(userid, password):
+    # Salted with SECRET_KEY: the cache never holds anything a password could be recovered from
+    digest = salted_hmac('accounts.authentication.basic', f'{userid}\x00{password}', algorithm='sha256')
+    return 'auth:basic:' + digest.hexdigest()
+
+
+def _credentials_version_key(user_id):
+    return f'auth:basic:version:{user_id}'
+
+
+def invalidate_cached_credentials_for_user(user_id):
+    """
+    Drops the cached token lookups of a user (after a user / profile change) and
+    retires their verified Basic credentials.
+    """
+    invalidate_cached_credentials_for_users([user_id])
+
+
+def invalidate_cached_credentials_for_users(user_ids):
+    """Same as invalidate_cached_credentials_for_user() for many users, with one token query."""
+    user_ids = list(user_ids)
+    keys = Token.objects.filter(user_id__in=user_ids).values_list('key', flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
+    # Basic entries are keyed by credential digests that cannot be enumerated per user,
+    # so they carry the user's credentials version and are rejected once it moves on
+    cache.set_many({_credentials_version_key(user_id): _new_credentials_version() for user_id in user_ids}, None)
+
+
+def _new_credentials_version():
+    # Random rather than a counter: a version key that was evicted and then recreated
+    # can never match the version of entries cached before the eviction
+    return secrets.token_hex(8)
+
+
+def _current_credentials_version(user_id):
+    """The user's credentials version, created (without expiry) on first use."""
+    key = _credentials_version_key(user_id)
+    cache.add(key, _new_credentials_version(), None)
+    return cache.get(key)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that caches the token -> user (with profile) lookup, so
+    steady-state API requests run no authentication queries and request.user.profile
+    is already loaded.
+
+    Cached entries expire after AUTH_TOKEN_CACHE_TIMEOUT seconds and are dropped when
+    the token is deleted (logout) or the user / profile is saved (e.g. deactivation),
+    see accounts.signals. With AUTH_CACHE_ENABLED off every request reads the token.
+    """
+
+    def authenticate_credentials(self, key):
+        use_cache = auth_cache_enabled()
+        cache_key = token_cache_key(key)
+        if use_cache:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            token = Token.objects.select_related('user__profile').get(key=key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        if use_cache:
+            cache.set(cache_key, (token.user, token), AUTH_TOKEN_CACHE_TIMEOUT)
+        return (token.user, token)
+
+
+class CachedBasicAuthentication(BasicAuthentication):
+    """
+    BasicAuthentication that remembers verified credentials for BASIC_AUTH_CACHE_TIMEOUT
+    seconds, so a client sending Basic credentials pays the password hash once per
+    TTL instead of on every request. Entries are keyed by an HMAC of username and
+    password; failed attempts are never cached. A user / profile save (password change,
+    deactivation, ...) retires the user's entries immediately.
+    Plain BasicAuthentication when AUTH_CACHE_ENABLED is off.
+    """
+
+    def authenticate_credentials(self, userid, password, request=None):
+        if not auth_cache_enabled():
+            return super().authenticate_credentials(userid, password, request)
+        cache_key = basic_credentials_cache_key(userid, password)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            user, version = cached
+            # A missing version key (evicted) is a miss: the password is verified again
+            if cache.get(_credentials_version_key(user.pk)) == version:
+                return (user, None)
+
+        user, auth = super().authenticate_credentials(userid, password, request)
+        # Load the profile now so it is part of the cached user
+        user = type(user).objects.select_related('profile').get(pk=user.pk)
+        version = _current_credentials_version(user.pk)
+        if version is not None:
+            cache.set(cache_key, (user, version), BASIC_AUTH_CACHE_TIMEOUT)
+        return (user, auth)
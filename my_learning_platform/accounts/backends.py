@@ -0,0 +1,61 @@
+# auth_system/accounts/backends.py
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+UserModel = get_user_model()
+
+
+def login_lookup_queryset(login):
+    """Users whose username is `login` or whose email equals it case-insensitively."""
+    return (
+        UserModel._default_manager.select_related('profile')
+        .annotate(email_lower=Lower('email'))
+        .filter(Q(username=login) | Q(email_lower=login.lower()))
+    )
+
+
+class UsernameOrEmailBackend(ModelBackend):
+    """
+    Authenticates with either the username or the email address (case-insensitive).
+
+    The account is resolved in one query, served by the username unique index and the
+    lower(email) functional index, and the password is hashed exactly once whether or
+    not an account matched (unknown logins still pay one hash, as ModelBackend does,
+    so response time does not reveal which accounts exist).
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        user = self.get_user_by_login(username)
+        if user is None:
+            UserModel().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_user_by_login(self, login):
+        """
+        Returns the user whose username is `login`, else the single user whose email
+        matches it case-insensitively, else None (also when the email is ambiguous).
+        """
+        candidates = list(login_lookup_queryset(login)[:3])
+        for candidate in candidates:
+            if candidate.username == login:
+                return candidate
+        return candidates[0] if len(candidates) == 1 else None
+
+    def get_user(self, user_id):
+        # The session user and their profile in one query (see accounts.middleware)
+        try:
+            user = UserModel._default_manager.select_related('profile').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -0,0 +1,104 @@
+# auth_system/accounts/benchmarking.py
+
+import asyncio
+import statistics
+import threading
+import time
+
+from django.db import connections
+
+
+# --- Load Generation Helpers (used by the benchmark_* management commands) ---
+def _timed_calls(func, count, durations, errors):
+    for _ in range(count):
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e: # Keep measuring; failures are reported in the summary
+            errors.append(e)
+        durations.append(time.perf_counter() - start)
+
+
+def run_concurrently(func, total, concurrency):
+    """
+    Calls func() `total` times spread over `concurrency` threads.
+    Returns (durations in seconds, wall time in seconds, errors).
+    With concurrency=1 everything runs in the calling thread (and its DB connection).
+    """
+    durations, errors = [], []
+    start = time.perf_counter()
+
+    if concurrency <= 1:
+        _timed_calls(func, total, durations, errors)
+        return durations, time.perf_counter() - start, errors
+
+    def worker(count):
+        try:
+            _timed_calls(func, count, durations, errors)
+        finally:
+            # Each thread opened its own database connections
+            connections.close_all()
+
+    share, remainder = divmod(total, concurrency)
+    threads = [
+        threading.Thread(target=worker, args=(share + (1 if i < remainder else 0),))
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return durations, time.perf_counter() - start, errors
+
+
+async def run_concurrently_async(coroutine_function, total, concurrency):
+    """
+    Awaits coroutine_function() `total` times with at most `concurrency` in flight
+    on the running event loop. Returns (durations in seconds, wall time in seconds, errors).
+    """
+    durations, errors = [], []
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def timed_call():
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await coroutine_function()
+            except Exception as e: # Keep measuring; failures are reported in the summary
+                errors.append(e)
+            durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed_call() for _ in range(total)))
+    return durations, time.perf_counter() - start, errors
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize(durations, wall_time, errors=()):
+    """Mean / median / p95 / p99 latency in milliseconds and throughput in calls per second."""
+    if not durations:
+        return {
+            'calls': 0, 'errors': len(errors), 'mean_ms': 0.0,
+            'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'per_second': 0.0,
+        }
+    ordered = sorted(durations)
+    return {
+        'calls': len(durations),
+        'errors': len(errors),
+        'mean_ms': round(statistics.mean(ordered) * 1000, 3),
+        'p50_ms': round(statistics.median(ordered) * 1000, 3),
+        'p95_ms': round(_percentile(ordered, 0.95) * 1000, 3),
+        'p99_ms': round(_percentile(ordered, 0.99) * 1000, 3),
+        'per_second': round(len(durations) / wall_time, 1) if wall_time else 0.0,
+    }
+
+
+def format_summary(label, summary):
+    return (
+        f"{label:<32} {summary['calls']:>6} calls  mean {summary['mean_ms']:>9.3f} ms  "
+        f"p50 {summary['p50_ms']:>9.3f} ms  p95 {summary['p95_ms']:>9.3f} ms  "
+        f"p99 {summary['p99_ms']:>9.3f} ms  {summary['per_second']:>9.1f}/s  errors {summary['errors']}"
+    )
@@ -0,0 +1,113 @@
+# auth_system/accounts/catalog.py
+
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import TeacherCourse
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CACHE_TIMEOUT = getattr(settings, 'CATALOG_CACHE_TIMEOUT', 300)
+
+# Every cached catalog entry is keyed under the current version number; invalidation just
+# bumps the version, so all variants (course list, featured list, ...) expire at once.
+CATALOG_VERSION_KEY = 'catalog:version'
+CATALOG_HITS_KEY = 'catalog:stats:hits'
+CATALOG_MISSES_KEY = 'catalog:stats:misses'
+
+
+def catalog_cache_enabled():
+    return getattr(settings, 'CATALOG_CACHE_ENABLED', True)
+
+
+# --- Versioning / Invalidation ---
+def get_catalog_version():
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, 1, None)
+        version = cache.get(CATALOG_VERSION_KEY, 1)
+    return version
+
+
+def invalidate_catalog():
+    """
+    Drops every cached catalog entry. Called from signal handlers on course changes and
+    explicitly after bulk QuerySet.update() calls, which do not send signals.
+    """
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        # No version stored yet (or it was evicted): nothing cached under it either
+        cache.set(CATALOG_VERSION_KEY, 1, None)
+    logger.debug("Course catalog cache invalidated.")
+
+
+# --- Hit / Miss Counters ---
+def _increment_counter(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+
+def get_catalog_cache_stats():
+    hits = cache.get(CATALOG_HITS_KEY, 0)
+    misses = cache.get(CATALOG_MISSES_KEY, 0)
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / lookups, 4) if lookups else None,
+        'version': get_catalog_version(),
+    }
+
+
+def reset_catalog_cache_stats():
+    cache.delete_many([CATALOG_HITS_KEY, CATALOG_MISSES_KEY])
+
+
+# --- Cached Lookups ---
+def get_cached_catalog_entry(name, build):
+    """
+    Returns the cached value stored under `name` for the current catalog version,
+    calling build() and caching its result on a miss. With CATALOG_CACHE_ENABLED off,
+    every call builds the value.
+    """
+    if not catalog_cache_enabled():
+        return build()
+
+    key = f'catalog:{get_catalog_version()}:{name}'
+    value = cache.get(key)
+    if value is not None:
+        _increment_counter(CATALOG_HITS_KEY)
+        return value
+
+    _increment_counter(CATALOG_MISSES_KEY)
+    value = build()
+    cache.set(key, value, CATALOG_CACHE_TIMEOUT)
+    return value
+
+
+def published_courses_queryset():
+    # Everything the catalog templates render is loaded up front, so the cached
+    # instances never need to go back to the database.
+    return (
+        TeacherCourse.objects.filter(status='published')
+        .select_related('teacher_profile__user', 'level')
+        .prefetch_related('categories')
+        .defer('search_vector')
+        .order_by('-created_at')
+    )
+
+
+def get_published_courses():
+    """All published courses, newest first (course list page)."""
+    return get_cached_catalog_entry('published', lambda: list(published_courses_queryset()))
+
+
+def get_featured_courses():
+    """Published courses flagged as featured, newest first (homepage)."""
+    return get_cached_catalog_entry('featured', lambda: list(published_courses_queryset().filter(featured=True)))
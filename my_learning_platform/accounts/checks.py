@@ -0,0 +1,75 @@
+# auth_system/accounts/checks.py
+
+from django.conf import settings
+from django.core.checks import Error, Tags, Warning, register
+
+
+def _unshared_cache(setting):
+    """
+    Returns (backend, workers) when `setting` enables a cache that the workers cannot
+    share (a process-local backend under several workers), else None.
+    """
+    backend = settings.CACHES['default']['BACKEND']
+    workers = getattr(settings, 'WEB_CONCURRENCY', 1)
+    if (
+        getattr(settings, setting, True)
+        and backend in getattr(settings, 'PROCESS_LOCAL_CACHE_BACKENDS', ())
+        and workers > 1
+    ):
+        return backend, workers
+    return None
+
+
+def _unshared_cache_error(setting, id):
+    unshared = _unshared_cache(setting)
+    if unshared is None:
+        return []
+    backend, workers = unshared
+    return [Error(
+        f"{setting} is on with the process-local cache {backend} and {workers} workers.",
+        hint=f"Use a shared cache (Redis or Memcached) for CACHE_BACKEND, or set {setting}=False.",
+        id=id,
+    )]
+
+
+# --- Cached API Credentials ---
+@register(Tags.caches)
+def check_auth_cache_is_shared(app_configs, **kwargs):
+    """
+    Cached token / Basic lookups (accounts.authentication) are only revoked in the cache
+    of the worker that saw the logout or password change. A process-local cache under
+    several workers would let revoked credentials keep working on the others.
+    """
+    return _unshared_cache_error('AUTH_CACHE_ENABLED', 'accounts.E001')
+
+
+# --- Cached Catalog ---
+@register(Tags.caches)
+def check_catalog_cache_is_shared(app_configs, **kwargs):
+    """
+    The catalog version (accounts.catalog) is only bumped in the cache of the worker that
+    saw the course change; the others would keep serving their cached lists, facet counts
+    and trending courses.
+    """
+    return _unshared_cache_error('CATALOG_CACHE_ENABLED', 'accounts.E002')
+
+
+# --- Cached Ranking ---
+@register(Tags.caches)
+def check_ranking_cache_is_shared(app_configs, **kwargs):
+    """
+    refresh_course_rankings recaches the top course ids from its own process. In a
+    process-local cache that write is lost when the command exits, and the web workers
+    only pick up a new ranking when their copy expires (RANKING_CACHE_TIMEOUT).
+    """
+    backend = settings.CACHES['default']['BACKEND']
+    if getattr(settings, 'CATALOG_CACHE_ENABLED', True) and backend in getattr(settings, 'PROCESS_LOCAL_CACHE_BACKENDS', ()):
+        timeout = getattr(settings, 'RANKING_CACHE_TIMEOUT', 600)
+        return [Warning(
+            f"The trending course ranking is cached in the process-local cache {backend}: "
+            f"refresh_course_rankings cannot update it, and workers serve the previous ranking "
+            f"for up to {timeout}s after each refresh.",
+            hint="Use a shared cache (Redis or Memcached) for CACHE_BACKEND.",
+            id='accounts.W001',
+        )]
+    return []
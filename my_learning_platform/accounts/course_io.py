@@ -0,0 +1,329 @@
+# auth_system/accounts/course_io.py
+
+import csv
+import io
+import json
+import logging
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+
+from .catalog import invalidate_catalog
+from .models import CourseCategory, CourseLevel, Profile, TeacherCourse
+from .search import refresh_search_index
+
+logger = logging.getLogger(__name__)
+
+# Columns of the import / export format (CSV header or JSONL object keys). 'teacher' is the
+# teacher's username; 'level' and 'categories' are names, categories separated by '|' in CSV.
+COURSE_IO_FIELDS = (
+    'teacher', 'title', 'description', 'price', 'language', 'level', 'categories',
+    'status', 'featured', 'video_trailer_url',
+)
+CATEGORY_SEPARATOR = '|'
+COURSE_IO_BATCH_SIZE = 1000
+# Stop collecting row errors after this many; the import is rolled back either way
+MAX_REPORTED_ERRORS = 50
+
+LANGUAGES = {code for code, _ in TeacherCourse.LANGUAGE_CHOICES}
+STATUSES = {code for code, _ in TeacherCourse.STATUS_CHOICES}
+TRUE_VALUES = {'1', 'true', 'yes', 'y'}
+TITLE_MAX_LENGTH = TeacherCourse._meta.get_field('title').max_length
+CENTS = Decimal('0.01')
+# Resolved from the lookups loaded up front; full_clean() would query each one again
+FULL_CLEAN_EXCLUDE = ('teacher_profile', 'level')
+CourseCategories = TeacherCourse.categories.through
+
+
+class CourseImportError(Exception):
+    """Raised when rows fail validation; `errors` holds 'line N: message' strings."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(f"{len(errors)} invalid row(s); nothing was imported.")
+
+
+# --- Parsing (streaming) ---
+def detect_format(filename, default='csv'):
+    if filename and filename.lower().endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if filename and filename.lower().endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def iter_course_rows(stream, fmt='csv'):
+    """
+    Yields (line_number, row dict) from a text stream without reading it into memory.
+    CSV 'categories' cells are split on '|'; JSONL rows may give a list instead.
+    """
+    if fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_number, {'_error': f"invalid JSON ({e})"}
+                continue
+            yield line_number, row if isinstance(row, dict) else {'_error': "expected a JSON object"}
+    else:
+        # Line 1 is the header
+        for line_number, row in enumerate(csv.DictReader(stream), start=2):
+            yield line_number, row
+
+
+def _split_categories(value):
+    if isinstance(value, (list, tuple)):
+        names = value
+    else:
+        names = (value or '').split(CATEGORY_SEPARATOR)
+    return [str(name).strip() for name in names if str(name).strip()]
+
+
+# --- Import ---
+class _Lookups:
+    """Name -> id maps for teachers, levels and categories, loaded once per import."""
+
+    def __init__(self, create_categories):
+        self.create_categories = create_categories
+        self.levels = {name.lower(): pk for pk, name in CourseLevel.objects.values_list('id', 'name')}
+        self.categories = {name.lower(): pk for pk, name in CourseCategory.objects.values_list('id', 'name')}
+        self.teachers = {}
+
+    def load_teachers(self, usernames):
+        missing = {name for name in usernames if name and name not in self.teachers}
+        if missing:
+            self.teachers.update(
+                Profile.objects.filter(user__username__in=missing, user__user_type='teacher')
+                .values_list('user__username', 'id')
+            )
+
+    def create_missing_categories(self, names):
+        missing = {}
+        for name in names:
+            missing.setdefault(name.lower(), name)
+        for key in list(missing):
+            if key in self.categories:
+                del missing[key]
+        if missing and self.create_categories:
+            CourseCategory.objects.bulk_create(
+                [CourseCategory(name=name) for name in missing.values()], ignore_conflicts=True
+            )
+            self.categories.update(
+                (name.lower(), pk) for pk, name in
+                CourseCategory.objects.filter(name__in=missing.values()).values_list('id', 'name')
+            )
+
+
+def _build_course(row, lookups, teacher_profile_id, allowed_statuses, allow_featured):
+    """Returns (TeacherCourse, [category ids]) or raises ValueError with a message."""
+    if '_error' in row:
+        raise ValueError(row['_error'])
+
+    if teacher_profile_id is None:
+        username = (row.get('teacher') or '').strip()
+        teacher_profile_id = lookups.teachers.get(username)
+        if teacher_profile_id is None:
+            raise ValueError(f"unknown teacher '{username}'")
+
+    title = (row.get('title') or '').strip()
+    if not title:
+        raise ValueError("title is required")
+    if len(title) > TITLE_MAX_LENGTH:
+        raise ValueError("title is too long")
+
+    try:
+        price = Decimal(str(row.get('price') or '0')).quantize(CENTS)
+    except InvalidOperation:
+        raise ValueError(f"invalid price '{row.get('price')}'")
+    # NaN passes quantize() and would only fail at the comparison below
+    if not price.is_finite():
+        raise ValueError(f"invalid price '{row.get('price')}'")
+    if price < 0:
+        raise ValueError("price cannot be negative")
+
+    language = (row.get('language') or 'en').strip()
+    if language not in LANGUAGES:
+        raise ValueError(f"unknown language '{language}'")
+
+    status = (row.get('status') or 'draft').strip()
+    if status not in allowed_statuses:
+        raise ValueError(f"status '{status}' is not allowed")
+
+    level_id = None
+    level_name = (row.get('level') or '').strip()
+    if level_name:
+        level_id = lookups.levels.get(level_name.lower())
+        if level_id is None:
+            raise ValueError(f"unknown level '{level_name}'")
+
+    category_ids = []
+    for name in _split_categories(row.get('categories')):
+        category_id = lookups.categories.get(name.lower())
+        if category_id is None:
+            raise ValueError(f"unknown category '{name}'")
+        category_ids.append(category_id)
+
+    featured = False
+    if allow_featured:
+        featured = row.get('featured')
+        featured = featured if isinstance(featured, bool) else str(featured or '').strip().lower() in TRUE_VALUES
+
+    course = TeacherCourse(
+        teacher_profile_id=teacher_profile_id,
+        title=title,
+        description=row.get('description') or '',
+        price=price,
+        language=language,
+        level_id=level_id,
+        status=status,
+        featured=featured,
+        video_trailer_url=(row.get('video_trailer_url') or '').strip() or None,
+    )
+    # The model's own field validation (required fields, max_digits, URLs, ...), as a form would run it
+    try:
+        course.full_clean(exclude=FULL_CLEAN_EXCLUDE, validate_unique=False, validate_constraints=False)
+    except ValidationError as e:
+        raise ValueError('; '.join(
+            f"{field}: {' '.join(messages)}" for field, messages in e.message_dict.items()
+        ))
+    return course, list(dict.fromkeys(category_ids))
+
+
+def _insert_batch(courses_with_categories):
+    courses = [course for course, _ in courses_with_categories]
+    if connection.features.can_return_rows_from_bulk_insert:
+        TeacherCourse.objects.bulk_create(courses, batch_size=COURSE_IO_BATCH_SIZE)
+    else:
+        # Primary keys are needed for the category links
+        for course in courses:
+            course.save(force_insert=True)
+
+    CourseCategories.objects.bulk_create([
+        CourseCategories(teachercourse_id=course.id, coursecategory_id=category_id)
+        for course, category_ids in courses_with_categories
+        for category_id in category_ids
+    ], batch_size=COURSE_IO_BATCH_SIZE)
+    refresh_search_index([course.id for course in courses])
+    return courses
+
+
+@transaction.atomic
+def import_courses(rows, teacher_profile=None, allowed_statuses=STATUSES, allow_featured=True,
+                   create_categories=False, batch_size=COURSE_IO_BATCH_SIZE):
+    """
+    Bulk-creates courses from (line_number, row) pairs (see iter_course_rows): a bulk
+    INSERT per batch for the courses and another for their category links (through
+    table), instead of several queries per course. Each row goes through the model's
+    field validation (full_clean) first. With teacher_profile given, every course goes
+    to that teacher and the 'teacher' column is ignored. Without allow_featured the
+    'featured' column is ignored and courses are not featured.
+
+    All or nothing: raises CourseImportError listing the bad rows and imports nothing
+    if any row is invalid. Returns the number of courses created.
+    """
+    lookups = _Lookups(create_categories)
+    teacher_profile_id = teacher_profile.id if teacher_profile else None
+    errors = []
+    created = 0
+
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, batch_size))
+        if not chunk:
+            break
+
+        if teacher_profile_id is None:
+            lookups.load_teachers((row.get('teacher') or '').strip() for _, row in chunk if '_error' not in row)
+        lookups.create_missing_categories(
+            name for _, row in chunk if '_error' not in row for name in _split_categories(row.get('categories'))
+        )
+
+        batch = []
+        for line_number, row in chunk:
+            try:
+                batch.append(_build_course(row, lookups, teacher_profile_id, allowed_statuses, allow_featured))
+            except ValueError as e:
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(f"line {line_number}: {e}")
+                else:
+                    errors.append("...")
+                    raise CourseImportError(errors)
+
+        # Once a row failed the import is rolled back, so only keep validating
+        if batch and not errors:
+            created += len(_insert_batch(batch))
+
+    if errors:
+        raise CourseImportError(errors)
+
+    # bulk_create sends no signals: drop the cached catalog explicitly
+    transaction.on_commit(invalidate_catalog)
+    logger.info(f"Imported {created} course(s).")
+    return created
+
+
+# --- Export ---
+def export_course_rows(queryset=None, chunk_size=COURSE_IO_BATCH_SIZE):
+    """
+    Yields one dict per course (COURSE_IO_FIELDS) in id order. Pages through the
+    courses by id, two queries per chunk_size courses (course columns with teacher and
+    level joined in, then their category names) and no model instances.
+    """
+    if queryset is None:
+        queryset = TeacherCourse.objects.all()
+    columns = (
+        'id', 'teacher_profile__user__username', 'title', 'description', 'price', 'language',
+        'level__name', 'status', 'featured', 'video_trailer_url',
+    )
+    last_id = 0
+    while True:
+        chunk = list(queryset.filter(id__gt=last_id).order_by('id').values_list(*columns)[:chunk_size])
+        if not chunk:
+            return
+        last_id = chunk[-1][0]
+
+        categories = {}
+        links = (
+            CourseCategories.objects.filter(teachercourse_id__in=[row[0] for row in chunk])
+            .order_by('coursecategory__name')
+            .values_list('teachercourse_id', 'coursecategory__name')
+        )
+        for course_id, name in links:
+            categories.setdefault(course_id, []).append(name)
+
+        for course_id, teacher, title, description, price, language, level, status, featured, url in chunk:
+            yield {
+                'teacher': teacher,
+                'title': title,
+                'description': description,
+                'price': str(price),
+                'language': language,
+                'level': level or '',
+                'categories': categories.get(course_id, []),
+                'status': status,
+                'featured': featured,
+                'video_trailer_url': url or '',
+            }
+
+
+def iter_courses_csv(rows):
+    """Yields CSV text (header first) for export_course_rows() output."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COURSE_IO_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({**row, 'categories': CATEGORY_SEPARATOR.join(row['categories'])})
+        if buffer.tell() > 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_courses_jsonl(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + '\n'
@@ -0,0 +1,66 @@
+# auth_system/accounts/courses.py
+
+# Course write path shared by TeacherCourseSerializer and the course edit view: an
+# edit costs one UPDATE of just the changed columns plus one diff of the category links.
+
+from django.utils import timezone
+
+
+def apply_changed_fields(instance, values):
+    """
+    Sets `values` ({field name: value}) on the instance and returns the names of the
+    fields whose value actually changed, for save(update_fields=...).
+    Relations are compared by primary key, so no related row is loaded.
+    """
+    changed = []
+    for name, value in values.items():
+        field = instance._meta.get_field(name)
+        if field.is_relation:
+            current, new = getattr(instance, field.attname), getattr(value, 'pk', value)
+        else:
+            current, new = getattr(instance, name), value
+        if current != new:
+            setattr(instance, name, value)
+            changed.append(name)
+    return changed
+
+
+def sync_categories(course, categories):
+    """
+    Adds / removes only the difference between the course's categories and `categories`.
+    Uses the prefetched categories when present. Returns True if anything changed.
+    """
+    prefetched = getattr(course, '_prefetched_objects_cache', {}).get('categories')
+    if prefetched is not None:
+        current = {category.pk for category in prefetched}
+    else:
+        current = set(course.categories.values_list('id', flat=True))
+    wanted = {category.pk for category in categories}
+
+    if current - wanted:
+        course.categories.remove(*(current - wanted))
+    if wanted - current:
+        course.categories.add(*(wanted - current))
+    return current != wanted
+
+
+def save_course_changes(course, changed_fields, categories=None):
+    """
+    Saves an existing course after an edit: syncs the categories (None = not edited) and
+    issues one UPDATE limited to changed_fields, or nothing at all if nothing changed.
+    """
+    categories_changed = categories is not None and sync_categories(course, categories)
+    if changed_fields or categories_changed:
+        # updated_at also moves for category-only edits: the course ETags are built from it
+        course.save(update_fields=[*changed_fields, 'updated_at'])
+        return True
+    return False
+
+
+def touch_courses(courses):
+    """
+    Moves updated_at of the courses in the queryset, in one UPDATE and without signals.
+    For changes that do not save the course row itself but alter what it serializes to
+    (e.g. a renamed category or level): the course ETags are built from updated_at.
+    """
+    return courses.update(updated_at=timezone.now())
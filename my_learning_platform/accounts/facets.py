@@ -0,0 +1,127 @@
+# auth_system/accounts/facets.py
+
+from decimal import Decimal
+
+from django.db.models import Count, Q
+
+from .catalog import get_cached_catalog_entry
+from .models import TeacherCourse, CourseCategory, CourseLevel
+
+# Price facet buckets: (key, label, condition)
+PRICE_RANGES = (
+    ('free', 'Free', Q(price=Decimal('0.00'))),
+    ('under_50', 'Under 50', Q(price__gt=Decimal('0.00'), price__lt=Decimal('50.00'))),
+    ('50_to_100', '50 to 100', Q(price__gte=Decimal('50.00'), price__lt=Decimal('100.00'))),
+    ('over_100', '100 and over', Q(price__gte=Decimal('100.00'))),
+)
+PRICE_RANGE_KEYS = tuple(key for key, _, _ in PRICE_RANGES)
+LANGUAGE_KEYS = tuple(code for code, _ in TeacherCourse.LANGUAGE_CHOICES)
+
+FACETS = ('category', 'level', 'language', 'price')
+
+
+class FacetSelection:
+    """
+    The facet values a catalog request filters on. Options within a facet are OR-ed,
+    facets are AND-ed (e.g. (Python OR Web) AND Beginner AND English).
+    """
+
+    def __init__(self, category=(), level=(), language=(), price=()):
+        self.values = {
+            'category': tuple(sorted(set(category))),
+            'level': tuple(sorted(set(level))),
+            'language': tuple(sorted(set(language))),
+            'price': tuple(sorted(set(price))),
+        }
+
+    def cache_key(self):
+        return 'facets:' + ';'.join(
+            f"{facet}={','.join(str(value) for value in self.values[facet])}" for facet in FACETS
+        )
+
+    def filter(self, queryset, exclude=None):
+        """Applies every selected facet except `exclude` to the queryset."""
+        selected = {facet: values for facet, values in self.values.items() if values and facet != exclude}
+
+        if 'category' in selected:
+            # Subquery instead of a join: no duplicate rows for courses in several selected categories
+            in_categories = TeacherCourse.categories.through.objects.filter(
+                coursecategory_id__in=selected['category']
+            ).values('teachercourse_id')
+            queryset = queryset.filter(id__in=in_categories)
+        if 'level' in selected:
+            queryset = queryset.filter(level_id__in=selected['level'])
+        if 'language' in selected:
+            queryset = queryset.filter(language__in=selected['language'])
+        if 'price' in selected:
+            price_condition = Q()
+            for key, _, condition in PRICE_RANGES:
+                if key in selected['price']:
+                    price_condition |= condition
+            queryset = queryset.filter(price_condition)
+        return queryset
+
+
+def catalog_queryset():
+    return TeacherCourse.objects.filter(status='published')
+
+
+def filter_catalog(selection):
+    return selection.filter(catalog_queryset())
+
+
+# --- Facet Counts ---
+# Each facet is counted with every *other* selected facet applied, so the counts tell
+# the user how many results picking that option would give. One grouped query per facet.
+def _category_counts(selection):
+    courses = selection.filter(catalog_queryset(), exclude='category')
+    rows = (
+        CourseCategory.objects.filter(courses__in=courses)
+        .values('id', 'name')
+        .annotate(count=Count('courses'))
+        .order_by('name')
+    )
+    return [{'value': row['id'], 'label': row['name'], 'count': row['count']} for row in rows]
+
+
+def _level_counts(selection):
+    courses = selection.filter(catalog_queryset(), exclude='level')
+    rows = (
+        CourseLevel.objects.filter(courses__in=courses)
+        .values('id', 'name')
+        .annotate(count=Count('courses'))
+        .order_by('name')
+    )
+    return [{'value': row['id'], 'label': row['name'], 'count': row['count']} for row in rows]
+
+
+def _language_counts(selection):
+    courses = selection.filter(catalog_queryset(), exclude='language')
+    counts = dict(courses.values_list('language').annotate(count=Count('id')).order_by())
+    return [
+        {'value': code, 'label': label, 'count': counts.get(code, 0)}
+        for code, label in TeacherCourse.LANGUAGE_CHOICES
+    ]
+
+
+def _price_counts(selection):
+    courses = selection.filter(catalog_queryset(), exclude='price')
+    counts = courses.aggregate(**{key: Count('id', filter=condition) for key, _, condition in PRICE_RANGES})
+    return [{'value': key, 'label': label, 'count': counts[key]} for key, label, _ in PRICE_RANGES]
+
+
+def compute_facet_counts(selection):
+    return {
+        'category': _category_counts(selection),
+        'level': _level_counts(selection),
+        'language': _language_counts(selection),
+        'price': _price_counts(selection),
+    }
+
+
+def get_facet_counts(selection):
+    """
+    Facet counts for the given selection, cached under the catalog version so any
+    course / category / level change recomputes them.
+    """
+    return get_cached_catalog_entry(selection.cache_key(), lambda: compute_facet_counts(selection))
@@ -9,6 +9,8 @@ from datetime import datetime
 from .models import Profile, CourseCategory, CourseLevel, TeacherCourse 
 
 from .models import ContactMessage # Import the new model
+from .models import AllowedCard
+from .payments import card_fingerprint
 
 
 # Get the currently active User model
@@ -329,6 +331,36 @@ class PaymentForm(forms.Form):
     expiry_month = forms.ChoiceField(label='Expiry Month', choices=[(i, f'{i:02d}') for i in range(1, 13)], widget=forms.Select(attrs={'class': 'form-control'}))
     expiry_year = forms.ChoiceField(label='Expiry Year', choices=[(i, str(i)) for i in range(datetime.now().year, datetime.now().year + 11)], widget=forms.Select(attrs={'class': 'form-control'}))
 
+class AllowedCardForm(forms.ModelForm):
+    """Admin form: the card number is hashed on save and never stored or shown again."""
+    card_number = forms.CharField(
+        label='Card Number',
+        max_length=255,
+        required=False,
+        help_text='Leave blank to keep the current card when editing.',
+    )
+
+    class Meta:
+        model = AllowedCard
+        fields = ['card_number', 'expiry_month', 'expiry_year']
+
+    def clean_card_number(self):
+        card_number = self.cleaned_data['card_number'].replace(' ', '').replace('-', '')
+        if not card_number and self.instance.pk is None:
+            raise forms.ValidationError('Enter the card number.')
+        if card_number and not card_number.isdigit():
+            raise forms.ValidationError('Card number must contain digits only.')
+        if card_number and AllowedCard.objects.filter(
+            card_fingerprint=card_fingerprint(card_number)
+        ).exclude(pk=self.instance.pk).exists():
+            raise forms.ValidationError('This card is already allowed.')
+        return card_number
+
+    def save(self, commit=True):
+        if self.cleaned_data.get('card_number'):
+            self.instance.card_number = self.cleaned_data['card_number']
+        return super().save(commit)
+
 class UserLoginForm(forms.Form):
     username = forms.CharField(
         label='Username',
@@ -0,0 +1,44 @@
+# auth_system/accounts/hashers.py
+#
+# Imported from settings.py: must not import models or anything that needs the app registry.
+
+import importlib.util
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Hashers every tier can still verify. Django rehashes a password with the tier's
+# preferred (first) hasher on the next successful login, so switching tiers migrates
+# stored hashes transparently.
+_VERIFY_ONLY_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+PASSWORD_HASHER_TIERS = {
+    # Production default: memory-hard Argon2id (needs argon2-cffi)
+    'argon2': 'django.contrib.auth.hashers.Argon2PasswordHasher',
+    # Django's default PBKDF2-SHA256 (no extra dependency)
+    'pbkdf2': 'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    # Tests / fixtures only: MD5 is NOT a secure password hash
+    'fast': 'django.contrib.auth.hashers.MD5PasswordHasher',
+}
+
+
+def password_hashers_for_tier(tier):
+    """
+    PASSWORD_HASHERS for the given tier: its preferred hasher first, followed by every
+    other hasher so existing hashes still verify (and get upgraded on login).
+    Falls back to 'pbkdf2' when 'argon2' is requested but argon2-cffi is not installed.
+    """
+    if tier not in PASSWORD_HASHER_TIERS:
+        raise ValueError(f"Unknown PASSWORD_HASHER_TIER '{tier}'. Choose from: {', '.join(PASSWORD_HASHER_TIERS)}.")
+    if tier == 'argon2' and importlib.util.find_spec('argon2') is None:
+        logger.warning("PASSWORD_HASHER_TIER is 'argon2' but argon2-cffi is not installed; using 'pbkdf2'.")
+        tier = 'pbkdf2'
+
+    preferred = PASSWORD_HASHER_TIERS[tier]
+    return [preferred] + [hasher for hasher in _VERIFY_ONLY_HASHERS if hasher != preferred]
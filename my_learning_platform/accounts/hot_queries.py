@@ -0,0 +1,124 @@
+# auth_system/accounts/hot_queries.py
+
+import re
+
+from django.utils import timezone
+
+from .backends import login_lookup_queryset
+from .models import TeacherCourse, EnrolledCourse, Profile, ContactMessage, Job, CourseRanking
+
+# Representative primary key used when a hot query filters on a specific row;
+# the plan does not depend on the value.
+SAMPLE_ID = 1
+
+
+# --- Registry ---
+# name -> callable returning the queryset, mirroring the filters and ordering the
+# views / API views / admin actually run. Audited by `manage.py explain_hot_queries`.
+HOT_QUERIES = {}
+
+
+def hot_query(name):
+    """Decorator registering a queryset builder under `name`."""
+    def register(build):
+        HOT_QUERIES[name] = build
+        return build
+    return register
+
+
+@hot_query('catalog_published')
+def _catalog_published():
+    # course_list_view (accounts.catalog.published_courses_queryset)
+    return TeacherCourse.objects.filter(status='published').order_by('-created_at')
+
+
+@hot_query('catalog_featured')
+def _catalog_featured():
+    # index_view (accounts.catalog.get_featured_courses)
+    return TeacherCourse.objects.filter(status='published', featured=True).order_by('-created_at')
+
+
+@hot_query('course_detail')
+def _course_detail():
+    return TeacherCourse.objects.filter(id=SAMPLE_ID, status__in=['published', 'approved'])
+
+
+@hot_query('courses_by_status')
+def _courses_by_status():
+    # TeacherCourseAdmin status filter
+    return TeacherCourse.objects.filter(status='pending').order_by('-created_at')
+
+
+@hot_query('teacher_courses')
+def _teacher_courses():
+    # TeacherCourseListCreateAPIView / teacher dashboard
+    return TeacherCourse.objects.filter(teacher_profile_id=SAMPLE_ID).order_by('-created_at', '-id')
+
+
+@hot_query('student_enrollments')
+def _student_enrollments():
+    # MyEnrolledCoursesListAPIView / student dashboard
+    return EnrolledCourse.objects.filter(student_id=SAMPLE_ID).order_by('-enrolled_at', '-id')
+
+
+@hot_query('is_enrolled')
+def _is_enrolled():
+    # course_detail / register_for_course
+    return EnrolledCourse.objects.filter(student_id=SAMPLE_ID, course_id=SAMPLE_ID)
+
+
+@hot_query('pending_teacher_applications')
+def _pending_teacher_applications():
+    # TeacherApplicationListAPIView
+    return Profile.objects.filter(
+        user__user_type='teacher',
+        is_teacher_application_pending=True,
+        is_teacher_approved=False,
+    ).order_by('-id')
+
+
+@hot_query('login_lookup')
+def _login_lookup():
+    # UsernameOrEmailBackend (LoginAPIView, login page)
+    return login_lookup_queryset('Someone@Example.com')[:3]
+
+
+@hot_query('recent_contact_messages')
+def _recent_contact_messages():
+    # ContactMessageAdmin changelist (first page)
+    return ContactMessage.objects.order_by('-submitted_at')[:100]
+
+
+@hot_query('job_queue_due')
+def _job_queue_due():
+    # run_jobs worker poll (accounts.jobs.claim_jobs)
+    return Job.objects.filter(status='pending', run_after__lte=timezone.now()).order_by('run_after', 'id')[:50]
+
+
+@hot_query('course_ranking_top')
+def _course_ranking_top():
+    # Top-k ranked courses (accounts.ranking.cache_top_course_ids)
+    return CourseRanking.objects.order_by('-score', 'course_id').values_list('course_id', flat=True)[:50]
+
+
+# --- Plan Inspection ---
+# SQLite: "SCAN <table>" visits every row; "SCAN <table> USING [COVERING] INDEX ..." does too,
+# only in index order, which is cheap only when a LIMIT stops it early. "SEARCH" is an index lookup.
+_SQLITE_FULL_SCAN = re.compile(r'\bSCAN (?!CONSTANT ROW)(?!.*\bUSING\b)')
+_SQLITE_INDEX_SCAN = re.compile(r'\bSCAN (?!CONSTANT ROW)')
+_POSTGRES_FULL_SCAN = re.compile(r'\bSeq Scan on\b')
+
+
+def find_full_scans(plan, vendor, limited=False):
+    """
+    Returns the lines of an EXPLAIN output that read a whole table. With limited=True
+    (the query has a LIMIT) walking an index in order is accepted.
+    Vendors other than SQLite and PostgreSQL are not inspected.
+    """
+    if vendor == 'sqlite':
+        pattern = _SQLITE_FULL_SCAN if limited else _SQLITE_INDEX_SCAN
+    elif vendor == 'postgresql':
+        pattern = _POSTGRES_FULL_SCAN
+    else:
+        return []
+    return [line.strip() for line in plan.splitlines() if pattern.search(line)]
@@ -0,0 +1,167 @@
+# auth_system/accounts/jobs.py
+
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+JOB_MAX_ATTEMPTS = getattr(settings, 'JOB_MAX_ATTEMPTS', 5)
+# Retry n waits JOB_RETRY_DELAY * 2**(n-1) seconds
+JOB_RETRY_DELAY = getattr(settings, 'JOB_RETRY_DELAY', 30)
+JOB_BATCH_SIZE = getattr(settings, 'JOB_BATCH_SIZE', 50)
+# A job still 'running' after this many seconds belongs to a dead worker and is requeued
+JOB_STALE_TIMEOUT = getattr(settings, 'JOB_STALE_TIMEOUT', 600)
+
+
+# --- Registry ---
+# name -> (handler, batch). A plain handler is called as handler(**payload) once per job.
+# A batch handler is called once per claimed batch as handler([payload, ...]) and returns
+# one entry per payload: None on success or the exception that item failed with.
+JOB_HANDLERS = {}
+
+
+def job_handler(name, batch=False):
+    """Decorator registering a job handler under `name`."""
+    def register(handler):
+        JOB_HANDLERS[name] = (handler, batch)
+        return handler
+    return register
+
+
+# --- Enqueueing ---
+def enqueue(name, payload=None, delay=0, max_attempts=None):
+    """
+    Queues a job once the current transaction commits (right away outside one), so
+    workers never see work for changes that were rolled back. Returns immediately.
+    """
+    enqueue_many(name, [payload or {}], delay=delay, max_attempts=max_attempts)
+
+
+def enqueue_many(name, payloads, delay=0, max_attempts=None):
+    """Queues one job per payload with a single INSERT on commit."""
+    if name not in JOB_HANDLERS:
+        raise ValueError(f"No job handler registered for '{name}'.")
+    payloads = list(payloads)
+    if not payloads:
+        return
+
+    def create():
+        run_after = timezone.now() + timedelta(seconds=delay)
+        Job.objects.bulk_create([
+            Job(name=name, payload=payload, run_after=run_after, max_attempts=max_attempts or JOB_MAX_ATTEMPTS)
+            for payload in payloads
+        ])
+
+    transaction.on_commit(create)
+
+
+# --- Worker Side ---
+def requeue_stale_jobs(timeout=JOB_STALE_TIMEOUT):
+    """Puts jobs claimed by a worker that died mid-run back in the queue."""
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    count = Job.objects.filter(status='running', locked_at__lt=cutoff).update(
+        status='pending', locked_by='', locked_at=None
+    )
+    if count:
+        logger.warning(f"Requeued {count} stale background job(s).")
+    return count
+
+
+def claim_jobs(batch_size=JOB_BATCH_SIZE):
+    """
+    Marks up to batch_size due jobs as running under a fresh claim token and returns them.
+    The conditional UPDATE (status still 'pending') makes the claim safe with several
+    workers even on databases without SELECT ... FOR UPDATE SKIP LOCKED.
+    """
+    token = uuid.uuid4().hex
+    now = timezone.now()
+    with transaction.atomic():
+        due = Job.objects.filter(status='pending', run_after__lte=now).order_by('run_after', 'id')
+        if transaction.get_connection().features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        ids = list(due.values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return []
+        Job.objects.filter(id__in=ids, status='pending').update(
+            status='running', locked_by=token, locked_at=now
+        )
+    return list(Job.objects.filter(locked_by=token, status='running').order_by('run_after', 'id'))
+
+
+def _finish(job, error):
+    if error is None:
+        job.delete()
+        return True
+
+    job.attempts += 1
+    job.last_error = f"{type(error).__name__}: {error}"
+    job.locked_by = ''
+    job.locked_at = None
+    if job.attempts >= job.max_attempts:
+        job.status = 'failed'
+        logger.error(f"Background job {job} failed permanently: {job.last_error}")
+    else:
+        job.status = 'pending'
+        job.run_after = timezone.now() + timedelta(seconds=JOB_RETRY_DELAY * 2 ** (job.attempts - 1))
+        logger.warning(f"Background job {job} failed (attempt {job.attempts}), retrying: {job.last_error}")
+    job.save(update_fields=['attempts', 'last_error', 'locked_by', 'locked_at', 'status', 'run_after'])
+    return False
+
+
+def run_jobs(jobs):
+    """
+    Runs claimed jobs, grouping those of a batch handler into a single call.
+    Returns (succeeded, failed) counts.
+    """
+    by_name = {}
+    for job in jobs:
+        by_name.setdefault(job.name, []).append(job)
+
+    succeeded = failed = 0
+    for name, group in by_name.items():
+        if name not in JOB_HANDLERS:
+            errors = [LookupError(f"No job handler registered for '{name}'.")] * len(group)
+        else:
+            handler, batch = JOB_HANDLERS[name]
+            if batch:
+                try:
+                    errors = handler([job.payload for job in group])
+                except Exception as e:
+                    errors = [e] * len(group)
+            else:
+                errors = []
+                for job in group:
+                    try:
+                        handler(**job.payload)
+                        errors.append(None)
+                    except Exception as e:
+                        errors.append(e)
+
+        for job, error in zip(group, errors):
+            if _finish(job, error):
+                succeeded += 1
+            else:
+                failed += 1
+    return succeeded, failed
+
+
+def run_pending_jobs(batch_size=JOB_BATCH_SIZE):
+    """Claims and runs one batch of due jobs. Returns (succeeded, failed) counts."""
+    jobs = claim_jobs(batch_size)
+    if not jobs:
+        return 0, 0
+    return run_jobs(jobs)
+
+
+def retry_jobs(queryset):
+    """Gives failed jobs a fresh set of attempts (admin action)."""
+    return queryset.filter(status='failed').update(
+        status='pending', attempts=0, run_after=timezone.now(), last_error=''
+    )
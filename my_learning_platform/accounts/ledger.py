@@ -0,0 +1,201 @@
+# auth_system/accounts/ledger.py
+
+import logging
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DecimalField, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from .models import CourseRevenueSnapshot, EnrolledCourse, TeacherCourse
+
+logger = logging.getLogger(__name__)
+
+LEDGER_BATCH_SIZE = 1000
+
+
+# --- Incremental Updates ---
+def _apply_delta(course_id, day, count_delta, revenue_delta):
+    """
+    Adds the deltas to the (course, day) snapshot row, creating it on first use.
+    Uses F() expressions so concurrent enrollments never lose an update.
+    A removal never creates the row: when it is gone the course is being deleted along
+    with its ledger (or the ledger needs a rebuild anyway).
+    """
+    updated = CourseRevenueSnapshot.objects.filter(course_id=course_id, date=day).update(
+        enrollment_count=F('enrollment_count') + count_delta,
+        revenue=F('revenue') + revenue_delta,
+    )
+    if updated or count_delta < 0:
+        return
+
+    try:
+        with transaction.atomic():
+            CourseRevenueSnapshot.objects.create(
+                course_id=course_id, date=day, enrollment_count=count_delta, revenue=revenue_delta
+            )
+    except IntegrityError:
+        # Another request created the row for this day in the meantime
+        CourseRevenueSnapshot.objects.filter(course_id=course_id, date=day).update(
+            enrollment_count=F('enrollment_count') + count_delta,
+            revenue=F('revenue') + revenue_delta,
+        )
+
+
+def _apply_course_totals(course_id, count_delta, revenue_delta):
+    # A single-row UPDATE with F() expressions; no read, so nothing to race with
+    TeacherCourse.objects.filter(id=course_id).update(
+        enrollment_count=F('enrollment_count') + count_delta,
+        revenue_total=F('revenue_total') + revenue_delta,
+    )
+
+
+def _snapshot_date(enrollment):
+    return timezone.localdate(enrollment.enrolled_at)
+
+
+def record_enrollment(enrollment):
+    """
+    Adds a newly created enrollment to the ledger and to the course's totals.
+    Call inside the same transaction that created the enrollment.
+    """
+    _apply_delta(enrollment.course_id, _snapshot_date(enrollment), 1, enrollment.fee_paid)
+    _apply_course_totals(enrollment.course_id, 1, enrollment.fee_paid)
+
+
+def record_unenrollment(enrollment):
+    """
+    Removes a deleted enrollment from the ledger (from the day it was made on) and
+    from the course's totals. Runs from the post_delete signal of EnrolledCourse, inside
+    the deleting transaction, so cascades from Profile / user deletion are covered too.
+    """
+    _apply_delta(enrollment.course_id, _snapshot_date(enrollment), -1, -enrollment.fee_paid)
+    _apply_course_totals(enrollment.course_id, -1, -enrollment.fee_paid)
+
+
+# --- Bulk Rebuild / Verification ---
+def expected_snapshots(course_ids=None):
+    """
+    Recomputes the ledger from raw EnrolledCourse rows.
+    Returns {(course_id, date): (enrollment_count, revenue)}.
+    """
+    enrollments = EnrolledCourse.objects.all()
+    if course_ids:
+        enrollments = enrollments.filter(course_id__in=course_ids)
+
+    rows = (
+        enrollments.annotate(day=TruncDate('enrolled_at'))
+        .values('course_id', 'day')
+        .annotate(enrollment_count=Count('id'), revenue=Sum('fee_paid'))
+        .order_by()
+    )
+    return {
+        (row['course_id'], row['day']): (row['enrollment_count'], row['revenue'] or Decimal('0.00'))
+        for row in rows.iterator()
+    }
+
+
+def current_snapshots(course_ids=None):
+    """
+    Returns the stored ledger as {(course_id, date): (enrollment_count, revenue)}.
+    Rows that net out to zero are skipped, they carry no information.
+    """
+    snapshots = CourseRevenueSnapshot.objects.all()
+    if course_ids:
+        snapshots = snapshots.filter(course_id__in=course_ids)
+
+    rows = snapshots.values_list('course_id', 'date', 'enrollment_count', 'revenue').order_by()
+    return {
+        (course_id, day): (count, revenue)
+        for course_id, day, count, revenue in rows.iterator()
+        if count or revenue
+    }
+
+
+def verify_ledger(course_ids=None):
+    """
+    Compares the stored ledger against the raw enrollments.
+    Returns a list of (course_id, date, stored, expected) tuples for every mismatch.
+    """
+    expected = expected_snapshots(course_ids)
+    current = current_snapshots(course_ids)
+
+    mismatches = []
+    for key in sorted(set(expected) | set(current), key=lambda k: (k[0], k[1])):
+        stored = current.get(key, (0, Decimal('0.00')))
+        wanted = expected.get(key, (0, Decimal('0.00')))
+        if stored != wanted:
+            mismatches.append((key[0], key[1], stored, wanted))
+    return mismatches
+
+
+@transaction.atomic
+def rebuild_ledger(course_ids=None, batch_size=LEDGER_BATCH_SIZE):
+    """
+    Replaces the stored ledger (optionally only for some courses) with values
+    recomputed from EnrolledCourse. Returns the number of snapshot rows written.
+    """
+    snapshots = CourseRevenueSnapshot.objects.all()
+    if course_ids:
+        snapshots = snapshots.filter(course_id__in=course_ids)
+    snapshots.delete()
+
+    new_rows = [
+        CourseRevenueSnapshot(course_id=course_id, date=day, enrollment_count=count, revenue=revenue)
+        for (course_id, day), (count, revenue) in expected_snapshots(course_ids).items()
+    ]
+    CourseRevenueSnapshot.objects.bulk_create(new_rows, batch_size=batch_size)
+    logger.info(f"Revenue ledger rebuilt: {len(new_rows)} snapshot rows written.")
+    return len(new_rows)
+
+
+# --- Course Totals Reconciliation ---
+def _actual_course_totals():
+    """(count, revenue) expressions recomputing a course's totals from its enrollments."""
+    enrollments = EnrolledCourse.objects.filter(course=OuterRef('pk')).order_by().values('course')
+    count = Coalesce(Subquery(enrollments.annotate(count=Count('id')).values('count')), 0)
+    revenue = Coalesce(
+        Subquery(enrollments.annotate(total=Sum('fee_paid')).values('total')),
+        Decimal('0.00'),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+    return count, revenue
+
+
+def drifted_course_totals(course_ids=None):
+    """
+    Courses whose stored enrollment_count / revenue_total disagree with their enrollments.
+    Returns a list of (course_id, stored, expected) with (count, revenue) pairs.
+    """
+    count, revenue = _actual_course_totals()
+    courses = TeacherCourse.objects.all()
+    if course_ids:
+        courses = courses.filter(id__in=course_ids)
+    rows = (
+        courses.annotate(actual_count=count, actual_revenue=revenue)
+        .filter(~Q(enrollment_count=F('actual_count')) | ~Q(revenue_total=F('actual_revenue')))
+        .order_by('id')
+        .values_list('id', 'enrollment_count', 'revenue_total', 'actual_count', 'actual_revenue')
+    )
+    return [
+        (course_id, (stored_count, stored_revenue), (actual_count, Decimal(actual_revenue).quantize(Decimal('0.01'))))
+        for course_id, stored_count, stored_revenue, actual_count, actual_revenue in rows
+    ]
+
+
+@transaction.atomic
+def reconcile_course_totals(course_ids=None):
+    """
+    Rewrites enrollment_count / revenue_total of the drifted courses (optionally only
+    among course_ids) from their enrollments, in one UPDATE. Returns the drift found,
+    as drifted_course_totals() does.
+    """
+    drifted = drifted_course_totals(course_ids)
+    if drifted:
+        count, revenue = _actual_course_totals()
+        TeacherCourse.objects.filter(id__in=[course_id for course_id, _, _ in drifted]).update(
+            enrollment_count=count, revenue_total=revenue,
+        )
+        logger.warning(f"Course totals reconciled for {len(drifted)} course(s).")
+    return drifted
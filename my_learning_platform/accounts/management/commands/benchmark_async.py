@@ -0,0 +1,92 @@
+import asyncio
+import secrets
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test import AsyncClient, Client, override_settings
+from django.urls import reverse
+
+from accounts.benchmarking import format_summary, run_concurrently, run_concurrently_async, summarize
+from accounts.models import Profile, TeacherCourse, CourseCategory, CourseLevel
+
+User = get_user_model()
+
+# (label, sync endpoint, async endpoint, takes a course pk); each pair does the same work
+ENDPOINTS = (
+    ('categories', 'api_course_categories', 'api_async_course_categories', False),
+    ('levels', 'api_course_levels', 'api_async_course_levels', False),
+    ('catalog list', 'api_catalog', 'api_async_catalog', False),
+    ('catalog detail', 'api_catalog_detail', 'api_async_catalog_detail', True),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares requests/sec of the sync DRF read-only endpoints (threads, WSGI handler) '
+        'with their async variants (event loop, ASGI handler) under concurrent load, in process. '
+        'Seeds throwaway catalog data for the run and deletes it afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint and stack.')
+        parser.add_argument('--concurrency', type=int, default=16, help='Requests in flight at once.')
+        parser.add_argument('--courses', type=int, default=20, help='Published courses to seed (at least 1).')
+
+    def handle(self, *args, **options):
+        teacher, categories, levels, course = self.seed(options['courses'])
+        self.stdout.write(
+            f"{options['requests']} requests per endpoint, {options['concurrency']} concurrent"
+        )
+        try:
+            # The in-process test clients send Host: testserver
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                for label, sync_name, async_name, takes_pk in ENDPOINTS:
+                    args = [course.id] if takes_pk else []
+                    self.benchmark_sync(f'{label} (sync)', reverse(sync_name, args=args), options)
+                    self.benchmark_async(f'{label} (async)', reverse(async_name, args=args), options)
+        finally:
+            teacher.delete() # Cascades to the profile and seeded courses
+            CourseCategory.objects.filter(id__in=[c.id for c in categories]).delete()
+            CourseLevel.objects.filter(id__in=[level.id for level in levels]).delete()
+
+    def seed(self, course_count):
+        """Returns the teacher, categories and levels to clean up, and a course for the detail endpoints."""
+        suffix = secrets.token_hex(4)
+        teacher = User.objects.create_user(username=f'benchmark-async-{suffix}', user_type='teacher')
+        profile = Profile.objects.create(user=teacher, is_teacher_approved=True)
+        categories = [CourseCategory.objects.create(name=f'Benchmark {suffix} {i}') for i in range(3)]
+        levels = [CourseLevel.objects.create(name=f'Benchmark {suffix} {i}') for i in range(2)]
+        for i in range(max(course_count, 1)):
+            course = TeacherCourse.objects.create(
+                teacher_profile=profile, title=f'Benchmark course {i}', description='Benchmark',
+                price=Decimal('10.00'), level=levels[i % len(levels)], status='published'
+            )
+            course.categories.set(categories)
+        return teacher, categories, levels, course
+
+    def benchmark_sync(self, label, url, options):
+        def get():
+            response = Client().get(url, secure=True)
+            if response.status_code != 200:
+                raise RuntimeError(f'{url} returned {response.status_code}')
+
+        get() # Warm-up
+        durations, wall_time, errors = run_concurrently(get, options['requests'], options['concurrency'])
+        self.stdout.write(format_summary(label, summarize(durations, wall_time, errors)))
+
+    def benchmark_async(self, label, url, options):
+        client = AsyncClient()
+
+        async def get():
+            response = await client.get(url, secure=True)
+            if response.status_code != 200:
+                raise RuntimeError(f'{url} returned {response.status_code}')
+
+        async def run():
+            await get() # Warm-up
+            return await run_concurrently_async(get, options['requests'], options['concurrency'])
+
+        durations, wall_time, errors = asyncio.run(run())
+        self.stdout.write(format_summary(label, summarize(durations, wall_time, errors)))
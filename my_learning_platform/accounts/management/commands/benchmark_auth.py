@@ -0,0 +1,67 @@
+import base64
+import secrets
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.authentication import BasicAuthentication, TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from accounts.authentication import CachedBasicAuthentication, CachedTokenAuthentication, auth_cache_enabled
+from accounts.benchmarking import format_summary, run_concurrently, summarize
+from accounts.models import Profile
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures per-request API authentication cost under concurrent load: DRF Basic / Token '
+        'authentication against the cached variants in accounts.authentication. '
+        'Creates a throwaway user for the run and deletes it afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=100, help='Authenticated requests per scenario.')
+        parser.add_argument('--concurrency', type=int, default=8, help='Number of concurrent threads.')
+
+    def handle(self, *args, **options):
+        username = f'benchmark-auth-{secrets.token_hex(4)}'
+        password = secrets.token_urlsafe(16)
+        user = User.objects.create_user(username=username, password=password)
+        Profile.objects.create(user=user)
+        token = Token.objects.create(user=user)
+
+        basic_header = 'Basic ' + base64.b64encode(f'{username}:{password}'.encode()).decode()
+        token_header = f'Token {token.key}'
+        scenarios = (
+            ('Basic (DRF)', BasicAuthentication(), basic_header),
+            ('Basic (cached credentials)', CachedBasicAuthentication(), basic_header),
+            ('Token (DRF)', TokenAuthentication(), token_header),
+            ('Token (cached lookup)', CachedTokenAuthentication(), token_header),
+        )
+
+        self.stdout.write(
+            f"{options['requests']} requests per scenario, {options['concurrency']} concurrent threads"
+        )
+        if not auth_cache_enabled():
+            self.stdout.write(self.style.WARNING(
+                "AUTH_CACHE_ENABLED is off: the cached variants behave like plain DRF authentication."
+            ))
+        try:
+            for label, authenticator, header in scenarios:
+                cache.clear()
+                request = RequestFactory().get('/api/me/profile/', HTTP_AUTHORIZATION=header)
+
+                def authenticate():
+                    if authenticator.authenticate(request) is None:
+                        raise RuntimeError('authentication returned no user')
+
+                authenticate() # Warm-up: connection setup, and the cache fill for cached variants
+                durations, wall_time, errors = run_concurrently(
+                    authenticate, options['requests'], options['concurrency']
+                )
+                self.stdout.write(format_summary(label, summarize(durations, wall_time, errors)))
+        finally:
+            user.delete()
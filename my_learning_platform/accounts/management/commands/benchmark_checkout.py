@@ -0,0 +1,64 @@
+import itertools
+import secrets
+from datetime import datetime
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from accounts.benchmarking import format_summary, run_concurrently, summarize
+from accounts.models import AllowedCard, Profile, TeacherCourse
+from accounts.payments import AllowedCardGateway, StubGateway, enroll_with_payment
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures checkout throughput under concurrent load: enroll_with_payment with the '
+        'AllowedCard gateway and with the stub gateway (PAYMENT_STUB_LATENCY_MS applies). '
+        'Creates a throwaway course, card and students for the run and deletes them afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=100, help='Checkouts per scenario.')
+        parser.add_argument('--concurrency', type=int, default=8, help='Number of concurrent threads.')
+
+    def handle(self, *args, **options):
+        prefix = f'benchmark-checkout-{secrets.token_hex(4)}'
+        card_number = f'4{secrets.randbelow(10 ** 15):015d}'
+        expiry_year = datetime.now().year + 1
+        scenarios = (
+            ('AllowedCardGateway', AllowedCardGateway()),
+            ('StubGateway', StubGateway()),
+        )
+        # One student per checkout (+ one warm-up per scenario): each enrollment must be new
+        count = (options['requests'] + 1) * len(scenarios)
+
+        teacher = User.objects.create_user(username=f'{prefix}-teacher', user_type='teacher')
+        course = TeacherCourse.objects.create(
+            teacher_profile=Profile.objects.create(user=teacher, is_teacher_approved=True),
+            title=prefix, description=prefix, price=Decimal('10.00'),
+        )
+        card = AllowedCard.objects.create(card_number=card_number, expiry_month=12, expiry_year=expiry_year)
+        users = User.objects.bulk_create([User(username=f'{prefix}-{i}') for i in range(count)])
+        students = iter(Profile.objects.bulk_create([Profile(user=user) for user in users]))
+
+        self.stdout.write(
+            f"{options['requests']} checkouts per scenario, {options['concurrency']} concurrent threads"
+        )
+        try:
+            for label, gateway in scenarios:
+                next_student = itertools.count()
+                claimed = list(itertools.islice(students, options['requests'] + 1))
+
+                def checkout():
+                    enroll_with_payment(claimed[next(next_student)], course, card_number, 12, expiry_year, gateway=gateway)
+
+                checkout() # Warm-up
+                durations, wall_time, errors = run_concurrently(checkout, options['requests'], options['concurrency'])
+                self.stdout.write(format_summary(label, summarize(durations, wall_time, errors)))
+        finally:
+            course.delete()
+            card.delete()
+            User.objects.filter(username__startswith=prefix).delete()
@@ -0,0 +1,70 @@
+import secrets
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from accounts.benchmarking import format_summary, run_concurrently, summarize
+from accounts.hashers import PASSWORD_HASHER_TIERS, password_hashers_for_tier
+from accounts.models import Profile
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures LoginAPIView and login_view latency (p50 / p99) for each password hasher tier '
+        '(see accounts.hashers). Creates a throwaway user per tier and deletes it afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=30, help='Logins per endpoint and tier.')
+        parser.add_argument('--concurrency', type=int, default=4, help='Number of concurrent threads.')
+        parser.add_argument(
+            '--tier',
+            action='append',
+            dest='tiers',
+            choices=sorted(PASSWORD_HASHER_TIERS),
+            help='Only benchmark this tier. Can be given several times.',
+        )
+
+    def handle(self, *args, **options):
+        tiers = options['tiers'] or list(PASSWORD_HASHER_TIERS)
+        self.stdout.write(
+            f"{options['requests']} logins per endpoint, {options['concurrency']} concurrent threads"
+        )
+        # The in-process test client sends Host: testserver
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            for tier in tiers:
+                with override_settings(PASSWORD_HASHERS=password_hashers_for_tier(tier)):
+                    self.benchmark_tier(tier, options)
+
+    def benchmark_tier(self, tier, options):
+        username = f'benchmark-hasher-{secrets.token_hex(4)}'
+        password = secrets.token_urlsafe(16)
+        user = User.objects.create_user(username=username, password=password)
+        Profile.objects.create(user=user)
+
+        def api_login():
+            response = Client().post(
+                reverse('api_login'), {'username_or_email': username, 'password': password}, secure=True
+            )
+            if response.status_code != 200:
+                raise CommandError(f'LoginAPIView returned {response.status_code}')
+
+        def form_login():
+            response = Client().post(reverse('login'), {'username': username, 'password': password}, secure=True)
+            if response.status_code != 302: # Redirects on success, re-renders the form on failure
+                raise CommandError(f'login_view returned {response.status_code}')
+
+        hasher = get_hasher().algorithm
+        try:
+            for endpoint, login in (('LoginAPIView', api_login), ('login_view', form_login)):
+                login() # Warm-up
+                durations, wall_time, errors = run_concurrently(login, options['requests'], options['concurrency'])
+                self.stdout.write(format_summary(f'{tier} ({hasher}) {endpoint}', summarize(durations, wall_time, errors)))
+        finally:
+            user.delete()
@@ -0,0 +1,78 @@
+import secrets
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from accounts.backends import UsernameOrEmailBackend
+from accounts.benchmarking import format_summary, run_concurrently, summarize
+from accounts.models import Profile
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures login throughput under concurrent load: the previous username-then-email '
+        'login flow against UsernameOrEmailBackend, and the full POST /api/login/ endpoint. '
+        'Creates a throwaway user for the run and deletes it afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=50, help='Logins per scenario.')
+        parser.add_argument('--concurrency', type=int, default=8, help='Number of concurrent threads.')
+
+    def handle(self, *args, **options):
+        username = f'benchmark-login-{secrets.token_hex(4)}'
+        email = f'{username}@Example.com'
+        password = secrets.token_urlsafe(16)
+        user = User.objects.create_user(username=username, email=email, password=password)
+        Profile.objects.create(user=user)
+        login_url = reverse('api_login')
+
+        def previous_email_login():
+            # What LoginAPIView used to do for an email: a failed username attempt
+            # (one hash), an email lookup, then a second attempt (another hash)
+            backend = ModelBackend()
+            found = backend.authenticate(None, username=email.upper(), password=password)
+            if found is None:
+                match = User.objects.get(email__iexact=email.upper())
+                found = backend.authenticate(None, username=match.username, password=password)
+            if found is None:
+                raise RuntimeError('login failed')
+
+        def backend_email_login():
+            if UsernameOrEmailBackend().authenticate(None, username=email.upper(), password=password) is None:
+                raise RuntimeError('login failed')
+
+        def endpoint_email_login():
+            response = Client().post(
+                login_url, {'username_or_email': email.upper(), 'password': password}, secure=True
+            )
+            if response.status_code != 200:
+                raise RuntimeError(f'login returned {response.status_code}')
+
+        scenarios = (
+            ('Previous flow (email)', previous_email_login),
+            ('UsernameOrEmailBackend (email)', backend_email_login),
+            ('POST /api/login/ (email)', endpoint_email_login),
+        )
+
+        self.stdout.write(
+            f"{options['requests']} logins per scenario, {options['concurrency']} concurrent threads"
+        )
+        # The in-process test client sends Host: testserver
+        try:
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                self.run_scenarios(scenarios, options)
+        finally:
+            user.delete()
+
+    def run_scenarios(self, scenarios, options):
+        for label, login in scenarios:
+            login() # Warm-up
+            durations, wall_time, errors = run_concurrently(login, options['requests'], options['concurrency'])
+            self.stdout.write(format_summary(label, summarize(durations, wall_time, errors)))
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from accounts.hot_queries import HOT_QUERIES, find_full_scans
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs EXPLAIN on every registered hot query (accounts.hot_queries) and flags plans '
+        'that still read a whole table. Note: on near-empty tables PostgreSQL may prefer a '
+        'sequential scan regardless of indexes; audit against realistic data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--query',
+            action='append',
+            dest='names',
+            choices=sorted(HOT_QUERIES),
+            help='Only explain this hot query. Can be given several times.',
+        )
+        parser.add_argument(
+            '--strict',
+            action='store_true',
+            help='Exit with an error if any plan uses a full table scan.',
+        )
+
+    def handle(self, *args, **options):
+        names = options['names'] or sorted(HOT_QUERIES)
+        flagged = []
+
+        for name in names:
+            queryset = HOT_QUERIES[name]()
+            plan = queryset.explain()
+            full_scans = find_full_scans(plan, connection.vendor, limited=queryset.query.is_sliced)
+
+            if full_scans:
+                flagged.append(name)
+                self.stdout.write(self.style.WARNING(f'[FULL SCAN] {name}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'[ok] {name}'))
+            if options['verbosity'] > 1 or full_scans:
+                for line in plan.splitlines():
+                    self.stdout.write(f'    {line}')
+
+        if not flagged:
+            self.stdout.write(self.style.SUCCESS(f'{len(names)} hot query plan(s) use indexes.'))
+            return
+
+        message = f'{len(flagged)} hot query plan(s) use a full table scan: {", ".join(flagged)}'
+        if options['strict']:
+            raise CommandError(message)
+        self.stdout.write(self.style.WARNING(message))
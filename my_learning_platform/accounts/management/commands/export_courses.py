@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from accounts.course_io import detect_format, export_course_rows, iter_courses_csv, iter_courses_jsonl
+from accounts.models import TeacherCourse
+
+
+class Command(BaseCommand):
+    help = 'Exports courses as CSV or JSONL, in the format import_courses reads.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default='-', help="Output file, or '-' for stdout (default).")
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Defaults to the file extension, else csv.')
+        parser.add_argument('--teacher', help="Only this teacher's courses (username).")
+        parser.add_argument('--status', help='Only courses with this status.')
+
+    def handle(self, *args, **options):
+        courses = TeacherCourse.objects.all()
+        if options['teacher']:
+            courses = courses.filter(teacher_profile__user__username=options['teacher'])
+        if options['status']:
+            courses = courses.filter(status=options['status'])
+
+        path = options['output']
+        fmt = options['format'] or detect_format(path)
+        render = iter_courses_jsonl if fmt == 'jsonl' else iter_courses_csv
+        stream = self.stdout if path == '-' else open(path, 'w', newline='', encoding='utf-8')
+        try:
+            for chunk in render(export_course_rows(courses)):
+                if stream is self.stdout:
+                    self.stdout.write(chunk, ending='')
+                else:
+                    stream.write(chunk)
+        finally:
+            if stream is not self.stdout:
+                stream.close()
@@ -0,0 +1,53 @@
+import csv
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.course_io import (
+    COURSE_IO_BATCH_SIZE, CourseImportError, detect_format, import_courses, iter_course_rows,
+)
+from accounts.models import Profile
+
+
+class Command(BaseCommand):
+    help = 'Bulk-imports courses from a CSV or JSONL file (all or nothing).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV / JSONL file, or '-' for stdin.")
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Defaults to the file extension, else csv.')
+        parser.add_argument('--teacher', help="Import every course for this teacher's username (ignores the teacher column).")
+        parser.add_argument('--create-categories', action='store_true', help='Create categories that do not exist yet.')
+        parser.add_argument('--batch-size', type=int, default=COURSE_IO_BATCH_SIZE, help='Courses inserted per query.')
+
+    def handle(self, *args, **options):
+        teacher_profile = None
+        if options['teacher']:
+            try:
+                teacher_profile = Profile.objects.get(user__username=options['teacher'], user__user_type='teacher')
+            except Profile.DoesNotExist:
+                raise CommandError(f"No teacher named '{options['teacher']}'.")
+
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+        stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+        started = time.perf_counter()
+        try:
+            created = import_courses(
+                iter_course_rows(stream, fmt),
+                teacher_profile=teacher_profile,
+                create_categories=options['create_categories'],
+                batch_size=options['batch_size'],
+            )
+        except CourseImportError as e:
+            for error in e.errors:
+                self.stderr.write(error)
+            raise CommandError(str(e))
+        except csv.Error as e:
+            raise CommandError(f"Malformed CSV file: {e}")
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'Imported {created} course(s) in {elapsed:.2f}s.'))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.ledger import rebuild_ledger, verify_ledger
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds (or verifies, with --verify) the CourseRevenueSnapshot ledger from EnrolledCourse rows.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only compare the ledger with the enrollments and report mismatches; do not write anything.',
+        )
+        parser.add_argument(
+            '--course',
+            type=int,
+            action='append',
+            dest='course_ids',
+            help='Restrict to this course ID. Can be given several times.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of snapshot rows inserted per query when rebuilding.',
+        )
+
+    def handle(self, *args, **options):
+        course_ids = options['course_ids']
+
+        if options['verify']:
+            mismatches = verify_ledger(course_ids)
+            if not mismatches:
+                self.stdout.write(self.style.SUCCESS('Revenue ledger matches the enrollments.'))
+                return
+            for course_id, day, stored, expected in mismatches:
+                self.stdout.write(self.style.WARNING(
+                    f'Course {course_id} on {day}: ledger has {stored[0]} enrollments / {stored[1]}, '
+                    f'expected {expected[0]} / {expected[1]}'
+                ))
+            raise CommandError(f'{len(mismatches)} ledger row(s) out of sync. Run without --verify to rebuild.')
+
+        written = rebuild_ledger(course_ids, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Revenue ledger rebuilt: {written} snapshot row(s) written.'))
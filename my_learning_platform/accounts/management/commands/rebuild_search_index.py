@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from accounts.search import rebuild_search_index, refresh_search_index, search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the course full-text search index (PostgreSQL tsvector column or SQLite FTS5 table).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--course',
+            type=int,
+            action='append',
+            dest='course_ids',
+            help='Only re-index this course ID. Can be given several times.',
+        )
+
+    def handle(self, *args, **options):
+        backend = search_backend()
+        if backend == 'basic':
+            self.stdout.write(self.style.WARNING('No full-text index on this database; search uses icontains.'))
+            return
+
+        if options['course_ids']:
+            refresh_search_index(options['course_ids'])
+            self.stdout.write(self.style.SUCCESS(f"Re-indexed {len(options['course_ids'])} course(s) ({backend})."))
+        else:
+            rebuild_search_index()
+            self.stdout.write(self.style.SUCCESS(f'Course search index rebuilt ({backend}).'))
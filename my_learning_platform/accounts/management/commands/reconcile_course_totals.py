@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.ledger import drifted_course_totals, reconcile_course_totals
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares every course\'s enrollment_count / revenue_total with its enrollments and '
+        'rewrites the ones that drifted (only reports them with --verify).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report courses whose totals are out of sync; do not write anything.',
+        )
+        parser.add_argument(
+            '--course',
+            type=int,
+            action='append',
+            dest='course_ids',
+            help='Restrict to this course ID. Can be given several times.',
+        )
+
+    def handle(self, *args, **options):
+        course_ids = options['course_ids']
+        drifted = drifted_course_totals(course_ids) if options['verify'] else reconcile_course_totals(course_ids)
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('Course totals match the enrollments.'))
+            return
+        for course_id, stored, expected in drifted:
+            self.stdout.write(self.style.WARNING(
+                f'Course {course_id}: stored {stored[0]} enrollments / {stored[1]}, '
+                f'expected {expected[0]} / {expected[1]}'
+            ))
+        if options['verify']:
+            raise CommandError(f'{len(drifted)} course(s) out of sync. Run without --verify to fix them.')
+        self.stdout.write(self.style.SUCCESS(f'Course totals fixed for {len(drifted)} course(s).'))
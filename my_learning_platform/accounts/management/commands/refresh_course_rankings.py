@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from accounts.ranking import refresh_rankings
+
+
+class Command(BaseCommand):
+    help = (
+        'Recomputes the course popularity ranking (CourseRanking) from the enrollments of the '
+        'last RANKING_LONG_WINDOW_DAYS days and recaches the top courses. Run it periodically, '
+        'e.g. every 10 minutes from cron or the platform scheduler.'
+    )
+
+    def handle(self, *args, **options):
+        created, updated, dropped = refresh_rankings()
+        self.stdout.write(self.style.SUCCESS(
+            f'Course rankings refreshed: {created} created, {updated} updated, {dropped} dropped.'
+        ))
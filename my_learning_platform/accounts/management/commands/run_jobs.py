@@ -0,0 +1,44 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from accounts.jobs import JOB_BATCH_SIZE, requeue_stale_jobs, run_pending_jobs
+
+
+class Command(BaseCommand):
+    help = 'Runs queued background jobs (emails, ...). Keeps polling unless --once is given.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=JOB_BATCH_SIZE, help='Jobs claimed per round.')
+        parser.add_argument('--sleep', type=float, default=2.0, help='Seconds to wait when the queue is empty.')
+        parser.add_argument('--once', action='store_true', help='Run every due job, then exit.')
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        if not options['once']:
+            # Finish the current batch on SIGTERM/SIGINT instead of abandoning claimed jobs
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        total_succeeded = total_failed = 0
+        while not self.stopping:
+            close_old_connections()
+            requeue_stale_jobs()
+            succeeded, failed = run_pending_jobs(options['batch_size'])
+            total_succeeded += succeeded
+            total_failed += failed
+            if succeeded or failed:
+                self.stdout.write(f'Ran {succeeded + failed} job(s): {succeeded} succeeded, {failed} failed.')
+                continue
+            if options['once']:
+                break
+            time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Worker stopped: {total_succeeded} job(s) succeeded, {total_failed} failed.'
+        ))
+
+    def stop(self, signum, frame):
+        self.stopping = True
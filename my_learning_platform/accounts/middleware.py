@@ -0,0 +1,47 @@
+# auth_system/accounts/middleware.py
+
+import logging
+
+from django.contrib.auth.middleware import get_user
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
+
+from .models import Profile
+
+logger = logging.getLogger(__name__)
+
+
+# --- Request-Scoped Profile ---
+def get_profile(user):
+    """
+    Returns the user's profile, creating it the first time it is needed. Users loaded by
+    UsernameOrEmailBackend (session and login) or the API authentication classes carry
+    their profile through select_related, so this normally costs no query.
+    """
+    try:
+        return user.profile
+    except Profile.DoesNotExist:
+        profile, created = Profile.objects.get_or_create(user=user)
+        if created:
+            logger.info(f"Profile created for user {user.username} on first use.")
+        user.profile = profile
+        return profile
+
+
+class ProfileMiddleware(MiddlewareMixin):
+    """
+    Makes request.user.profile always available for authenticated users: the session
+    user comes with the profile in one query (UsernameOrEmailBackend.get_user) and a
+    missing profile is created once. request.user stays lazy, so requests that never
+    touch it still pay nothing. Must come after AuthenticationMiddleware.
+    """
+
+    def process_request(self, request):
+        request.user = SimpleLazyObject(lambda: _user_with_profile(request))
+
+
+def _user_with_profile(request):
+    user = get_user(request) # Cached on the request by AuthenticationMiddleware's helper
+    if user.is_authenticated:
+        get_profile(user)
+    return user
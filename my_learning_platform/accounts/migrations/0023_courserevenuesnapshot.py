@@ -0,0 +1,60 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:46
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_revenue_snapshots(apps, schema_editor):
+    # Seed the ledger from existing enrollments so reports stay correct after deploy
+    EnrolledCourse = apps.get_model('accounts', 'EnrolledCourse')
+    CourseRevenueSnapshot = apps.get_model('accounts', 'CourseRevenueSnapshot')
+
+    rows = (
+        EnrolledCourse.objects.annotate(day=TruncDate('enrolled_at'))
+        .values('course_id', 'day')
+        .annotate(enrollment_count=Count('id'), revenue=Sum('fee_paid'))
+        .order_by()
+    )
+    CourseRevenueSnapshot.objects.bulk_create(
+        (
+            CourseRevenueSnapshot(
+                course_id=row['course_id'],
+                date=row['day'],
+                enrollment_count=row['enrollment_count'],
+                revenue=row['revenue'] or Decimal('0.00'),
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0022_profile_commission_percentage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseRevenueSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Day the enrollments were made on.')),
+                ('enrollment_count', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_snapshots', to='accounts.teachercourse')),
+            ],
+            options={
+                'verbose_name': 'Course Revenue Snapshot',
+                'verbose_name_plural': 'Course Revenue Snapshots',
+                'ordering': ['-date'],
+                'unique_together': {('course', 'date')},
+            },
+        ),
+        migrations.RunPython(backfill_revenue_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0023_courserevenuesnapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrolledcourse',
+            index=models.Index(fields=['student', '-enrolled_at', '-id'], name='ec_student_enrolled_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teachercourse',
+            index=models.Index(fields=['-created_at', '-id'], name='tc_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teachercourse',
+            index=models.Index(fields=['teacher_profile', '-created_at', '-id'], name='tc_teacher_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0024_cursor_pagination_indexes'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-submitted_at'], name='cm_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['user_type'], name='user_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(condition=models.Q(('is_teacher_application_pending', True), ('is_teacher_approved', False)), fields=['-id'], name='pf_pending_application_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teachercourse',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-created_at'], name='tc_published_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teachercourse',
+            index=models.Index(condition=models.Q(('featured', True), ('status', 'published')), fields=['-created_at'], name='tc_featured_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teachercourse',
+            index=models.Index(fields=['status', '-created_at'], name='tc_status_created_idx'),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.1 on 2026-10-18 07:59
+
+import logging
+
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+# Frozen copies of the accounts.search schema and backfill as of this migration, so later
+# changes to that module cannot change what this migration creates
+FTS_TABLE = 'accounts_teachercourse_fts'
+GIN_INDEX = 'tc_search_vector_gin'
+SEARCH_CONFIG = getattr(settings, 'COURSE_SEARCH_CONFIG', 'simple')
+
+CATEGORY_NAMES_SQL = (
+    "SELECT {aggregate} FROM accounts_teachercourse_categories tcc "
+    "JOIN accounts_coursecategory cat ON cat.id = tcc.coursecategory_id "
+    "WHERE tcc.teachercourse_id = c.id"
+)
+
+
+def create_search_structures(apps, schema_editor):
+    # GIN index on PostgreSQL, FTS5 table on SQLite; both are backfilled from existing courses
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {GIN_INDEX} ON accounts_teachercourse USING GIN (search_vector)"
+            )
+            categories_sql = CATEGORY_NAMES_SQL.format(aggregate="string_agg(cat.name, ' ')")
+            cursor.execute(
+                "UPDATE accounts_teachercourse c SET search_vector = "
+                "setweight(to_tsvector(%s::regconfig, coalesce(c.title, '')), 'A') || "
+                f"setweight(to_tsvector(%s::regconfig, coalesce(({categories_sql}), '')), 'B') || "
+                "setweight(to_tsvector(%s::regconfig, coalesce(c.description, '')), 'C')",
+                [SEARCH_CONFIG, SEARCH_CONFIG, SEARCH_CONFIG],
+            )
+        elif connection.vendor == 'sqlite':
+            try:
+                cursor.execute(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(title, description, categories)"
+                )
+            except Exception as e:
+                # SQLite compiled without FTS5: search falls back to icontains
+                logger.warning(f"FTS5 unavailable, course search will use the basic backend: {e}")
+                return
+            categories_sql = CATEGORY_NAMES_SQL.format(aggregate="group_concat(cat.name, ' ')")
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description, categories) "
+                f"SELECT c.id, c.title, c.description, coalesce(({categories_sql}), '') "
+                f"FROM accounts_teachercourse c"
+            )
+
+
+def drop_search_structures(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(f"DROP INDEX IF EXISTS {GIN_INDEX}")
+        elif connection.vendor == 'sqlite':
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0025_hot_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teachercourse',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_structures, drop_search_structures),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.1 on 2026-10-18 09:40
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.crypto import salted_hmac
+
+
+# Frozen copies of accounts.payments.normalize_card_number / card_fingerprint as of this
+# migration, so later changes to that module cannot change what gets backfilled here
+def normalize_card_number(card_number):
+    return ''.join(ch for ch in str(card_number) if ch not in ' -')
+
+
+def card_fingerprint(card_number):
+    secret = getattr(settings, 'CARD_FINGERPRINT_KEY', '') or settings.SECRET_KEY
+    return salted_hmac(
+        'accounts.payments.card', normalize_card_number(card_number), secret=secret, algorithm='sha256'
+    ).hexdigest()
+
+
+def fingerprint_cards(apps, schema_editor):
+    # The plaintext numbers are dropped below, so this cannot be reversed
+    AllowedCard = apps.get_model('accounts', 'AllowedCard')
+    cards = list(AllowedCard.objects.using(schema_editor.connection.alias).only('id', 'card_number'))
+    for card in cards:
+        card.card_fingerprint = card_fingerprint(card.card_number)
+        card.card_last4 = normalize_card_number(card.card_number)[-4:]
+    AllowedCard.objects.using(schema_editor.connection.alias).bulk_update(
+        cards, ['card_fingerprint', 'card_last4'], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0028_job_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='allowedcard',
+            name='card_fingerprint',
+            field=models.CharField(editable=False, help_text='HMAC-SHA256 of the card number.', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='allowedcard',
+            name='card_last4',
+            field=models.CharField(default='', editable=False, help_text='Last four digits of the card.', max_length=4),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fingerprint_cards),
+        migrations.AlterUniqueTogether(
+            name='allowedcard',
+            unique_together=set(),
+        ),
+        migrations.RemoveField(
+            model_name='allowedcard',
+            name='card_number',
+        ),
+        migrations.AlterField(
+            model_name='allowedcard',
+            name='card_fingerprint',
+            field=models.CharField(editable=False, help_text='HMAC-SHA256 of the card number.', max_length=64, unique=True),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.1 on 2026-10-18 08:43
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_course_totals(apps, schema_editor):
+    TeacherCourse = apps.get_model('accounts', 'TeacherCourse')
+    EnrolledCourse = apps.get_model('accounts', 'EnrolledCourse')
+    enrollments = EnrolledCourse.objects.filter(course=OuterRef('pk')).order_by().values('course')
+    db = schema_editor.connection.alias
+    TeacherCourse.objects.using(db).filter(id__in=EnrolledCourse.objects.using(db).values('course')).update(
+        enrollment_count=Subquery(enrollments.annotate(count=Count('id')).values('count')),
+        revenue_total=Coalesce(
+            Subquery(enrollments.annotate(total=Sum('fee_paid')).values('total')),
+            Decimal('0.00'), output_field=models.DecimalField(max_digits=14, decimal_places=2),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0029_allowed_card_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teachercourse',
+            name='enrollment_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='teachercourse',
+            name='revenue_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, max_digits=14),
+        ),
+        migrations.RunPython(backfill_course_totals, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='teachercourse',
+            index=models.Index(condition=models.Q(('status', 'published')), fields=['-enrollment_count', '-id'], name='tc_published_popular_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-18 08:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0030_course_enrollment_totals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseRanking',
+            fields=[
+                ('course', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ranking', serialize=False, to='accounts.teachercourse')),
+                ('recent_enrollments', models.IntegerField(default=0, help_text='Enrollments in the short window (7 days by default).')),
+                ('window_enrollments', models.IntegerField(default=0, help_text='Enrollments in the long window (30 days by default).')),
+                ('score', models.FloatField(default=0)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Course Ranking',
+                'verbose_name_plural': 'Course Rankings',
+                'ordering': ['-score', 'course'],
+                'indexes': [models.Index(fields=['-score', 'course'], name='ranking_score_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,8 @@
 # auth_system/accounts/models.py
 
 from django.db import models
+from django.db.models.functions import Lower
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth.models import AbstractUser
 from django.db.models.signals import post_save
 from django.dispatch import receiver
@@ -17,6 +19,13 @@ class CustomUser(AbstractUser):
     )
     user_type = models.CharField(max_length=10, choices=USER_TYPE_CHOICES, default='student')
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['user_type'], name='user_type_idx'),
+            # Case-insensitive email login (accounts.backends.UsernameOrEmailBackend)
+            models.Index(Lower('email'), name='user_email_lower_idx'),
+        ]
+
     def __str__(self):
         return self.username
 
@@ -122,6 +131,13 @@ class Profile(models.Model):
     class Meta:
         verbose_name = "User Profile"
         verbose_name_plural = "User Profiles"
+        indexes = [
+            # Admin queue of teacher applications awaiting review (partial: pending rows only)
+            models.Index(
+                fields=['-id'], name='pf_pending_application_idx',
+                condition=models.Q(is_teacher_application_pending=True, is_teacher_approved=False),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username}'s Profile"
@@ -232,11 +248,39 @@ class TeacherCourse(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Weighted title / categories / description tsvector, maintained by accounts.search
+    # (GIN-indexed on PostgreSQL; unused on other databases)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Denormalized totals of the course's enrollments, kept in step by accounts.ledger
+    # (F() increments in the enrolling transaction); `reconcile_course_totals` fixes drift
+    enrollment_count = models.IntegerField(default=0, editable=False)
+    revenue_total = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal('0.00'), editable=False)
 
     class Meta:
         verbose_name = "Teacher Course"
         verbose_name_plural = "Teacher Courses"
         ordering = ['-created_at']
+        indexes = [
+            # Keyset (cursor) pagination of the course API lists
+            models.Index(fields=['-created_at', '-id'], name='tc_created_id_idx'),
+            models.Index(fields=['teacher_profile', '-created_at', '-id'], name='tc_teacher_created_id_idx'),
+            # Public catalog (course list / homepage), partial: published rows only
+            models.Index(
+                fields=['-created_at'], name='tc_published_created_idx',
+                condition=models.Q(status='published'),
+            ),
+            models.Index(
+                fields=['-created_at'], name='tc_featured_created_idx',
+                condition=models.Q(status='published', featured=True),
+            ),
+            # Admin / moderation filters on status
+            models.Index(fields=['status', '-created_at'], name='tc_status_created_idx'),
+            # "Most popular" listings of the public catalog
+            models.Index(
+                fields=['-enrollment_count', '-id'], name='tc_published_popular_idx',
+                condition=models.Q(status='published'),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.get_language_display()}) by {self.teacher_profile.user.username}"
@@ -258,13 +302,74 @@ class EnrolledCourse(models.Model):
         verbose_name = "Enrolled Course"
         verbose_name_plural = "Enrolled Courses"
         ordering = ['-enrolled_at']
+        indexes = [
+            # Keyset (cursor) pagination of a student's enrollments
+            models.Index(fields=['student', '-enrolled_at', '-id'], name='ec_student_enrolled_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.user.username} enrolled in {self.course.title}"
 
+# --- CourseRevenueSnapshot Model ---
+class CourseRevenueSnapshot(models.Model):
+    """
+    Materialized per-course, per-day revenue ledger. Each row holds the number of
+    current enrollments made on that day and the fees they paid, so reports can sum
+    O(days) rows instead of scanning every EnrolledCourse row.
+    Kept current by accounts.ledger; rebuild with `manage.py rebuild_revenue_ledger`.
+    """
+    course = models.ForeignKey(TeacherCourse, on_delete=models.CASCADE, related_name='revenue_snapshots')
+    date = models.DateField(help_text="Day the enrollments were made on.")
+    enrollment_count = models.IntegerField(default=0)
+    revenue = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=Decimal('0.00')
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('course', 'date')
+        verbose_name = "Course Revenue Snapshot"
+        verbose_name_plural = "Course Revenue Snapshots"
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"{self.course.title} on {self.date}: {self.enrollment_count} enrollments, {self.revenue}"
+
+# --- CourseRanking Model ---
+class CourseRanking(models.Model):
+    """
+    Popularity of a published course over sliding windows of recent enrollments: one
+    row per course with enrollments in the long window, rewritten by
+    `manage.py refresh_course_rankings` from the per-day revenue ledger (accounts.ranking).
+    """
+    course = models.OneToOneField(TeacherCourse, on_delete=models.CASCADE, primary_key=True, related_name='ranking')
+    recent_enrollments = models.IntegerField(default=0, help_text="Enrollments in the short window (7 days by default).")
+    window_enrollments = models.IntegerField(default=0, help_text="Enrollments in the long window (30 days by default).")
+    score = models.FloatField(default=0)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Course Ranking"
+        verbose_name_plural = "Course Rankings"
+        ordering = ['-score', 'course']
+        indexes = [
+            # Top-k read of the homepage
+            models.Index(fields=['-score', 'course'], name='ranking_score_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.course_id}: {self.score:g}"
+
 # --- AllowedCard Model ---
 class AllowedCard(models.Model):
-    card_number = models.CharField(max_length=255, unique=True, help_text="The card number.")
+    # Only a keyed hash of the card number is stored (see accounts.payments.card_fingerprint);
+    # assign the plain number through the card_number property.
+    card_fingerprint = models.CharField(
+        max_length=64, unique=True, editable=False, help_text="HMAC-SHA256 of the card number."
+    )
+    card_last4 = models.CharField(max_length=4, editable=False, help_text="Last four digits of the card.")
     expiry_month = models.IntegerField(
         validators=[MinValueValidator(1), MaxValueValidator(12)],
         help_text="Expiry month (1-12)"
@@ -281,10 +386,21 @@ class AllowedCard(models.Model):
     class Meta:
         verbose_name = "Allowed Card"
         verbose_name_plural = "Allowed Cards"
-        unique_together = ('card_number', 'expiry_month', 'expiry_year')
+
+    @property
+    def card_number(self):
+        # Only known on instances the number was assigned to; it is never loaded back
+        return getattr(self, '_card_number', None)
+
+    @card_number.setter
+    def card_number(self, value):
+        from .payments import card_fingerprint, normalize_card_number
+        self._card_number = value
+        self.card_fingerprint = card_fingerprint(value)
+        self.card_last4 = normalize_card_number(value)[-4:]
 
     def __str__(self):
-        return f"Card ending in {self.card_number[-4:]} (Exp: {self.expiry_month:02d}/{self.expiry_year})"
+        return f"Card ending in {self.card_last4} (Exp: {self.expiry_month:02d}/{self.expiry_year})"
     
 class ContactMessage(models.Model):
     name = models.CharField(max_length=100)
@@ -296,7 +412,49 @@ class ContactMessage(models.Model):
     class Meta:
         ordering = ['-submitted_at']
         verbose_name = "Contact Message"
+        indexes = [
+            models.Index(fields=['-submitted_at'], name='cm_submitted_idx'),
+        ]
         verbose_name_plural = "Contact Messages"
 
     def __str__(self):
-        return f"Message from {self.name} ({self.email})"
\ No newline at end of file
+        return f"Message from {self.name} ({self.email})"
+
+# --- Job Model (background queue) ---
+class Job(models.Model):
+    """
+    A unit of deferred work (e.g. sending an email) run by `manage.py run_jobs`
+    instead of inside the request. Enqueued through accounts.jobs; finished jobs are
+    deleted, jobs that used up their attempts stay behind with status 'failed'.
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('failed', 'Failed'),
+    )
+
+    name = models.CharField(max_length=100, help_text="Registered handler name (accounts.jobs).")
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(help_text="Not picked up before this time (retry backoff).")
+    locked_by = models.CharField(max_length=64, blank=True, default='', help_text="Claim token of the worker running it.")
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['run_after', 'id']
+        verbose_name = "Background Job"
+        verbose_name_plural = "Background Jobs"
+        indexes = [
+            # The worker's poll: next due pending jobs
+            models.Index(
+                fields=['run_after', 'id'], name='job_pending_due_idx',
+                condition=models.Q(status='pending'),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
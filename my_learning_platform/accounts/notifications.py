@@ -0,0 +1,127 @@
+# auth_system/accounts/notifications.py
+
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+from .jobs import enqueue_many, job_handler
+
+logger = logging.getLogger(__name__)
+
+
+# --- Email Job ---
+@job_handler('send_email', batch=True)
+def send_email_batch(payloads):
+    """
+    Sends a batch of queued emails over one SMTP connection.
+    Returns None per delivered message, or the exception it failed with.
+    """
+    errors = []
+    with get_connection() as connection:
+        for payload in payloads:
+            message = EmailMessage(
+                subject=payload['subject'],
+                body=payload['body'],
+                from_email=payload.get('from_email') or settings.DEFAULT_FROM_EMAIL,
+                to=payload['to'],
+                connection=connection,
+            )
+            try:
+                message.send()
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+    return errors
+
+
+def queue_email(subject, body, to, from_email=None):
+    """Queues an email for the background worker (sent after the transaction commits)."""
+    queue_emails([(subject, body, to)], from_email=from_email)
+
+
+def queue_emails(messages, from_email=None):
+    """Queues several (subject, body, to) emails with a single job INSERT."""
+    payloads = []
+    for subject, body, to in messages:
+        recipients = [address for address in to if address]
+        if recipients:
+            payloads.append({'subject': subject, 'body': body, 'to': recipients, 'from_email': from_email})
+    enqueue_many('send_email', payloads)
+
+
+# --- Teacher Application Workflow ---
+def _display_name(profile):
+    return profile.full_name_en or profile.full_name_ar or profile.user.username
+
+
+def _application_received_email(profile):
+    return (
+        "Your teacher application was received",
+        f"Hello {_display_name(profile)},\n\n"
+        "Thank you for applying to teach with us. Our team will review your application "
+        "and let you know the outcome by email.",
+        [profile.user.email],
+    )
+
+
+def _application_approved_email(profile):
+    return (
+        "Your teacher application was approved",
+        f"Hello {_display_name(profile)},\n\n"
+        "Your teacher application has been approved. You can now log in and publish courses.",
+        [profile.user.email],
+    )
+
+
+def _application_rejected_email(profile):
+    return (
+        "Your teacher application was not approved",
+        f"Hello {_display_name(profile)},\n\n"
+        f"Unfortunately your teacher application was not approved.\n\nReason: {profile.rejection_reason}",
+        [profile.user.email],
+    )
+
+
+def _deactivated_email(profile):
+    return (
+        "Your teacher account was deactivated",
+        f"Hello {_display_name(profile)},\n\n"
+        f"Your teacher account has been deactivated.\n\nReason: {profile.rejection_reason}",
+        [profile.user.email],
+    )
+
+
+def notify_teacher_application_received(profile):
+    queue_emails([_application_received_email(profile)])
+
+
+def notify_teacher_application_approved(profile):
+    notify_teacher_applications_approved([profile])
+
+
+def notify_teacher_applications_approved(profiles):
+    queue_emails([_application_approved_email(profile) for profile in profiles])
+
+
+def notify_teacher_application_rejected(profile):
+    notify_teacher_applications_rejected([profile])
+
+
+def notify_teacher_applications_rejected(profiles):
+    queue_emails([_application_rejected_email(profile) for profile in profiles])
+
+
+def notify_teacher_deactivated(profile):
+    queue_emails([_deactivated_email(profile)])
+
+
+# --- Contact Form ---
+def notify_contact_message(contact_message):
+    """Forwards a contact form submission to the site admins (settings.ADMINS)."""
+    queue_email(
+        f"New contact message from {contact_message.name}",
+        f"From: {contact_message.name} <{contact_message.email}>\n"
+        f"Phone: {contact_message.phone_number or '-'}\n\n{contact_message.message}",
+        [email for _, email in settings.ADMINS],
+    )
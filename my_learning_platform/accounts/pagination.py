@@ -0,0 +1,81 @@
+# auth_system/accounts/pagination.py
+
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+# Above this many (estimated) rows, admin changelists show the planner's estimate instead of COUNT(*)
+APPROXIMATE_COUNT_THRESHOLD = getattr(settings, 'ADMIN_APPROXIMATE_COUNT_THRESHOLD', 100000)
+
+
+# --- Cursor Pagination for API list endpoints ---
+# Cursor (keyset) pagination keeps every page a single indexed range scan, however deep
+# the client pages, and stays stable while rows are inserted. Each ordering ends with the
+# primary key as a tie-breaker and is backed by a matching composite index on the model.
+class BaseCursorPagination(CursorPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class TeacherCourseCursorPagination(BaseCursorPagination):
+    ordering = ('-created_at', '-id')
+
+
+class EnrolledCourseCursorPagination(BaseCursorPagination):
+    ordering = ('-enrolled_at', '-id')
+
+
+class ProfileCursorPagination(BaseCursorPagination):
+    ordering = ('-id',)
+
+
+# --- Page Number Pagination for ranked search results ---
+# Search results are ordered by relevance rank, which has no stable keyset to
+# cursor on; they are capped (accounts.search.SEARCH_MAX_RESULTS) so page numbers stay cheap.
+class CourseSearchPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+# --- Approximate counts for large admin changelists ---
+class ApproximateCountPaginator(Paginator):
+    """
+    Paginator whose count comes from PostgreSQL statistics when the result is large:
+    pg_class.reltuples for an unfiltered table, the planner's row estimate (EXPLAIN)
+    for a filtered queryset. Results estimated below APPROXIMATE_COUNT_THRESHOLD, and
+    every queryset on other databases, are counted exactly. Deep pages past the real
+    end of an overestimated result simply come back empty.
+    """
+    threshold = APPROXIMATE_COUNT_THRESHOLD
+
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query') and connections[self.object_list.db].vendor == 'postgresql':
+            estimate = self._estimate(self.object_list.order_by())
+            if estimate is not None and estimate >= self.threshold:
+                return estimate
+        return super().count
+
+    def _estimate(self, queryset):
+        connection = connections[queryset.db]
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+                # -1 until the table is first vacuumed / analyzed
+                return row[0] if row and row[0] >= 0 else None
+            sql, params = queryset.query.sql_with_params()
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
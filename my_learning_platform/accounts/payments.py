@@ -0,0 +1,119 @@
+# auth_system/accounts/payments.py
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils.crypto import salted_hmac
+from django.utils.module_loading import import_string
+
+from .ledger import record_enrollment
+from .models import AllowedCard, EnrolledCourse
+
+logger = logging.getLogger(__name__)
+
+PAYMENT_GATEWAY = getattr(settings, 'PAYMENT_GATEWAY', 'accounts.payments.AllowedCardGateway')
+
+
+class PaymentDeclined(Exception):
+    """The gateway refused the charge."""
+
+
+class AlreadyEnrolled(Exception):
+    """The student already holds an enrollment for the course."""
+
+
+# --- Card Fingerprints ---
+def normalize_card_number(card_number):
+    return ''.join(ch for ch in str(card_number) if ch not in ' -')
+
+
+def card_fingerprint(card_number):
+    """
+    Keyed HMAC-SHA256 of the card number as 64 hex characters. Only this and the last
+    four digits are stored, so the index stays fixed-width and holds no card numbers.
+    Changing CARD_FINGERPRINT_KEY (or SECRET_KEY when it is unset) orphans every stored
+    fingerprint: the allowed cards must then be re-entered.
+    """
+    secret = getattr(settings, 'CARD_FINGERPRINT_KEY', '') or settings.SECRET_KEY
+    return salted_hmac(
+        'accounts.payments.card', normalize_card_number(card_number), secret=secret, algorithm='sha256'
+    ).hexdigest()
+
+
+# --- Gateways ---
+class PaymentGateway(ABC):
+    """
+    Base class of payment gateways. authorize() returns a reference for the charge or
+    raises PaymentDeclined; void() releases an authorization that was not used (a no-op
+    by default, for gateways whose authorizations lapse on their own).
+    """
+
+    @abstractmethod
+    def authorize(self, card_number, expiry_month, expiry_year, amount, description=''):
+        ...
+
+    def void(self, reference):
+        pass
+
+
+class AllowedCardGateway(PaymentGateway):
+    """Default gateway: accepts the cards listed in AllowedCard (one unique-index lookup)."""
+
+    def authorize(self, card_number, expiry_month, expiry_year, amount, description=''):
+        allowed = AllowedCard.objects.filter(
+            card_fingerprint=card_fingerprint(card_number),
+            expiry_month=expiry_month,
+            expiry_year=expiry_year,
+        ).exists()
+        if not allowed:
+            raise PaymentDeclined("Card details do not match any allowed method.")
+        return f'local-{time.time_ns()}'
+
+
+class StubGateway(PaymentGateway):
+    """
+    Accepts every card without touching the database, after PAYMENT_STUB_LATENCY_MS of
+    simulated network time, so checkout throughput can be load tested in isolation.
+    """
+
+    def authorize(self, card_number, expiry_month, expiry_year, amount, description=''):
+        latency = getattr(settings, 'PAYMENT_STUB_LATENCY_MS', 0)
+        if latency:
+            time.sleep(latency / 1000)
+        return f'stub-{time.time_ns()}'
+
+
+@lru_cache(maxsize=None)
+def get_payment_gateway(path=None):
+    """Returns the (shared) gateway instance named by path or settings.PAYMENT_GATEWAY."""
+    return import_string(path or PAYMENT_GATEWAY)()
+
+
+# --- Checkout ---
+def enroll_with_payment(profile, course, card_number, expiry_month, expiry_year, gateway=None):
+    """
+    Authorizes the course price, then creates the enrollment and its ledger entry in one
+    transaction. There is no up-front "already enrolled?" query or row lock: a second
+    enrollment trips the (student, course) unique constraint, the authorization is voided
+    and AlreadyEnrolled is raised. Raises PaymentDeclined when the gateway refuses.
+    """
+    gateway = gateway or get_payment_gateway()
+    reference = gateway.authorize(
+        card_number, expiry_month, expiry_year, course.price, description=f"Course {course.id}"
+    )
+    try:
+        with transaction.atomic():
+            enrollment = EnrolledCourse.objects.create(student=profile, course=course, fee_paid=course.price)
+            record_enrollment(enrollment)
+    except IntegrityError:
+        gateway.void(reference)
+        raise AlreadyEnrolled(f"Profile {profile.id} is already enrolled in course {course.id}.")
+    except Exception:
+        gateway.void(reference)
+        raise
+    logger.info(f"Profile {profile.id} enrolled in course {course.id} (payment {reference}).")
+    return enrollment
@@ -0,0 +1,139 @@
+# auth_system/accounts/ranking.py
+
+import hashlib
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+from .catalog import catalog_cache_enabled, get_cached_catalog_entry, published_courses_queryset
+from .models import CourseRanking, CourseRevenueSnapshot
+
+logger = logging.getLogger(__name__)
+
+RANKING_SHORT_WINDOW_DAYS = getattr(settings, 'RANKING_SHORT_WINDOW_DAYS', 7)
+RANKING_LONG_WINDOW_DAYS = getattr(settings, 'RANKING_LONG_WINDOW_DAYS', 30)
+# Extra weight of an enrollment in the short window (it also counts once in the long one)
+RANKING_RECENT_WEIGHT = getattr(settings, 'RANKING_RECENT_WEIGHT', 3)
+# Course ids kept in the cached top list, i.e. the largest k that can be served
+RANKING_TOP_SIZE = getattr(settings, 'RANKING_TOP_SIZE', 50)
+RANKING_HOMEPAGE_SIZE = getattr(settings, 'RANKING_HOMEPAGE_SIZE', 6)
+# The refresh usually runs in its own process (cron), so its cache write may never reach
+# the web workers' caches; a finite timeout bounds how long they serve an old ranking
+RANKING_CACHE_TIMEOUT = getattr(settings, 'RANKING_CACHE_TIMEOUT', 600)
+
+RANKING_TOP_KEY = 'ranking:top'
+
+
+# --- Scoring ---
+def compute_rankings(today=None):
+    """
+    Scores published courses from the per-day revenue ledger rows of the long window,
+    which record_enrollment() already keeps current: at most one row per course and day
+    is read, never the individual enrollments.
+    Returns {course_id: (recent_enrollments, window_enrollments, score)} for scores > 0.
+    """
+    today = today or timezone.localdate()
+    recent_start = today - timedelta(days=RANKING_SHORT_WINDOW_DAYS - 1)
+    window_start = today - timedelta(days=RANKING_LONG_WINDOW_DAYS - 1)
+    rows = (
+        CourseRevenueSnapshot.objects.filter(date__gte=window_start, date__lte=today, course__status='published')
+        .values('course_id')
+        .annotate(
+            recent=Sum('enrollment_count', filter=Q(date__gte=recent_start)),
+            window=Sum('enrollment_count'),
+        )
+        .order_by()
+    )
+
+    rankings = {}
+    for row in rows:
+        recent, window = row['recent'] or 0, row['window'] or 0
+        score = float(window + RANKING_RECENT_WEIGHT * recent)
+        if score > 0:
+            rankings[row['course_id']] = (recent, window, score)
+    return rankings
+
+
+@transaction.atomic
+def refresh_rankings(today=None):
+    """
+    Brings the CourseRanking table in line with compute_rankings(), writing only the rows
+    that changed, then (after commit) recaches the top course ids.
+    Returns (created, updated, deleted) row counts.
+    """
+    now = timezone.now()
+    rankings = compute_rankings(today)
+    current = {
+        course_id: (recent, window, score)
+        for course_id, recent, window, score in CourseRanking.objects.values_list(
+            'course_id', 'recent_enrollments', 'window_enrollments', 'score'
+        )
+    }
+
+    dropped = set(current) - set(rankings)
+    if dropped:
+        CourseRanking.objects.filter(course_id__in=dropped).delete()
+
+    created, updated = [], []
+    for course_id, (recent, window, score) in rankings.items():
+        row = CourseRanking(
+            course_id=course_id, recent_enrollments=recent, window_enrollments=window, score=score, computed_at=now,
+        )
+        if course_id not in current:
+            created.append(row)
+        elif current[course_id] != (recent, window, score):
+            updated.append(row)
+    CourseRanking.objects.bulk_create(created, batch_size=1000)
+    CourseRanking.objects.bulk_update(
+        updated, ['recent_enrollments', 'window_enrollments', 'score', 'computed_at'], batch_size=1000
+    )
+
+    transaction.on_commit(cache_top_course_ids)
+    logger.info(f"Course rankings refreshed: {len(created)} created, {len(updated)} updated, {len(dropped)} dropped.")
+    return len(created), len(updated), len(dropped)
+
+
+# --- Serving ---
+def _top_course_ids(k=RANKING_TOP_SIZE):
+    # One index range scan
+    return list(CourseRanking.objects.order_by('-score', 'course_id').values_list('course_id', flat=True)[:k])
+
+
+def cache_top_course_ids():
+    """Stores the RANKING_TOP_SIZE best course ids in the cache."""
+    ids = _top_course_ids()
+    cache.set(RANKING_TOP_KEY, ids, RANKING_CACHE_TIMEOUT)
+    return ids
+
+
+def get_top_course_ids(k=RANKING_HOMEPAGE_SIZE):
+    if not catalog_cache_enabled():
+        # Same switch as the catalog: a per-worker copy would miss other workers' refreshes
+        return _top_course_ids(k)
+    ids = cache.get(RANKING_TOP_KEY)
+    if ids is None:
+        ids = cache_top_course_ids()
+    return ids[:k]
+
+
+def get_trending_courses(k=RANKING_HOMEPAGE_SIZE):
+    """
+    The k highest ranked published courses, best first (homepage). Cached as a catalog
+    entry named after the ranked ids, so a refresh that reorders the ranking and any
+    course change (catalog invalidation) both lead to a fresh entry; a hit costs O(k).
+    """
+    ids = get_top_course_ids(k)
+    if not ids:
+        return []
+
+    def build():
+        courses = published_courses_queryset().in_bulk(ids)
+        return [courses[course_id] for course_id in ids if course_id in courses]
+
+    digest = hashlib.sha1(','.join(map(str, ids)).encode()).hexdigest()[:16]
+    return get_cached_catalog_entry(f'trending:{digest}', build)
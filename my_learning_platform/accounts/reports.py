@@ -0,0 +1,152 @@
+# auth_system/accounts/reports.py
+
+import csv
+from decimal import Decimal
+
+from django.db.models import DecimalField, ExpressionWrapper, F, Value
+
+from .models import TeacherCourse, EnrolledCourse
+
+# Money columns in this app are DecimalField(max_digits=10, decimal_places=2);
+# sums across many enrollments need a little more headroom.
+MONEY_FIELD = DecimalField(max_digits=14, decimal_places=2)
+RATE_FIELD = DecimalField(max_digits=7, decimal_places=4)
+
+# Single-course report: rows per HTML page and rows fetched per round trip for CSV export
+ENROLLMENT_PAGE_SIZE = 50
+ENROLLMENT_CSV_CHUNK_SIZE = 2000
+ENROLLMENT_CSV_HEADER = ('Student Username', 'Full Name', 'Fee Paid', 'Enrolled On')
+
+
+def get_commission_rate(teacher_profile):
+    """
+    Returns the teacher's commission as a Decimal rate (e.g. 5.00% -> 0.05).
+    """
+    percentage = teacher_profile.commission_percentage
+    if percentage is None:
+        percentage = Decimal('0.00')
+    return Decimal(str(percentage)) / Decimal('100')
+
+
+def course_summary_queryset(teacher_profile):
+    """
+    Annotated queryset with one row per course of the given teacher that has at
+    least one enrollment. Student count and total fees are the course's denormalized
+    totals (enrollment_count / revenue_total); commission and profit are computed by
+    the database, so the whole summary is one query with no join or GROUP BY.
+    """
+    commission_rate = Value(get_commission_rate(teacher_profile), output_field=RATE_FIELD)
+
+    return (
+        TeacherCourse.objects.filter(teacher_profile=teacher_profile, enrollment_count__gt=0)
+        .annotate(
+            num_students=F('enrollment_count'),
+            total_fees=ExpressionWrapper(F('revenue_total'), output_field=MONEY_FIELD),
+        )
+        .annotate(
+            commission_value=ExpressionWrapper(F('total_fees') * commission_rate, output_field=MONEY_FIELD),
+        )
+        .annotate(
+            profit=ExpressionWrapper(F('total_fees') - F('commission_value'), output_field=MONEY_FIELD),
+        )
+        .order_by('title')
+    )
+
+
+def build_course_summary(teacher_profile):
+    """
+    Builds the per-course summary used by the teacher reports page and API.
+    Returns a list of dicts; evaluating it costs exactly one query.
+    """
+    rows = course_summary_queryset(teacher_profile).values(
+        'id', 'title', 'num_students', 'total_fees', 'commission_value', 'profit',
+    )
+    return [
+        {
+            'course_id': row['id'],
+            'course_title': row['title'],
+            'total_students': row['num_students'],
+            'total_fees_collected': row['total_fees'],
+            'commission_rate': teacher_profile.commission_percentage,
+            'commission_value': row['commission_value'],
+            'profit': row['profit'],
+        }
+        for row in rows
+    ]
+
+
+# --- Single Course Enrollment Report ---
+def course_enrollment_totals(course):
+    """
+    Student count and total fees for one course, read fresh from the course's
+    denormalized totals in a single query.
+    """
+    totals = TeacherCourse.objects.filter(pk=course.pk).values('enrollment_count', 'revenue_total').first()
+    if totals is None:
+        return {'total_students': 0, 'total_fees': Decimal('0.00')}
+    return {'total_students': totals['enrollment_count'], 'total_fees': totals['revenue_total']}
+
+
+def _course_enrollment_rows(course):
+    # Keyed on the student's username: it is unique and a student enrolls in a course
+    # only once, so it is a stable keyset cursor for this queryset.
+    return (
+        EnrolledCourse.objects.filter(course=course)
+        .order_by('student__user__username')
+        .values_list(
+            'student__user__username', 'student__full_name_en', 'student__full_name_ar',
+            'fee_paid', 'enrolled_at',
+        )
+    )
+
+
+def _enrollment_row_to_dict(row):
+    username, full_name_en, full_name_ar, fee_paid, enrolled_at = row
+    return {
+        'username': username,
+        'full_name': full_name_en or full_name_ar,
+        'fee_paid': fee_paid,
+        'enrolled_at': enrolled_at,
+    }
+
+
+def course_enrollment_page(course, after=None, page_size=ENROLLMENT_PAGE_SIZE):
+    """
+    Returns one page of enrolled students ordered by username, plus the cursor for the
+    next page (None on the last page). `after` is the cursor returned for the previous page.
+    """
+    rows = _course_enrollment_rows(course)
+    if after:
+        rows = rows.filter(student__user__username__gt=after)
+
+    # Fetch one extra row to know whether another page follows
+    page = [_enrollment_row_to_dict(row) for row in rows[:page_size + 1]]
+    next_cursor = None
+    if len(page) > page_size:
+        page = page[:page_size]
+        next_cursor = page[-1]['username']
+    return page, next_cursor
+
+
+class _Echo:
+    """File-like object whose write() hands the CSV line back instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def iter_course_enrollments_csv(course, chunk_size=ENROLLMENT_CSV_CHUNK_SIZE):
+    """
+    Yields the enrollment report of a course as CSV lines, reading rows from the
+    database in chunks so memory use stays flat for very large courses.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(ENROLLMENT_CSV_HEADER)
+    for row in _course_enrollment_rows(course).iterator(chunk_size=chunk_size):
+        data = _enrollment_row_to_dict(row)
+        yield writer.writerow([
+            data['username'],
+            data['full_name'] or '',
+            data['fee_paid'],
+            data['enrolled_at'].isoformat(),
+        ])
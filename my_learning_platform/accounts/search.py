@@ -0,0 +1,192 @@
+# auth_system/accounts/search.py
+
+import logging
+import re
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+
+from .models import TeacherCourse
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration used for the PostgreSQL tsvector. 'simple' does no stemming,
+# which suits a catalog with courses in several languages (see TeacherCourse.LANGUAGE_CHOICES).
+SEARCH_CONFIG = getattr(settings, 'COURSE_SEARCH_CONFIG', 'simple')
+SEARCH_MAX_RESULTS = 1000
+
+FTS_TABLE = 'accounts_teachercourse_fts'
+
+# Category names of a course, space separated (correlated subquery, one row per course)
+_CATEGORY_NAMES_SQL = {
+    'postgresql': (
+        "SELECT string_agg(cat.name, ' ') FROM accounts_teachercourse_categories tcc "
+        "JOIN accounts_coursecategory cat ON cat.id = tcc.coursecategory_id "
+        "WHERE tcc.teachercourse_id = c.id"
+    ),
+    'sqlite': (
+        "SELECT group_concat(cat.name, ' ') FROM accounts_teachercourse_categories tcc "
+        "JOIN accounts_coursecategory cat ON cat.id = tcc.coursecategory_id "
+        "WHERE tcc.teachercourse_id = c.id"
+    ),
+}
+
+
+# --- Backend Detection ---
+def search_backend(using=DEFAULT_DB_ALIAS):
+    """
+    Returns 'postgresql' (stored tsvector + GIN index), 'sqlite' (FTS5 table) or
+    'basic' (icontains fallback, e.g. a SQLite build without FTS5).
+    """
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        return 'postgresql'
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+            if cursor.fetchone():
+                return 'sqlite'
+    return 'basic'
+
+
+# --- Index Maintenance ---
+def _refresh(course_ids=None, using=DEFAULT_DB_ALIAS):
+    backend = search_backend(using)
+    if backend == 'basic':
+        return
+
+    where, params = '', []
+    if course_ids is not None:
+        course_ids = list(course_ids)
+        if not course_ids:
+            return
+        where = f" WHERE c.id IN ({', '.join(['%s'] * len(course_ids))})"
+        params = course_ids
+
+    categories_sql = _CATEGORY_NAMES_SQL[backend]
+    with connections[using].cursor() as cursor:
+        if backend == 'postgresql':
+            # Weights: title A, category names B, description C (used by SearchRank)
+            cursor.execute(
+                "UPDATE accounts_teachercourse c SET search_vector = "
+                "setweight(to_tsvector(%s::regconfig, coalesce(c.title, '')), 'A') || "
+                f"setweight(to_tsvector(%s::regconfig, coalesce(({categories_sql}), '')), 'B') || "
+                "setweight(to_tsvector(%s::regconfig, coalesce(c.description, '')), 'C')" + where,
+                [SEARCH_CONFIG, SEARCH_CONFIG, SEARCH_CONFIG] + params,
+            )
+        else:
+            delete_where = where.replace('c.id', 'rowid')
+            cursor.execute(f"DELETE FROM {FTS_TABLE}" + delete_where, params)
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, description, categories) "
+                f"SELECT c.id, c.title, c.description, coalesce(({categories_sql}), '') "
+                f"FROM accounts_teachercourse c" + where,
+                params,
+            )
+
+
+def refresh_search_index(course_ids, using=DEFAULT_DB_ALIAS):
+    """Re-indexes the given courses (deleted ones are dropped from the index)."""
+    _refresh(course_ids, using=using)
+
+
+def rebuild_search_index(using=DEFAULT_DB_ALIAS):
+    """Re-indexes every course."""
+    _refresh(None, using=using)
+    logger.info("Course search index rebuilt.")
+
+
+def schedule_search_index_refresh(course_ids):
+    """
+    Refreshes the index once the current transaction commits, so it sees the
+    committed title / description / categories (and nothing on rollback).
+    """
+    course_ids = list(course_ids)
+    if course_ids:
+        transaction.on_commit(lambda: refresh_search_index(course_ids))
+
+
+# --- Querying ---
+def search_terms(text):
+    """Splits user input into plain word terms (drops all query syntax characters)."""
+    return re.findall(r'\w+', text.lower())
+
+
+def _postgresql_query(terms):
+    from django.contrib.postgres.search import SearchQuery
+
+    return SearchQuery(' & '.join(f'{term}:*' for term in terms), search_type='raw', config=SEARCH_CONFIG)
+
+
+def _fts5_match(terms):
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _basic_condition(terms):
+    condition = Q()
+    for term in terms:
+        condition &= Q(title__icontains=term) | Q(description__icontains=term) | Q(categories__name__icontains=term)
+    return condition
+
+
+def search_course_ids(text, published_only=True, limit=SEARCH_MAX_RESULTS):
+    """
+    Returns the ids of courses matching every term of `text` (each term also matches
+    as a word prefix), best match first, at most `limit` of them.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return []
+
+    courses = TeacherCourse.objects.all()
+    if published_only:
+        courses = courses.filter(status='published')
+
+    backend = search_backend()
+    if backend == 'postgresql':
+        from django.contrib.postgres.search import SearchRank
+
+        query = _postgresql_query(terms)
+        ranked = (
+            courses.filter(search_vector=query)
+            .annotate(rank=SearchRank(F('search_vector'), query))
+            .order_by('-rank', '-created_at')
+        )
+        return list(ranked.values_list('id', flat=True)[:limit])
+
+    if backend == 'sqlite':
+        status_filter = "AND c.status = 'published' " if published_only else ''
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            # bm25() is lower for better matches; column weights title 10, description 1, categories 5
+            cursor.execute(
+                f"SELECT c.id FROM {FTS_TABLE} JOIN accounts_teachercourse c ON c.id = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH %s {status_filter}"
+                f"ORDER BY bm25({FTS_TABLE}, 10.0, 1.0, 5.0), c.created_at DESC LIMIT %s",
+                [_fts5_match(terms), limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    matches = courses.filter(_basic_condition(terms)).distinct().order_by('-created_at')
+    return list(matches.values_list('id', flat=True)[:limit])
+
+
+def filter_matching_courses(queryset, text):
+    """
+    Narrows a TeacherCourse queryset to the courses matching `text`, unranked and
+    uncapped (the match stays a subquery, no id list is built), e.g. for the admin
+    changelist, which orders and paginates on its own.
+    """
+    terms = search_terms(text)
+    if not terms:
+        return queryset.none()
+
+    backend = search_backend()
+    if backend == 'postgresql':
+        return queryset.filter(search_vector=_postgresql_query(terms))
+    if backend == 'sqlite':
+        return queryset.filter(
+            id__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [_fts5_match(terms)])
+        )
+    return queryset.filter(id__in=TeacherCourse.objects.filter(_basic_condition(terms)).values('id'))
@@ -8,6 +8,9 @@ from django.core.exceptions import ValidationError
 from decimal import Decimal # Ensure Decimal is imported for price/commission fields
 
 from .models import Profile, CourseCategory, CourseLevel, TeacherCourse, EnrolledCourse # Import relevant models
+from .facets import LANGUAGE_KEYS, PRICE_RANGE_KEYS
+from .applications import BULK_APPLICATION_LIMIT
+from .courses import apply_changed_fields, save_course_changes
 
 User = get_user_model() # This will now be your CustomUser
 
@@ -153,6 +156,8 @@ class ProfileSerializer(serializers.ModelSerializer):
             'is_teacher_application_pending', 'is_teacher_approved',
             'commission_percentage', # Only admins should set commission
         )
+        # Related rows needed to serialize a profile (applied by SerializerQuerysetOptimizationMixin)
+        select_related_fields = ('user',)
         # You might also want to explicitly add read_only=True for approval/rejection fields
         # if they are only managed by admins
 
@@ -175,14 +180,41 @@ class CourseLevelSerializer(serializers.ModelSerializer):
         model = CourseLevel
         fields = '__all__'
 
+class BulkManyRelatedField(serializers.ManyRelatedField):
+    """
+    ManyRelatedField that resolves all submitted primary keys with one query
+    (PrimaryKeyRelatedField(many=True) runs one query per id).
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        pk_field = self.child_relation.get_queryset().model._meta.pk
+        pks = []
+        for item in data:
+            try:
+                pks.append(pk_field.to_python(item))
+            except (TypeError, ValueError, ValidationError):
+                self.child_relation.fail('incorrect_type', data_type=type(item).__name__)
+        objects = self.child_relation.get_queryset().in_bulk(pks)
+        for pk in pks:
+            if pk not in objects:
+                self.child_relation.fail('does_not_exist', pk_value=pk)
+        return [objects[pk] for pk in dict.fromkeys(pks)]
+
+
 class TeacherCourseSerializer(serializers.ModelSerializer):
     # Display related data using their serializers
     categories = CourseCategorySerializer(many=True, read_only=True)
     level = CourseLevelSerializer(read_only=True)
 
     # For creating/updating, you might want to send category/level IDs
-    category_ids = serializers.PrimaryKeyRelatedField(
-        many=True, queryset=CourseCategory.objects.all(), write_only=True, source='categories'
+    category_ids = BulkManyRelatedField(
+        child_relation=serializers.PrimaryKeyRelatedField(queryset=CourseCategory.objects.all()),
+        write_only=True, source='categories'
     )
     level_id = serializers.PrimaryKeyRelatedField(
         queryset=CourseLevel.objects.all(), write_only=True, source='level'
@@ -197,36 +229,23 @@ class TeacherCourseSerializer(serializers.ModelSerializer):
             'category_ids', 'level_id' # Include these for write operations
         )
         read_only_fields = ('teacher_profile', 'status', 'created_at', 'updated_at') # Teacher profile is set in view
+        # Related rows needed to serialize a course (applied by SerializerQuerysetOptimizationMixin)
+        select_related_fields = ('level',)
+        prefetch_related_fields = ('categories',)
 
-    # You might want to override create/update if you need custom logic
-    # For example, to ensure the teacher_profile is set correctly in the view.
+    # Each write is a single INSERT / UPDATE of the course row (level is a plain FK column
+    # of it) plus, when categories are sent, one diff of the course <-> category links.
     def create(self, validated_data):
-        # `categories` is now handled by `category_ids` due to source
-        # `level` is handled by `level_id` due to source
         categories_data = validated_data.pop('categories', [])
-        level_data = validated_data.pop('level', None)
-
         course = TeacherCourse.objects.create(**validated_data)
         if categories_data:
-            course.categories.set(categories_data)
-        if level_data:
-            course.level = level_data
-            course.save() # Save the course again if level is updated separately
-
+            course.categories.add(*categories_data)
         return course
 
     def update(self, instance, validated_data):
         categories_data = validated_data.pop('categories', None)
-        level_data = validated_data.pop('level', None)
-
-        instance = super().update(instance, validated_data)
-
-        if categories_data is not None:
-            instance.categories.set(categories_data)
-        if level_data is not None:
-            instance.level = level_data
-            instance.save()
 
+        save_course_changes(instance, apply_changed_fields(instance, validated_data), categories_data)
         return instance
 
 
@@ -241,6 +260,45 @@ class EnrolledCourseSerializer(serializers.ModelSerializer):
         model = EnrolledCourse
         fields = ('id', 'student', 'course', 'course_title', 'course_teacher', 'enrolled_at', 'fee_paid')
         read_only_fields = ('student', 'enrolled_at', 'fee_paid') # student is set automatically, fee_paid might be from payment gateway
+        # Related rows needed to serialize an enrollment (applied by SerializerQuerysetOptimizationMixin)
+        select_related_fields = ('student__user', 'course__teacher_profile__user')
 
     # You'll likely create EnrolledCourse instances in a view after a successful payment
-    # or direct enrollment logic, not directly via this serializer's create method.
\ No newline at end of file
+    # or direct enrollment logic, not directly via this serializer's create method.
+
+# --- Bulk Teacher Application Decisions ---
+class TeacherApplicationBulkActionSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=['approve', 'reject'])
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=BULK_APPLICATION_LIMIT
+    )
+    rejection_reason = serializers.CharField(required=False, allow_blank=True)
+    commission_percentage = serializers.DecimalField(
+        max_digits=5, decimal_places=2, min_value=Decimal('0.00'), max_value=Decimal('100.00'), required=False
+    )
+
+    def validate(self, attrs):
+        if attrs['action'] == 'reject' and not (attrs.get('rejection_reason') or '').strip():
+            raise serializers.ValidationError({'rejection_reason': "Rejection reason is required when rejecting."})
+        return attrs
+
+
+# --- Teacher Report Serializers ---
+class CourseSummarySerializer(serializers.Serializer):
+    # Read-only shape of the rows produced by accounts.reports.build_course_summary
+    course_id = serializers.IntegerField()
+    course_title = serializers.CharField()
+    total_students = serializers.IntegerField()
+    total_fees_collected = serializers.DecimalField(max_digits=14, decimal_places=2)
+    commission_rate = serializers.DecimalField(max_digits=5, decimal_places=2)
+    commission_value = serializers.DecimalField(max_digits=14, decimal_places=2)
+    profit = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+# --- Course Catalog Serializers ---
+class CatalogFilterSerializer(serializers.Serializer):
+    # Query parameters of /api/catalog/; each may be repeated (?category=1&category=4)
+    category = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, default=list)
+    level = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, default=list)
+    language = serializers.ListField(child=serializers.ChoiceField(choices=LANGUAGE_KEYS), required=False, default=list)
+    price = serializers.ListField(child=serializers.ChoiceField(choices=PRICE_RANGE_KEYS), required=False, default=list)
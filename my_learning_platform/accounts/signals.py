@@ -0,0 +1,138 @@
+# auth_system/accounts/signals.py
+
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save, m2m_changed
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_cached_token, invalidate_cached_credentials_for_user
+from .catalog import invalidate_catalog
+from .courses import touch_courses
+from .ledger import record_unenrollment
+from .search import schedule_search_index_refresh
+from .models import CustomUser, Profile, TeacherCourse, CourseCategory, CourseLevel, EnrolledCourse
+
+
+# --- Course Catalog Cache Invalidation ---
+# Bulk QuerySet.update() calls do not send these signals; callers must
+# invoke invalidate_catalog() themselves (see TeacherCourseAdmin actions).
+@receiver(post_save, sender=TeacherCourse)
+@receiver(post_delete, sender=TeacherCourse)
+@receiver(post_save, sender=CourseCategory)
+@receiver(post_delete, sender=CourseCategory)
+@receiver(post_save, sender=CourseLevel)
+@receiver(post_delete, sender=CourseLevel)
+def invalidate_catalog_on_change(sender, **kwargs):
+    invalidate_catalog()
+
+
+@receiver(m2m_changed, sender=TeacherCourse.categories.through)
+def invalidate_catalog_on_categories_change(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_catalog()
+
+
+# --- Course Validators (updated_at) ---
+# Category and level names are part of a serialized course; SET_NULL on level delete
+# and the category link cascade are bulk writes that leave updated_at alone.
+@receiver(post_save, sender=CourseCategory)
+@receiver(post_save, sender=CourseLevel)
+def touch_courses_on_rename(sender, instance, created, **kwargs):
+    if not created:
+        touch_courses(instance.courses.all())
+
+
+@receiver(pre_delete, sender=CourseCategory)
+@receiver(pre_delete, sender=CourseLevel)
+def touch_courses_on_delete(sender, instance, **kwargs):
+    touch_courses(instance.courses.all())
+
+
+# The teacher's username is shown with each of their courses
+@receiver(pre_save, sender=CustomUser)
+def remember_previous_username(sender, instance, update_fields, **kwargs):
+    if instance.pk is None or (update_fields is not None and 'username' not in update_fields):
+        return
+    instance._previous_username = (
+        CustomUser.objects.filter(pk=instance.pk).values_list('username', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=CustomUser)
+def touch_courses_on_username_change(sender, instance, created, **kwargs):
+    previous = instance.__dict__.pop('_previous_username', None)
+    if previous is not None and previous != instance.username:
+        if touch_courses(TeacherCourse.objects.filter(teacher_profile__user=instance)):
+            invalidate_catalog()
+
+
+# --- Course Search Index ---
+# Columns of the course row that feed the index (category names are handled below)
+SEARCH_INDEXED_FIELDS = frozenset({'title', 'description'})
+
+
+@receiver(post_save, sender=TeacherCourse)
+def refresh_search_index_on_course_save(sender, instance, created, update_fields, **kwargs):
+    # Saves limited to other columns (price, status, ...) leave the indexed text alone
+    if created or update_fields is None or update_fields & SEARCH_INDEXED_FIELDS:
+        schedule_search_index_refresh([instance.pk])
+
+
+@receiver(post_delete, sender=TeacherCourse)
+def refresh_search_index_on_course_delete(sender, instance, **kwargs):
+    schedule_search_index_refresh([instance.pk])
+
+
+@receiver(m2m_changed, sender=TeacherCourse.categories.through)
+def refresh_search_index_on_categories_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        # course.categories.add / remove / set / clear
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            schedule_search_index_refresh([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        # category.courses.add / remove
+        schedule_search_index_refresh(pk_set)
+    elif action == 'pre_clear':
+        # category.courses.clear(): post_clear carries no pk_set, so collect the courses first
+        schedule_search_index_refresh(instance.courses.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=CourseCategory)
+def refresh_search_index_on_category_rename(sender, instance, created, **kwargs):
+    if not created:
+        schedule_search_index_refresh(instance.courses.values_list('id', flat=True))
+
+
+@receiver(pre_delete, sender=CourseCategory)
+def refresh_search_index_on_category_delete(sender, instance, **kwargs):
+    # Collected before the delete cascades to the course <-> category rows
+    schedule_search_index_refresh(instance.courses.values_list('id', flat=True))
+
+
+# --- Revenue Ledger / Course Totals ---
+# Every enrollment delete lands here: the unenroll view, the admin, and the cascades of
+# Profile / user deletion (which never go through the explicit paths).
+@receiver(post_delete, sender=EnrolledCourse)
+def record_unenrollment_on_delete(sender, instance, **kwargs):
+    record_unenrollment(instance)
+
+
+# --- Cached API Credentials (token / Basic) ---
+@receiver(post_delete, sender=Token)
+def invalidate_token_on_delete(sender, instance, **kwargs):
+    # Logout (LogoutAPIView) and user deletion both delete the token
+    invalidate_cached_token(instance.key)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_credentials_on_user_change(sender, instance, created, update_fields, **kwargs):
+    # Covers deactivation (is_active=False) and any other change to the cached user;
+    # the last_login stamp written on every login is not worth a lookup
+    if created or update_fields == frozenset({'last_login'}):
+        return
+    invalidate_cached_credentials_for_user(instance.pk)
+
+
+@receiver(post_save, sender=Profile)
+def invalidate_credentials_on_profile_change(sender, instance, **kwargs):
+    invalidate_cached_credentials_for_user(instance.user_id)
@@ -0,0 +1,52 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from accounts.ledger import record_enrollment
+from accounts.models import EnrolledCourse, Profile, TeacherCourse
+
+User = get_user_model()
+
+
+def create_teacher_profile(username='teacher1', **profile_fields):
+    user = User.objects.create_user(
+        username=username, email=f'{username}@example.com', password='password123', user_type='teacher'
+    )
+    return Profile.objects.create(user=user, is_teacher_approved=True, **profile_fields)
+
+
+def create_student_profiles(count):
+    """student0..student{count-1}, with full names 'Student 0'.."""
+    students = []
+    for i in range(count):
+        user = User.objects.create_user(username=f'student{i}', email=f'student{i}@example.com', password='password123')
+        students.append(Profile.objects.create(user=user, full_name_en=f'Student {i}'))
+    return students
+
+
+def create_course(teacher_profile, title='Python', price=Decimal('40.00'), status='published'):
+    return TeacherCourse.objects.create(
+        teacher_profile=teacher_profile, title=title, description='Description', price=price, status=status
+    )
+
+
+def enroll(student, course, fee=None):
+    """Enrolls through the ledger, as checkout does."""
+    enrollment = EnrolledCourse.objects.create(
+        student=student, course=course, fee_paid=course.price if fee is None else fee
+    )
+    record_enrollment(enrollment)
+    return enrollment
+
+
+class EnrolledCourseTestCase(TestCase):
+    """A published 40.00 course by teacher1 and three students who are not enrolled yet."""
+
+    def setUp(self):
+        self.teacher_profile = create_teacher_profile()
+        self.course = create_course(self.teacher_profile)
+        self.students = create_student_profiles(3)
+
+    def enroll(self, student, fee=None):
+        return enroll(student, self.course, fee)
@@ -0,0 +1,104 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import CourseCategory, CourseLevel, EnrolledCourse, Profile, TeacherCourse
+
+User = get_user_model()
+
+
+class AdminQueryBudgetTestCase(TestCase):
+    """
+    Changelist pages must run exactly `budget` queries whatever the number of rows.
+    Subclasses set `changelist` (admin URL name) and `budget`, and implement add_rows(count).
+    Every budget includes the session, the user (+ profile) and the two permission
+    queries of the admin sidebar.
+    """
+    changelist = None
+    budget = None
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        Profile.objects.create(user=self.admin)
+        self.client.force_login(self.admin)
+
+    def add_rows(self, count):
+        raise NotImplementedError
+
+    def changelist_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse(self.changelist), secure=True)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assert_fixed_query_count(self):
+        self.add_rows(2)
+        few = self.changelist_queries()
+        self.add_rows(10)
+        many = self.changelist_queries()
+        self.assertEqual(few, many, 'changelist queries grow with the number of rows')
+        self.assertEqual(many, self.budget)
+
+    def create_teacher(self, index):
+        user = User.objects.create_user(
+            username=f'teacher{index}', email=f'teacher{index}@example.com', password='password123', user_type='teacher'
+        )
+        return Profile.objects.create(user=user, full_name_en=f'Teacher {index}', is_teacher_approved=True)
+
+
+class CustomUserAdminQueryTest(AdminQueryBudgetTestCase):
+    changelist = 'admin:accounts_customuser_changelist'
+    # + count, page rows (+ profile)
+    budget = 6
+
+    def add_rows(self, count):
+        start = User.objects.count()
+        for index in range(start, start + count):
+            self.create_teacher(index)
+
+    def test_changelist(self):
+        self.assert_fixed_query_count()
+
+
+class TeacherCourseAdminQueryTest(AdminQueryBudgetTestCase):
+    changelist = 'admin:accounts_teachercourse_changelist'
+    # + category and level filter choices, count, page rows (+ teacher, user, level),
+    # categories prefetch, two date hierarchy queries
+    budget = 11
+
+    def add_rows(self, count):
+        level, _ = CourseLevel.objects.get_or_create(name='Beginner')
+        categories = [CourseCategory.objects.get_or_create(name=f'Category {i}')[0] for i in range(3)]
+        start = TeacherCourse.objects.count()
+        for index in range(start, start + count):
+            course = TeacherCourse.objects.create(
+                teacher_profile=self.create_teacher(index), title=f'Course {index}', description='Description',
+                price=Decimal('10.00'), level=level,
+            )
+            course.categories.set(categories[:index % 3 + 1])
+
+    def test_changelist(self):
+        self.assert_fixed_query_count()
+
+
+class EnrolledCourseAdminQueryTest(AdminQueryBudgetTestCase):
+    changelist = 'admin:accounts_enrolledcourse_changelist'
+    # + level and category filter choices, count, page rows (+ student, user, course)
+    budget = 8
+
+    def add_rows(self, count):
+        if not hasattr(self, 'course'):
+            self.course = TeacherCourse.objects.create(
+                teacher_profile=self.create_teacher(0), title='Course', description='Description', price=Decimal('10.00'),
+            )
+        start = EnrolledCourse.objects.count()
+        for index in range(start, start + count):
+            user = User.objects.create_user(username=f'student{index}', email=f'student{index}@example.com', password='password123')
+            EnrolledCourse.objects.create(student=Profile.objects.create(user=user), course=self.course, fee_paid=Decimal('10.00'))
+
+    def test_changelist(self):
+        self.assert_fixed_query_count()
@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import Profile, TeacherCourse, CourseCategory, CourseLevel, EnrolledCourse
+
+User = get_user_model()
+
+
+class SerializerQueryCountTest(TestCase):
+    """
+    List endpoints must issue the same number of queries whatever the number of rows
+    (no per-row queries for nested categories / level / related users).
+    """
+
+    def setUp(self):
+        self.teacher_user = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.student_user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        self.student_profile = Profile.objects.create(user=self.student_user)
+        self.categories = [CourseCategory.objects.create(name=f'Category {i}') for i in range(3)]
+        self.level = CourseLevel.objects.create(name='Beginner')
+        self.client = APIClient()
+
+    def create_courses(self, count):
+        for _ in range(count):
+            index = TeacherCourse.objects.count()
+            course = TeacherCourse.objects.create(
+                teacher_profile=self.teacher_profile, title=f'Course {index}', description='Description',
+                price=Decimal('10.00'), level=self.level, status='published'
+            )
+            course.categories.set(self.categories)
+            EnrolledCourse.objects.create(student=self.student_profile, course=course, fee_paid=course.price)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, secure=True)
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def assertConstantQueries(self, url):
+        self.create_courses(2)
+        small = self.count_queries(url)
+        self.create_courses(8)
+        large = self.count_queries(url)
+        self.assertEqual(small, large)
+
+    def test_teacher_course_list(self):
+        self.client.force_authenticate(user=self.teacher_user)
+        self.assertConstantQueries(reverse('api_teacher_course_list_create'))
+
+    def test_teacher_course_report(self):
+        self.client.force_authenticate(user=self.teacher_user)
+        self.assertConstantQueries(reverse('api_teacher_course_report', args=[self.teacher_profile.id]))
+
+    def test_my_enrollments(self):
+        self.client.force_authenticate(user=self.student_user)
+        self.assertConstantQueries(reverse('api_my_enrollments'))
+
+    def test_teacher_course_detail(self):
+        self.client.force_authenticate(user=self.teacher_user)
+        self.create_courses(1)
+        course = TeacherCourse.objects.get()
+
+        # profile lookup is not needed here: course + owner (joined) + categories
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('api_teacher_course_detail', args=[course.id]), secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['categories']), 3)
+        self.assertEqual(response.data['level']['name'], 'Beginner')
@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.applications import approve_teacher_applications, reject_teacher_applications
+from accounts.authentication import _credentials_version_key
+from accounts.jobs import run_pending_jobs
+from accounts.models import Job, Profile
+
+User = get_user_model()
+
+
+class BulkTeacherApplicationTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        self.student = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        self.student_profile = Profile.objects.create(user=self.student)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse('api_admin_teacher_application_bulk_status')
+
+    def create_applications(self, count, **fields):
+        profiles = []
+        for _ in range(count):
+            index = User.objects.count()
+            user = User.objects.create_user(
+                username=f'teacher{index}', email=f'teacher{index}@example.com', password='password123', user_type='teacher'
+            )
+            profiles.append(Profile.objects.create(user=user, is_teacher_application_pending=True, **fields))
+        return profiles
+
+    def test_approve_reports_per_id_results(self):
+        pending = self.create_applications(2)
+        approved = self.create_applications(1, is_teacher_approved=True)[0]
+        missing_id = max(p.id for p in pending) + 100
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.url, {
+                'action': 'approve', 'commission_percentage': '12.50',
+                'ids': [pending[0].id, pending[1].id, approved.id, self.student_profile.id, missing_id],
+            }, format='json', secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [
+            {'id': pending[0].id, 'result': 'approved'},
+            {'id': pending[1].id, 'result': 'approved'},
+            {'id': approved.id, 'result': 'already_approved'},
+            {'id': self.student_profile.id, 'result': 'not_found'},
+            {'id': missing_id, 'result': 'not_found'},
+        ])
+        profile = Profile.objects.get(id=pending[0].id)
+        self.assertTrue(profile.is_teacher_approved)
+        self.assertFalse(profile.is_teacher_application_pending)
+        self.assertEqual(profile.approved_by, self.admin)
+        self.assertEqual(profile.commission_percentage, Decimal('12.50'))
+
+        # Notifications are queued, not sent inline
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Job.objects.count(), 2)
+        run_pending_jobs()
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), sorted(p.user.email for p in pending))
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        def count_queries(profiles):
+            with CaptureQueriesContext(connection) as context:
+                approve_teacher_applications([p.id for p in profiles], self.admin)
+            return len(context.captured_queries)
+
+        self.assertEqual(count_queries(self.create_applications(2)), count_queries(self.create_applications(10)))
+
+    def test_reject_requires_reason_and_skips_approved(self):
+        pending = self.create_applications(1)[0]
+        approved = self.create_applications(1, is_teacher_approved=True)[0]
+
+        response = self.client.post(self.url, {'action': 'reject', 'ids': [pending.id]}, format='json', secure=True)
+        self.assertEqual(response.status_code, 400)
+
+        results = reject_teacher_applications([pending.id, approved.id], self.admin, 'Incomplete documents')
+        self.assertEqual(results, {pending.id: 'rejected', approved.id: 'already_approved'})
+        pending.refresh_from_db()
+        self.assertEqual((pending.rejected_by, pending.rejection_reason), (self.admin, 'Incomplete documents'))
+        approved.refresh_from_db()
+        self.assertTrue(approved.is_teacher_approved)
+
+    def test_cached_credentials_are_invalidated_on_commit(self):
+        profile = self.create_applications(1)[0]
+        version = cache.get(_credentials_version_key(profile.user_id))
+        with self.captureOnCommitCallbacks(execute=True):
+            approve_teacher_applications([profile.id], self.admin)
+        self.assertNotIn(cache.get(_credentials_version_key(profile.user_id)), (None, version))
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(user=self.student)
+        response = self.client.post(self.url, {'action': 'approve', 'ids': [1]}, format='json', secure=True)
+        self.assertEqual(response.status_code, 403)
+
+    def test_admin_action(self):
+        pending = self.create_applications(3)
+        self.client.logout()
+        self.client.force_login(self.admin)
+        response = self.client.post(reverse('admin:accounts_profile_changelist'), {
+            'action': 'approve_selected_applications',
+            '_selected_action': [p.id for p in pending],
+        }, secure=True)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Profile.objects.filter(is_teacher_approved=True).count(), 3)
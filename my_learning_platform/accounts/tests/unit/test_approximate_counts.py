@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import ContactMessage, Profile
+from accounts.pagination import ApproximateCountPaginator
+
+User = get_user_model()
+
+
+class ApproximateCountPaginatorTest(TestCase):
+
+    def setUp(self):
+        ContactMessage.objects.bulk_create([
+            ContactMessage(name=f'Sender {i}', email=f'sender{i}@example.com', message='Hello') for i in range(3)
+        ])
+
+    def test_exact_count_outside_postgresql(self):
+        with mock.patch.object(ApproximateCountPaginator, '_estimate') as estimate:
+            self.assertEqual(ApproximateCountPaginator(ContactMessage.objects.all(), 10).count, 3)
+        estimate.assert_not_called()
+
+    def test_estimate_above_threshold(self):
+        queryset = ContactMessage.objects.all()
+        with mock.patch.object(connection, 'vendor', 'postgresql'), \
+                mock.patch.object(ApproximateCountPaginator, '_estimate', return_value=2_500_000):
+            paginator = ApproximateCountPaginator(queryset, 100)
+            with self.assertNumQueries(0):
+                self.assertEqual(paginator.count, 2_500_000)
+            self.assertEqual(paginator.num_pages, 25_000)
+
+    def test_small_estimate_is_counted_exactly(self):
+        with mock.patch.object(connection, 'vendor', 'postgresql'), \
+                mock.patch.object(ApproximateCountPaginator, '_estimate', return_value=40):
+            self.assertEqual(ApproximateCountPaginator(ContactMessage.objects.all(), 10).count, 3)
+
+
+class ApproximateCountAdminTest(TestCase):
+
+    def setUp(self):
+        admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        Profile.objects.create(user=admin)
+        self.client.force_login(admin)
+        ContactMessage.objects.create(name='Sender', email='sender@example.com', message='Hello')
+        self.url = reverse('admin:accounts_contactmessage_changelist')
+
+    def counts(self, query=''):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url + query, secure=True)
+        self.assertEqual(response.status_code, 200)
+        return response, [q['sql'] for q in context.captured_queries if 'COUNT(' in q['sql']]
+
+    def test_changelist_skips_the_full_count(self):
+        response, counts = self.counts()
+        self.assertEqual(len(counts), 1)
+        self.assertIsInstance(response.context['cl'].paginator, ApproximateCountPaginator)
+
+    def test_exact_count_on_demand(self):
+        with mock.patch.object(connection, 'vendor', 'postgresql'), \
+                mock.patch.object(ApproximateCountPaginator, '_estimate', return_value=2_500_000):
+            response, _ = self.counts('?exact_count=1')
+        self.assertEqual(response.context['cl'].result_count, 1)
+        self.assertNotIsInstance(response.context['cl'].paginator, ApproximateCountPaginator)
+
+    def test_exact_count_is_kept_on_the_changelist_links(self):
+        ContactMessage.objects.bulk_create([
+            ContactMessage(name=f'Sender {i}', email=f'sender{i}@example.com', message='Hello') for i in range(150)
+        ])
+        response, _ = self.counts('?exact_count=1')
+        next_page = response.context['cl'].get_query_string({'p': 2})
+        self.assertEqual(next_page, '?exact_count=1&p=2')
+        self.assertContains(response, f'href="{next_page}"')
+
+        response, _ = self.counts()
+        self.assertNotIn('exact_count', response.context['cl'].get_query_string({'p': 1}))
@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from accounts.models import Profile, TeacherCourse, CourseCategory, CourseLevel
+
+User = get_user_model()
+
+
+class AsyncCatalogViewsTest(TestCase):
+
+    def setUp(self):
+        self.teacher_user = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.category = CourseCategory.objects.create(name='Programming')
+        self.level = CourseLevel.objects.create(name='Beginner')
+        self.courses = []
+        for index in range(3):
+            course = TeacherCourse.objects.create(
+                teacher_profile=self.teacher_profile, title=f'Course {index}', description='Description',
+                price=Decimal('10.00'), level=self.level, status='published'
+            )
+            course.categories.add(self.category)
+            self.courses.append(course)
+        self.draft = TeacherCourse.objects.create(
+            teacher_profile=self.teacher_profile, title='Draft', description='Description',
+            price=Decimal('10.00'), status='draft'
+        )
+
+    async def test_categories_and_levels(self):
+        response = await self.async_client.get(reverse('api_async_course_categories'), secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c['name'] for c in response.json()], ['Programming'])
+
+        response = await self.async_client.get(reverse('api_async_course_levels'), secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([l['name'] for l in response.json()], ['Beginner'])
+
+    async def test_catalog_list_pages_without_drafts(self):
+        url = reverse('api_async_catalog')
+        response = await self.async_client.get(url, {'page_size': 2}, secure=True)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([c['title'] for c in data['results']], ['Course 2', 'Course 1'])
+        self.assertIn('cursor=', data['next'])
+        self.assertEqual(data['results'][0]['categories'][0]['name'], 'Programming')
+
+        response = await self.async_client.get(data['next'], secure=True)
+        data = response.json()
+        self.assertEqual([c['title'] for c in data['results']], ['Course 0'])
+        self.assertIsNone(data['next'])
+
+    async def test_catalog_list_matches_the_sync_endpoint(self):
+        query = {'category': self.category.id, 'level': self.level.id, 'page_size': 2}
+        sync_data = (await self.async_client.get(reverse('api_catalog'), query, secure=True)).json()
+        async_data = (await self.async_client.get(reverse('api_async_catalog'), query, secure=True)).json()
+        self.assertEqual(async_data['results'], sync_data['results'])
+        self.assertEqual(async_data['facets'], sync_data['facets'])
+        self.assertEqual(async_data['previous'], sync_data['previous'])
+
+    async def test_catalog_list_rejects_bad_filters_and_cursors(self):
+        url = reverse('api_async_catalog')
+        response = await self.async_client.get(url, {'level': 'abc'}, secure=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('level', response.json())
+
+        response = await self.async_client.get(url, {'cursor': 'garbage'}, secure=True)
+        self.assertEqual(response.status_code, 404)
+
+    async def test_catalog_detail_matches_the_sync_endpoint(self):
+        course = self.courses[0]
+        for name in ('api_catalog_detail', 'api_async_catalog_detail'):
+            response = await self.async_client.get(reverse(name, args=[course.id]), secure=True)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()['title'], course.title)
+            self.assertEqual(response.json()['level']['name'], 'Beginner')
+
+            response = await self.async_client.get(reverse(name, args=[self.draft.id]), secure=True)
+            self.assertEqual(response.status_code, 404)
+
+    async def test_rejects_post(self):
+        response = await self.async_client.post(reverse('api_async_course_levels'), secure=True)
+        self.assertEqual(response.status_code, 405)
+
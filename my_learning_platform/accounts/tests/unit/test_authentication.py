@@ -0,0 +1,149 @@
+import base64
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import authenticate, get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from accounts.checks import check_auth_cache_is_shared
+from accounts.models import Profile
+
+User = get_user_model()
+
+
+class CachedTokenAuthenticationTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        self.profile = Profile.objects.create(user=self.user, full_name_en='Student One')
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('api_my_profile')
+
+    def get_profile(self):
+        return self.client.get(self.url, secure=True)
+
+    def test_steady_state_needs_no_auth_queries(self):
+        self.assertEqual(self.get_profile().status_code, 200)
+        # Token, user and profile all come from the cache; the view reads request.user.profile
+        with self.assertNumQueries(0):
+            response = self.get_profile()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['full_name_en'], 'Student One')
+
+    def test_profile_change_invalidates(self):
+        self.get_profile()
+        self.profile.full_name_en = 'Renamed'
+        self.profile.save()
+        self.assertEqual(self.get_profile().data['full_name_en'], 'Renamed')
+
+    def test_deactivation_invalidates(self):
+        self.get_profile()
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.get_profile().status_code, 401)
+
+    def test_logout_invalidates(self):
+        self.get_profile()
+        response = self.client.post(reverse('api_logout'), secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_profile().status_code, 401)
+
+    def test_invalid_token(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token not-a-real-token')
+        self.assertEqual(self.get_profile().status_code, 401)
+
+
+class CachedBasicAuthenticationTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        Profile.objects.create(user=self.user)
+        self.client = APIClient()
+        self.url = reverse('api_my_profile')
+
+    def get_profile(self, password='password123'):
+        credentials = base64.b64encode(f'student1:{password}'.encode()).decode()
+        return self.client.get(self.url, secure=True, HTTP_AUTHORIZATION=f'Basic {credentials}')
+
+    def test_verified_credentials_are_reused(self):
+        self.assertEqual(self.get_profile().status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_profile().status_code, 200)
+
+    def test_wrong_password_is_not_cached(self):
+        self.get_profile()
+        self.assertEqual(self.get_profile(password='wrong').status_code, 401)
+
+    def test_password_change_retires_cached_credentials(self):
+        self.get_profile()
+        self.user.set_password('new-password')
+        self.user.save()
+        self.assertEqual(self.get_profile().status_code, 401)
+        self.assertEqual(self.get_profile(password='new-password').status_code, 200)
+
+    def test_evicted_version_key_forces_a_password_check(self):
+        self.get_profile()
+        cache.delete(f'auth:basic:version:{self.user.pk}')
+        with mock.patch('rest_framework.authentication.authenticate', wraps=authenticate) as verify:
+            self.assertEqual(self.get_profile().status_code, 200)
+        verify.assert_called_once()
+
+    def test_old_password_stays_retired_after_version_eviction(self):
+        self.get_profile()
+        self.user.set_password('new-password')
+        self.user.save()
+        # Eviction (e.g. LocMemCache MAX_ENTRIES) of the bumped version key
+        cache.delete(f'auth:basic:version:{self.user.pk}')
+        self.assertEqual(self.get_profile().status_code, 401)
+
+
+class AuthCacheSettingTest(TestCase):
+    LOCMEM = 'django.core.cache.backends.locmem.LocMemCache'
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        Profile.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.user).key}')
+
+    @override_settings(AUTH_CACHE_ENABLED=False)
+    def test_disabled_cache_reads_the_token_every_time(self):
+        self.assertEqual(self.client.get(reverse('api_my_profile'), secure=True).status_code, 200)
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.client.get(reverse('api_my_profile'), secure=True).status_code, 200)
+        self.assertTrue(any('authtoken_token' in query['sql'] for query in context.captured_queries))
+
+    def test_check_rejects_a_process_local_cache_under_several_workers(self):
+        with override_settings(AUTH_CACHE_ENABLED=True, WEB_CONCURRENCY=4):
+            self.assertEqual([error.id for error in check_auth_cache_is_shared(None)], ['accounts.E001'])
+        for overrides in (
+            {'AUTH_CACHE_ENABLED': False, 'WEB_CONCURRENCY': 4},
+            {'AUTH_CACHE_ENABLED': True, 'WEB_CONCURRENCY': 1},
+            {'AUTH_CACHE_ENABLED': True, 'WEB_CONCURRENCY': 4,
+             'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://'}}},
+        ):
+            with override_settings(**overrides):
+                self.assertEqual(check_auth_cache_is_shared(None), [], overrides)
+
+
+class BenchmarkAuthCommandTest(TestCase):
+
+    def test_reports_every_scenario_and_cleans_up(self):
+        out = StringIO()
+        call_command('benchmark_auth', '--requests', '2', '--concurrency', '1', stdout=out)
+        for label in ('Basic (DRF)', 'Basic (cached credentials)', 'Token (DRF)', 'Token (cached lookup)'):
+            self.assertIn(label, out.getvalue())
+        self.assertNotIn('errors 1', out.getvalue())
+        self.assertFalse(User.objects.filter(username__startswith='benchmark-auth-').exists())
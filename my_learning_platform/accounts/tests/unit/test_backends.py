@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth import hashers
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.backends import UsernameOrEmailBackend
+from accounts.hashers import password_hashers_for_tier
+from accounts.models import Profile
+
+User = get_user_model()
+
+
+@contextmanager
+def count_hashes():
+    """
+    Counts password hash operations made through the user model, whatever the hasher:
+    check_password() (verify) and make_password() (encode, e.g. the dummy hash for
+    unknown logins). Yields a callable returning the count so far.
+    """
+    with mock.patch('django.contrib.auth.base_user.check_password', wraps=hashers.check_password) as verify, \
+            mock.patch('django.contrib.auth.base_user.make_password', wraps=hashers.make_password) as encode:
+        yield lambda: verify.call_count + encode.call_count
+
+
+# Counts must not depend on the settings module in use (e.g. DJANGO_SETTINGS_MODULE
+# pointing at the production settings and their Argon2 tier)
+fast_hashers = override_settings(PASSWORD_HASHERS=password_hashers_for_tier('fast'))
+
+
+@fast_hashers
+class UsernameOrEmailBackendTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='student1', email='Student1@Example.com', password='password123')
+        Profile.objects.create(user=self.user)
+        self.backend = UsernameOrEmailBackend()
+
+    def test_username_or_email_in_one_query_and_one_hash(self):
+        for login in ('student1', 'student1@example.com', 'STUDENT1@EXAMPLE.COM'):
+            with self.assertNumQueries(1), count_hashes() as hash_count:
+                user = self.backend.authenticate(None, username=login, password='password123')
+            self.assertEqual(user, self.user)
+            self.assertEqual(hash_count(), 1)
+
+    def test_profile_is_loaded_with_the_user(self):
+        user = self.backend.authenticate(None, username='student1', password='password123')
+        with self.assertNumQueries(0):
+            user.profile
+
+    def test_failures_hash_once(self):
+        for login, password in (('student1', 'wrong'), ('nobody@example.com', 'password123')):
+            with count_hashes() as hash_count:
+                self.assertIsNone(self.backend.authenticate(None, username=login, password=password))
+            self.assertEqual(hash_count(), 1)
+
+    def test_username_wins_over_another_users_email(self):
+        other = User.objects.create_user(username='student1@example.com', email='other@example.com', password='password456')
+        self.assertEqual(self.backend.authenticate(None, username='student1@example.com', password='password456'), other)
+
+    def test_ambiguous_email_does_not_authenticate(self):
+        User.objects.create_user(username='student2', email='STUDENT1@example.com', password='password123')
+        self.assertIsNone(self.backend.authenticate(None, username='student1@example.com', password='password123'))
+
+    def test_inactive_user_rejected(self):
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(self.backend.authenticate(None, username='student1', password='password123'))
+
+
+@fast_hashers
+class LoginAPITest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        Profile.objects.create(user=self.user)
+        self.client = APIClient()
+
+    def test_email_login_hashes_once(self):
+        with count_hashes() as hash_count:
+            response = self.client.post(
+                reverse('api_login'), {'username_or_email': 'Student1@example.com', 'password': 'password123'}, secure=True
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['username'], 'student1')
+        self.assertEqual(hash_count(), 1)
+
+    def test_invalid_credentials(self):
+        response = self.client.post(
+            reverse('api_login'), {'username_or_email': 'student1@example.com', 'password': 'wrong'}, secure=True
+        )
+        self.assertEqual(response.status_code, 401)
+
+
+class BenchmarkLoginCommandTest(TestCase):
+
+    def test_reports_every_scenario_and_cleans_up(self):
+        out = StringIO()
+        call_command('benchmark_login', '--requests', '1', '--concurrency', '1', stdout=out)
+        self.assertIn('POST /api/login/ (email)', out.getvalue())
+        self.assertNotIn('errors 1', out.getvalue())
+        self.assertFalse(User.objects.filter(username__startswith='benchmark-login-').exists())
@@ -0,0 +1,95 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.catalog import get_catalog_cache_stats, get_published_courses, get_featured_courses
+from accounts.checks import check_catalog_cache_is_shared
+from accounts.models import Profile, TeacherCourse, CourseCategory
+
+User = get_user_model()
+
+
+class CatalogCacheTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.teacher_user = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.course = TeacherCourse.objects.create(
+            teacher_profile=self.teacher_profile, title='Course A', description='Description',
+            price=Decimal('10.00'), status='published', featured=True
+        )
+
+    def test_second_lookup_is_served_from_cache(self):
+        self.assertEqual([c.id for c in get_published_courses()], [self.course.id])
+        with self.assertNumQueries(0):
+            courses = get_published_courses()
+            self.assertEqual(courses[0].teacher_profile.user.username, 'teacher1')
+
+        stats = get_catalog_cache_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+    @override_settings(CATALOG_CACHE_ENABLED=False)
+    def test_disabled_cache_reads_the_catalog_every_time(self):
+        get_published_courses()
+        with self.assertNumQueries(2): # courses (teacher and level joined), categories prefetch
+            self.assertEqual([c.id for c in get_published_courses()], [self.course.id])
+        self.assertEqual(get_catalog_cache_stats()['hits'], 0)
+
+    def test_check_rejects_a_process_local_cache_under_several_workers(self):
+        with override_settings(CATALOG_CACHE_ENABLED=True, WEB_CONCURRENCY=4):
+            self.assertEqual([error.id for error in check_catalog_cache_is_shared(None)], ['accounts.E002'])
+        for overrides in (
+            {'CATALOG_CACHE_ENABLED': False, 'WEB_CONCURRENCY': 4},
+            {'CATALOG_CACHE_ENABLED': True, 'WEB_CONCURRENCY': 1},
+            {'CATALOG_CACHE_ENABLED': True, 'WEB_CONCURRENCY': 4,
+             'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://'}}},
+        ):
+            with override_settings(**overrides):
+                self.assertEqual(check_catalog_cache_is_shared(None), [], overrides)
+
+    def test_course_save_invalidates_catalog(self):
+        get_featured_courses()
+        self.course.featured = False
+        self.course.save()
+        self.assertEqual(get_featured_courses(), [])
+
+    def test_category_change_invalidates_catalog(self):
+        get_published_courses()
+        category = CourseCategory.objects.create(name='Python')
+        self.course.categories.add(category)
+        courses = get_published_courses()
+        self.assertEqual(list(courses[0].categories.all()), [category])
+
+    def test_admin_bulk_action_invalidates_catalog(self):
+        get_published_courses()
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        self.client.force_login(admin_user)
+        response = self.client.post(
+            reverse('admin:accounts_teachercourse_changelist'),
+            {'action': 'mark_as_rejected', '_selected_action': [self.course.id]},
+            secure=True,
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(get_published_courses(), [])
+
+    def test_cache_stats_endpoint_is_admin_only(self):
+        client = APIClient()
+        url = reverse('api_admin_catalog_cache_stats')
+
+        client.force_authenticate(user=self.teacher_user)
+        self.assertEqual(client.get(url, secure=True).status_code, 403)
+
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        client.force_authenticate(user=admin_user)
+        response = client.get(url, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('hit_ratio', response.data)
@@ -0,0 +1,159 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import CourseCategory, CourseLevel, EnrolledCourse, Profile, TeacherCourse
+
+User = get_user_model()
+
+
+class ConditionalGetTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.teacher_user = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.course = TeacherCourse.objects.create(
+            teacher_profile=self.teacher_profile, title='Course A', description='Description',
+            price=Decimal('10.00'), status='published'
+        )
+        self.api_client = APIClient()
+        self.api_client.force_authenticate(user=self.teacher_user)
+
+    def assertRevalidates(self, client, url):
+        """First GET returns an ETag; replaying it gives 304 with an empty body. Returns the ETag."""
+        response = client.get(url, secure=True)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        not_modified = client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b'')
+        return etag
+
+    def test_api_course_list(self):
+        url = reverse('api_teacher_course_list_create')
+        etag = self.assertRevalidates(self.api_client, url)
+
+        self.course.title = 'Course A (updated)'
+        self.course.save()
+        response = self.api_client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        self.course.delete()
+        self.assertEqual(self.api_client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_api_course_detail(self):
+        url = reverse('api_teacher_course_detail', args=[self.course.id])
+        self.assertRevalidates(self.api_client, url)
+
+        response = self.api_client.get(url, secure=True)
+        self.assertIn('Last-Modified', response)
+        not_modified = self.api_client.get(url, secure=True, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_admin_status_action_changes_the_etags(self):
+        self.course.status = 'approved'
+        self.course.save()
+        detail_url = reverse('api_teacher_course_detail', args=[self.course.id])
+        list_url = reverse('api_teacher_course_list_create')
+        detail_etag = self.assertRevalidates(self.api_client, detail_url)
+        list_etag = self.assertRevalidates(self.api_client, list_url)
+
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        Profile.objects.create(user=admin_user)
+        self.client.force_login(admin_user)
+        response = self.client.post(reverse('admin:accounts_teachercourse_changelist'), {
+            'action': 'mark_as_published', '_selected_action': [self.course.id],
+        }, secure=True)
+        self.assertEqual(response.status_code, 302)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.status, 'published')
+
+        response = self.api_client.get(detail_url, secure=True, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'published')
+        self.assertEqual(self.api_client.get(list_url, secure=True, HTTP_IF_NONE_MATCH=list_etag).status_code, 200)
+
+    def test_category_and_level_renames_change_the_etag(self):
+        category = CourseCategory.objects.create(name='Programming')
+        self.course.level = CourseLevel.objects.create(name='Beginner')
+        self.course.save()
+        self.course.categories.add(category)
+        url = reverse('api_teacher_course_detail', args=[self.course.id])
+
+        for related in (category, self.course.level):
+            etag = self.assertRevalidates(self.api_client, url)
+            related.name += ' (renamed)'
+            related.save()
+            self.assertEqual(self.api_client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_api_etag_differs_per_user(self):
+        url = reverse('api_teacher_course_list_create')
+        etag = self.api_client.get(url, secure=True)['ETag']
+
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        self.api_client.force_authenticate(user=admin_user)
+        self.assertEqual(self.api_client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_course_detail_page(self):
+        url = reverse('course_detail', args=[self.course.id])
+        etag = self.assertRevalidates(self.client, url)
+
+        # Enrolling changes what the page shows to this student
+        student_user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        student_profile = Profile.objects.create(user=student_user)
+        self.client.force_login(student_user)
+        etag = self.assertRevalidates(self.client, url)
+        EnrolledCourse.objects.create(student=student_profile, course=self.course, fee_paid=self.course.price)
+        self.assertEqual(self.client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_course_list_page(self):
+        url = reverse('courses')
+        etag = self.assertRevalidates(self.client, url)
+
+        TeacherCourse.objects.create(
+            teacher_profile=self.teacher_profile, title='Course B', description='Description',
+            price=Decimal('20.00'), status='published'
+        )
+        self.assertEqual(self.client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_course_list_page_tracks_the_teacher_and_the_viewer(self):
+        url = reverse('courses')
+        self.client.force_login(self.teacher_user)
+        self.teacher_profile.is_teacher_approved = False
+        self.teacher_profile.save()
+        etag = self.assertRevalidates(self.client, url)
+
+        # Approval changes the teacher's navigation
+        self.teacher_profile.is_teacher_approved = True
+        self.teacher_profile.save()
+        response = self.client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        # The teacher's username is shown in the navigation and next to each course
+        self.teacher_user.username = 'renamed-teacher'
+        self.teacher_user.save()
+        self.client.force_login(self.teacher_user)
+        response = self.client.get(url, secure=True, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'renamed-teacher')
+
+    def test_username_change_moves_the_course_validators(self):
+        updated_at = self.course.updated_at
+        self.teacher_user.last_name = 'Unrelated'
+        self.teacher_user.save()
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.updated_at, updated_at)
+
+        self.teacher_user.username = 'renamed-teacher'
+        self.teacher_user.save(update_fields=['username'])
+        self.course.refresh_from_db()
+        self.assertGreater(self.course.updated_at, updated_at)
@@ -0,0 +1,207 @@
+import io
+import json
+import os
+import tempfile
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.course_io import (
+    CourseImportError, export_course_rows, import_courses, iter_course_rows, iter_courses_csv,
+)
+from accounts.models import Profile, TeacherCourse, CourseCategory, CourseLevel
+
+User = get_user_model()
+
+CSV_HEADER = 'teacher,title,description,price,language,level,categories,status,featured,video_trailer_url\n'
+
+
+class CourseImportTest(TestCase):
+
+    def setUp(self):
+        self.teacher_user = User.objects.create_user(
+            username='partner', email='partner@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.level = CourseLevel.objects.create(name='Beginner')
+        self.python = CourseCategory.objects.create(name='Python')
+        self.data = CourseCategory.objects.create(name='Data')
+
+    def csv_rows(self, *lines):
+        return iter_course_rows(io.StringIO(CSV_HEADER + ''.join(line + '\n' for line in lines)))
+
+    def test_import_uses_a_constant_number_of_queries(self):
+        lines = [f'partner,Course {i},Desc,19.99,en,Beginner,Python|data,published,true,' for i in range(30)]
+        # savepoint, lookups (levels, categories, teachers), courses, category links, search index (3)
+        with self.assertNumQueries(10):
+            created = import_courses(self.csv_rows(*lines))
+        self.assertEqual(created, 30)
+
+        course = TeacherCourse.objects.get(title='Course 7')
+        self.assertEqual(course.teacher_profile, self.teacher_profile)
+        self.assertEqual(course.level, self.level)
+        self.assertEqual(course.price, Decimal('19.99'))
+        self.assertTrue(course.featured)
+        self.assertEqual({c.name for c in course.categories.all()}, {'Python', 'Data'})
+        # Columns the file does not carry get the model defaults
+        self.assertIsNotNone(course.created_at)
+        self.assertIsNotNone(course.updated_at)
+        self.assertEqual((course.enrollment_count, course.revenue_total), (0, Decimal('0.00')))
+
+    def test_invalid_rows_import_nothing(self):
+        rows = self.csv_rows(
+            'partner,Good,Desc,10,en,,Python,draft,,',
+            'nobody,Bad teacher,Desc,10,en,,,draft,,',
+            'partner,Bad price,Desc,abc,en,,,draft,,',
+            'partner,Bad category,Desc,10,en,,Cooking,draft,,',
+        )
+        with self.assertRaises(CourseImportError) as raised:
+            import_courses(rows)
+        self.assertEqual(raised.exception.errors, [
+            "line 3: unknown teacher 'nobody'",
+            "line 4: invalid price 'abc'",
+            "line 5: unknown category 'Cooking'",
+        ])
+        self.assertFalse(TeacherCourse.objects.exists())
+
+    def test_invalid_prices(self):
+        rows = self.csv_rows(
+            'partner,NaN,Desc,NaN,en,,,draft,,',
+            'partner,Infinite,Desc,Infinity,en,,,draft,,',
+            'partner,Too many digits,Desc,1e20,en,,,draft,,',
+            'partner,Negative,Desc,-1,en,,,draft,,',
+        )
+        with self.assertRaises(CourseImportError) as raised:
+            import_courses(rows)
+        errors = raised.exception.errors
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(errors[0], "line 2: invalid price 'NaN'")
+        self.assertEqual(errors[1], "line 3: invalid price 'Infinity'")
+        self.assertEqual(errors[2], "line 4: price: Ensure that there are no more than 10 digits in total.")
+        self.assertEqual(errors[3], "line 5: price cannot be negative")
+        self.assertFalse(TeacherCourse.objects.exists())
+
+    def test_rows_get_the_model_field_validation(self):
+        rows = self.csv_rows(
+            'partner,No description,,10,en,,,draft,,',
+            'partner,Bad URL,Desc,10,en,,,draft,,not a url',
+        )
+        with self.assertRaises(CourseImportError) as raised:
+            import_courses(rows)
+        self.assertEqual(raised.exception.errors, [
+            "line 2: description: This field cannot be blank.",
+            "line 3: video_trailer_url: Enter a valid URL.",
+        ])
+
+    def test_create_categories_and_fixed_teacher(self):
+        created = import_courses(
+            self.csv_rows(',Course,Desc,5,ar,,Cooking|Python,,,'),
+            teacher_profile=self.teacher_profile, create_categories=True,
+        )
+        self.assertEqual(created, 1)
+        course = TeacherCourse.objects.get()
+        self.assertEqual(course.status, 'draft')
+        self.assertEqual(sorted(c.name for c in course.categories.all()), ['Cooking', 'Python'])
+
+    def test_export_round_trips(self):
+        import_courses(self.csv_rows(
+            'partner,Course A,"Line, with comma",10.00,en,Beginner,Python|Data,published,false,https://example.com/v',
+            'partner,Course B,Desc,0,fr,,,draft,true,',
+        ))
+        rows = list(export_course_rows())
+        self.assertEqual(rows[0]['categories'], ['Data', 'Python'])
+        self.assertEqual(rows[1]['level'], '')
+
+        exported = ''.join(iter_courses_csv(rows))
+        TeacherCourse.objects.all().delete()
+        self.assertEqual(import_courses(iter_course_rows(io.StringIO(exported))), 2)
+        self.assertEqual(list(export_course_rows()), rows)
+
+    def test_commands(self):
+        path = self.write_tmp_file('courses.jsonl', json.dumps({
+            'teacher': 'partner', 'title': 'From JSONL', 'description': 'Desc', 'price': '3.50',
+            'categories': ['Python'], 'status': 'published',
+        }) + '\n')
+        call_command('import_courses', path, stdout=io.StringIO())
+        self.assertTrue(TeacherCourse.objects.filter(title='From JSONL', status='published').exists())
+
+        out = io.StringIO()
+        call_command('export_courses', format='jsonl', stdout=out)
+        self.assertEqual(json.loads(out.getvalue())['categories'], ['Python'])
+
+        with self.assertRaises(CommandError):
+            call_command('import_courses', path, teacher='nobody', stdout=io.StringIO())
+
+    def write_tmp_file(self, name, content):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, name)
+        with open(path, 'w', encoding='utf-8') as handle:
+            handle.write(content)
+        return path
+
+
+class CourseBulkAPITest(TestCase):
+
+    def setUp(self):
+        self.teacher_user = User.objects.create_user(
+            username='partner', email='partner@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        CourseCategory.objects.create(name='Python')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.teacher_user)
+        self.url = reverse('api_teacher_course_bulk')
+
+    def test_teacher_imports_json_into_own_profile(self):
+        response = self.client.post(self.url, [
+            {'teacher': 'someone-else', 'title': 'A', 'description': 'Desc', 'price': '1', 'categories': ['Python']},
+            {'title': 'B', 'description': 'Desc', 'price': '2', 'status': 'pending'},
+        ], format='json', secure=True)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(TeacherCourse.objects.filter(teacher_profile=self.teacher_profile).count(), 2)
+
+    def test_teacher_cannot_feature(self):
+        response = self.client.post(self.url, [{'title': 'A', 'description': 'Desc', 'price': '1', 'featured': True}], format='json', secure=True)
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(TeacherCourse.objects.get(title='A').featured)
+
+    def test_teacher_cannot_publish(self):
+        response = self.client.post(self.url, [{'title': 'A', 'price': '1', 'status': 'published'}], format='json', secure=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors'], ["line 1: status 'published' is not allowed"])
+
+    def test_csv_upload_and_export(self):
+        upload = SimpleUploadedFile('courses.csv', (CSV_HEADER + ',Uploaded,Desc,4,en,,Python,draft,,\n').encode())
+        response = self.client.post(self.url, {'file': upload}, format='multipart', secure=True)
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.get(self.url, {'output': 'jsonl'}, secure=True)
+        self.assertEqual(response.status_code, 200)
+        row = json.loads(b''.join(response.streaming_content))
+        self.assertEqual((row['title'], row['teacher']), ('Uploaded', 'partner'))
+
+    def test_bad_rows_and_malformed_files_are_400s(self):
+        response = self.client.post(self.url, [{'title': 'A', 'price': 'NaN'}], format='json', secure=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['errors'], ["line 1: invalid price 'NaN'"])
+
+        # A cell over the csv module's field size limit
+        upload = SimpleUploadedFile('courses.csv', (CSV_HEADER + ',Broken,' + 'x' * 200000 + ',4,en,,,draft,,\n').encode())
+        response = self.client.post(self.url, {'file': upload}, format='multipart', secure=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Malformed CSV', response.data['detail'])
+        self.assertFalse(TeacherCourse.objects.exists())
+
+    def test_students_are_refused(self):
+        student = User.objects.create_user(username='student1', email='s@example.com', password='password123')
+        self.client.force_authenticate(user=student)
+        response = self.client.post(self.url, [], format='json', secure=True)
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,94 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+
+from accounts.ledger import drifted_course_totals, reconcile_course_totals
+from accounts.models import EnrolledCourse, Profile, TeacherCourse
+from accounts.tests.unit.fixtures import EnrolledCourseTestCase
+
+User = get_user_model()
+
+
+class CourseTotalsTest(EnrolledCourseTestCase):
+
+    def totals(self):
+        self.course.refresh_from_db(fields=['enrollment_count', 'revenue_total'])
+        return self.course.enrollment_count, self.course.revenue_total
+
+    def test_enroll_and_unenroll_move_the_totals(self):
+        enrollment = self.enroll(self.students[0])
+        self.enroll(self.students[1], Decimal('25.50'))
+        self.assertEqual(self.totals(), (2, Decimal('65.50')))
+
+        enrollment.delete()
+        self.assertEqual(self.totals(), (1, Decimal('25.50')))
+        self.assertEqual(drifted_course_totals(), [])
+
+    def test_deleting_a_student_cascades_into_the_totals(self):
+        self.enroll(self.students[0])
+        self.enroll(self.students[1])
+        self.students[0].user.delete()
+        self.assertEqual(self.totals(), (1, Decimal('40.00')))
+        self.assertEqual(drifted_course_totals(), [])
+
+    def test_deleting_the_course_with_its_enrollments(self):
+        self.enroll(self.students[0])
+        self.course.delete()
+        self.assertFalse(EnrolledCourse.objects.exists())
+
+    def test_totals_update_leaves_updated_at_alone(self):
+        updated_at = self.course.updated_at
+        self.enroll(self.students[0])
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.updated_at, updated_at)
+
+    def test_reconcile(self):
+        self.enroll(self.students[0])
+        # Enrollments created without going through the ledger (e.g. a data import)
+        EnrolledCourse.objects.create(student=self.students[1], course=self.course, fee_paid=Decimal('10.00'))
+        other = TeacherCourse.objects.create(
+            teacher_profile=self.teacher_profile, title='Empty', description='Description', price=Decimal('5.00')
+        )
+        TeacherCourse.objects.filter(id=other.id).update(enrollment_count=4)
+
+        drifted = drifted_course_totals()
+        self.assertEqual(drifted, [
+            (self.course.id, (1, Decimal('40.00')), (2, Decimal('50.00'))),
+            (other.id, (4, Decimal('0.00')), (0, Decimal('0.00'))),
+        ])
+        self.assertEqual(reconcile_course_totals([self.course.id]), drifted[:1])
+        self.assertEqual(self.totals(), (2, Decimal('50.00')))
+        self.assertEqual(len(drifted_course_totals()), 1)
+
+    def test_management_command(self):
+        EnrolledCourse.objects.create(student=self.students[0], course=self.course, fee_paid=Decimal('10.00'))
+
+        with self.assertRaises(CommandError):
+            call_command('reconcile_course_totals', '--verify', stdout=StringIO())
+        call_command('reconcile_course_totals', stdout=StringIO())
+        call_command('reconcile_course_totals', '--verify', stdout=StringIO())
+        self.assertEqual(self.totals(), (1, Decimal('10.00')))
+
+    def test_admin_enrollments_update_the_totals(self):
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        Profile.objects.create(user=admin_user)
+        self.client.force_login(admin_user)
+
+        response = self.client.post(reverse('admin:accounts_enrolledcourse_add'), {
+            'student': self.students[0].id, 'course': self.course.id, 'fee_paid': '40.00',
+        }, secure=True)
+        self.assertEqual(response.status_code, 302)
+        self.enroll(self.students[1])
+        self.assertEqual(self.totals(), (2, Decimal('80.00')))
+
+        response = self.client.post(reverse('admin:accounts_enrolledcourse_changelist'), {
+            'action': 'delete_selected', 'post': 'yes',
+            '_selected_action': list(EnrolledCourse.objects.values_list('id', flat=True)),
+        }, secure=True)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.totals(), (0, Decimal('0.00')))
+        self.assertEqual(drifted_course_totals(), [])
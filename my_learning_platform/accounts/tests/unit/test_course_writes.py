@@ -0,0 +1,176 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import Profile, TeacherCourse, CourseCategory, CourseLevel
+from accounts.search import FTS_TABLE
+
+User = get_user_model()
+
+COURSE_TABLE = 'accounts_teachercourse'
+LINK_TABLE = 'accounts_teachercourse_categories'
+
+
+class CourseWriteQueryTest(TestCase):
+    """
+    Course create / update must write the course row once (only the changed columns on
+    update) and touch the category links only for the categories that changed.
+    """
+
+    def setUp(self):
+        self.teacher_user = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.categories = [CourseCategory.objects.create(name=f'Category {i}') for i in range(3)]
+        self.beginner = CourseLevel.objects.create(name='Beginner')
+        self.advanced = CourseLevel.objects.create(name='Advanced')
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.teacher_user)
+
+    def create_course(self, categories):
+        course = TeacherCourse.objects.create(
+            teacher_profile=self.teacher_profile, title='Course', description='Description',
+            price=Decimal('10.00'), level=self.beginner,
+        )
+        course.categories.set(categories)
+        return course
+
+    def writes(self, method, url, data):
+        # on_commit callbacks (the search index refresh) run as they do in production
+        with CaptureQueriesContext(connection) as context, self.captureOnCommitCallbacks(execute=True):
+            response = method(url, data, format='json', secure=True)
+        statements = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))
+        ]
+        return response, statements
+
+    def statements_on(self, statements, table, verb):
+        return [sql for sql in statements if sql.startswith(verb) and f'"{table}"' in sql.split(' (')[0].split(' SET')[0]]
+
+    def index_writes(self, statements):
+        # Raw SQL of accounts.search: the FTS5 table, or the tsvector column on PostgreSQL
+        return [sql for sql in statements if FTS_TABLE in sql or 'SET search_vector' in sql]
+
+    def test_create_is_one_insert_plus_links(self):
+        response, statements = self.writes(self.client.post, reverse('api_teacher_course_list_create'), {
+            'title': 'New', 'description': 'Description', 'price': '15.00', 'language': 'en',
+            'category_ids': [c.id for c in self.categories[:2]], 'level_id': self.beginner.id,
+        })
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(self.statements_on(statements, COURSE_TABLE, 'INSERT')), 1)
+        self.assertEqual(self.statements_on(statements, COURSE_TABLE, 'UPDATE'), [])
+        self.assertEqual(len(self.statements_on(statements, LINK_TABLE, 'INSERT')), 1)
+        self.assertTrue(self.index_writes(statements))
+
+        course = TeacherCourse.objects.get(title='New')
+        self.assertEqual(course.level, self.beginner)
+        self.assertEqual(course.categories.count(), 2)
+
+    def test_update_writes_only_changed_columns(self):
+        course = self.create_course(self.categories[:2])
+        url = reverse('api_teacher_course_detail', args=[course.id])
+        response, statements = self.writes(self.client.patch, url, {
+            'title': 'Renamed', 'price': '10.00', 'level_id': self.advanced.id,
+            'category_ids': [self.categories[0].id, self.categories[1].id],
+        })
+        self.assertEqual(response.status_code, 200)
+
+        updates = self.statements_on(statements, COURSE_TABLE, 'UPDATE')
+        self.assertEqual(len(updates), 1)
+        assignments = updates[0].split(' SET ')[1].split(' WHERE ')[0]
+        self.assertIn('"title"', assignments)
+        self.assertIn('"level_id"', assignments)
+        self.assertIn('"updated_at"', assignments)
+        self.assertNotIn('"price"', assignments)
+        self.assertNotIn('"description"', assignments)
+        # Same categories as before: the links are left alone
+        self.assertEqual(self.statements_on(statements, LINK_TABLE, 'INSERT'), [])
+        self.assertEqual(self.statements_on(statements, LINK_TABLE, 'DELETE'), [])
+        # The title changed, so the course is reindexed after commit, and nothing else is written
+        index_writes = self.index_writes(statements)
+        self.assertTrue(index_writes)
+        self.assertEqual(len(statements), 1 + len(index_writes))
+
+        course.refresh_from_db()
+        self.assertEqual((course.title, course.level), ('Renamed', self.advanced))
+
+    def test_category_diff(self):
+        course = self.create_course(self.categories[:2])
+        updated_at = course.updated_at
+        url = reverse('api_teacher_course_detail', args=[course.id])
+        response, statements = self.writes(self.client.patch, url, {
+            'category_ids': [self.categories[1].id, self.categories[2].id],
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(self.statements_on(statements, LINK_TABLE, 'DELETE')), 1)
+        self.assertEqual(len(self.statements_on(statements, LINK_TABLE, 'INSERT')), 1)
+        # Category-only edits still move updated_at (ETags)
+        self.assertEqual(len(self.statements_on(statements, COURSE_TABLE, 'UPDATE')), 1)
+
+        course.refresh_from_db()
+        self.assertEqual({c.id for c in course.categories.all()}, {self.categories[1].id, self.categories[2].id})
+        self.assertGreater(course.updated_at, updated_at)
+
+    def test_update_of_unindexed_columns_is_one_statement(self):
+        course = self.create_course(self.categories[:1])
+        url = reverse('api_teacher_course_detail', args=[course.id])
+        response, statements = self.writes(self.client.patch, url, {'price': '12.50', 'language': 'fr'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 1)
+        self.assertEqual(len(self.statements_on(statements, COURSE_TABLE, 'UPDATE')), 1)
+
+    def test_unchanged_update_writes_nothing(self):
+        course = self.create_course(self.categories[:1])
+        url = reverse('api_teacher_course_detail', args=[course.id])
+        response, statements = self.writes(self.client.patch, url, {
+            'title': 'Course', 'category_ids': [self.categories[0].id], 'level_id': self.beginner.id,
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(statements, [])
+
+    def test_update_query_budget(self):
+        course = self.create_course(self.categories[:2])
+        url = reverse('api_teacher_course_detail', args=[course.id])
+        # course (+ owner) + categories prefetch, level_id / category_ids validation,
+        # UPDATE, categories for the response
+        with self.assertNumQueries(6):
+            response = self.client.patch(url, {
+                'title': 'Renamed', 'level_id': self.advanced.id,
+                'category_ids': [c.id for c in self.categories[:2]],
+            }, format='json', secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['level']['name'], 'Advanced')
+
+    def test_invalid_category_ids(self):
+        course = self.create_course(self.categories[:1])
+        url = reverse('api_teacher_course_detail', args=[course.id])
+        for category_ids in ([self.categories[0].id, 999], ['abc'], 'not-a-list'):
+            response = self.client.patch(url, {'category_ids': category_ids}, format='json', secure=True)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('category_ids', response.data)
+
+    def test_edit_view_writes_only_changed_columns(self):
+        course = self.create_course(self.categories[:1])
+        self.client.force_login(self.teacher_user)
+        data = {
+            'title': 'Course', 'description': 'New description', 'price': '10.00', 'language': 'en',
+            'categories': [self.categories[0].id], 'level': self.beginner.id, 'video_trailer_url': '',
+        }
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('edit_teacher_course', args=[course.id]), data, secure=True)
+        self.assertEqual(response.status_code, 302)
+
+        updates = [q['sql'] for q in context.captured_queries if q['sql'].startswith(f'UPDATE "{COURSE_TABLE}"')]
+        self.assertEqual(len(updates), 1)
+        assignments = updates[0].split(' SET ')[1].split(' WHERE ')[0]
+        self.assertIn('"description"', assignments)
+        self.assertNotIn('"title"', assignments)
+        course.refresh_from_db()
+        self.assertEqual(course.description, 'New description')
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.facets import FacetSelection, compute_facet_counts
+from accounts.models import Profile, TeacherCourse, CourseCategory, CourseLevel
+
+User = get_user_model()
+
+
+def counts(facet):
+    return {option['value']: option['count'] for option in facet}
+
+
+class CatalogFacetsTest(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.teacher_user = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.python = CourseCategory.objects.create(name='Python')
+        self.web = CourseCategory.objects.create(name='Web')
+        self.beginner = CourseLevel.objects.create(name='Beginner')
+        self.advanced = CourseLevel.objects.create(name='Advanced')
+
+        self.python_intro = self.create_course('Python Intro', '0.00', self.beginner, 'en', [self.python])
+        self.django = self.create_course('Django', '75.00', self.advanced, 'en', [self.python, self.web])
+        self.css = self.create_course('CSS', '20.00', self.beginner, 'fr', [self.web])
+        self.create_course('Draft', '20.00', self.beginner, 'en', [self.web], status='draft')
+        self.client = APIClient()
+
+    def create_course(self, title, price, level, language, categories, status='published'):
+        course = TeacherCourse.objects.create(
+            teacher_profile=self.teacher_profile, title=title, description='Description',
+            price=Decimal(price), level=level, language=language, status=status
+        )
+        course.categories.set(categories)
+        return course
+
+    def test_counts_without_selection(self):
+        facets = compute_facet_counts(FacetSelection())
+        self.assertEqual(counts(facets['category']), {self.python.id: 2, self.web.id: 2})
+        self.assertEqual(counts(facets['level']), {self.beginner.id: 2, self.advanced.id: 1})
+        self.assertEqual(counts(facets['language']), {'en': 2, 'ar': 0, 'fr': 1, 'es': 0})
+        self.assertEqual(counts(facets['price']), {'free': 1, 'under_50': 1, '50_to_100': 1, 'over_100': 0})
+
+    def test_each_facet_ignores_its_own_selection(self):
+        facets = compute_facet_counts(FacetSelection(category=[self.web.id], level=[self.beginner.id]))
+        # Category counts apply the level filter only, level counts the category filter only
+        self.assertEqual(counts(facets['category']), {self.python.id: 1, self.web.id: 1})
+        self.assertEqual(counts(facets['level']), {self.beginner.id: 1, self.advanced.id: 1})
+        self.assertEqual(counts(facets['language']), {'en': 0, 'ar': 0, 'fr': 1, 'es': 0})
+
+    def test_one_query_per_facet(self):
+        with self.assertNumQueries(4):
+            compute_facet_counts(FacetSelection(category=[self.python.id, self.web.id], price=['free', 'under_50']))
+
+    def test_api_filters_and_returns_facets(self):
+        url = reverse('api_catalog')
+        response = self.client.get(url, {'category': [self.python.id, self.web.id], 'language': 'en'}, secure=True)
+        self.assertEqual(response.status_code, 200)
+        # Django is in both selected categories but is listed once
+        self.assertEqual([c['id'] for c in response.data['results']], [self.django.id, self.python_intro.id])
+        self.assertEqual(counts(response.data['facets']['language'])['fr'], 1)
+
+        response = self.client.get(url, {'price': 'free'}, secure=True)
+        self.assertEqual([c['id'] for c in response.data['results']], [self.python_intro.id])
+
+        self.assertEqual(self.client.get(url, {'price': 'cheap'}, secure=True).status_code, 400)
+
+    def test_facet_counts_are_cached_until_catalog_changes(self):
+        url = reverse('api_catalog')
+        self.client.get(url, secure=True)
+        with self.assertNumQueries(2): # page of courses + their categories; facets come from cache
+            self.client.get(url, secure=True)
+
+        self.css.status = 'archived'
+        self.css.save()
+        response = self.client.get(url, secure=True)
+        self.assertEqual(counts(response.data['facets']['language'])['fr'], 0)
@@ -0,0 +1,53 @@
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.auth import authenticate, get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from accounts.hashers import PASSWORD_HASHER_TIERS, password_hashers_for_tier
+
+User = get_user_model()
+
+
+class PasswordHasherTierTest(TestCase):
+
+    def test_preferred_hasher_first_and_others_still_verify(self):
+        for tier, preferred in PASSWORD_HASHER_TIERS.items():
+            hashers = password_hashers_for_tier(tier)
+            if tier != 'argon2': # May fall back to pbkdf2 without argon2-cffi
+                self.assertEqual(hashers[0], preferred)
+            self.assertIn('django.contrib.auth.hashers.PBKDF2PasswordHasher', hashers)
+            self.assertEqual(len(hashers), len(set(hashers)))
+
+    def test_unknown_tier(self):
+        with self.assertRaises(ValueError):
+            password_hashers_for_tier('plaintext')
+
+    def test_test_settings_use_fast_tier(self):
+        self.assertEqual(
+            settings.PASSWORD_HASHERS[0], PASSWORD_HASHER_TIERS['fast'],
+            'run the suite with my_learning_platform_core.settings_test (pytest.ini, Jenkinsfiles)',
+        )
+
+    def test_login_rehashes_with_current_tier(self):
+        with override_settings(PASSWORD_HASHERS=password_hashers_for_tier('pbkdf2')):
+            user = User.objects.create_user(username='student1', password='password123')
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$'))
+
+        with override_settings(PASSWORD_HASHERS=password_hashers_for_tier('fast')):
+            self.assertEqual(authenticate(None, username='student1', password='password123'), user)
+            user.refresh_from_db()
+            self.assertTrue(user.password.startswith('md5$'))
+            self.assertTrue(user.check_password('password123'))
+
+
+class BenchmarkHashersCommandTest(TestCase):
+
+    def test_reports_both_endpoints(self):
+        out = StringIO()
+        call_command('benchmark_hashers', '--tier', 'fast', '--requests', '1', '--concurrency', '1', stdout=out)
+        self.assertIn('fast (md5) LoginAPIView', out.getvalue())
+        self.assertIn('fast (md5) login_view', out.getvalue())
+        self.assertNotIn('errors 1', out.getvalue())
+        self.assertFalse(User.objects.filter(username__startswith='benchmark-hasher-').exists())
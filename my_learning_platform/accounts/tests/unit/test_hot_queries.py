@@ -0,0 +1,41 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from accounts.hot_queries import HOT_QUERIES, find_full_scans
+from accounts.models import ContactMessage
+
+
+class FindFullScansTest(TestCase):
+
+    def test_sqlite_plans(self):
+        plan = '\n'.join([
+            '2 0 0 SCAN accounts_contactmessage',
+            '4 0 0 SEARCH accounts_teachercourse USING INDEX tc_status_created_idx (status=?)',
+            '5 0 0 SCAN accounts_contactmessage USING INDEX cm_submitted_idx',
+            '6 0 0 SCAN CONSTANT ROW',
+        ])
+        self.assertEqual(find_full_scans(plan, 'sqlite', limited=True), ['2 0 0 SCAN accounts_contactmessage'])
+        # Without a LIMIT, walking a whole index is a full scan too
+        self.assertEqual(len(find_full_scans(plan, 'sqlite')), 2)
+
+    def test_postgresql_plans(self):
+        plan = (
+            'Limit  (cost=0.15..4.17 rows=1 width=8)\n'
+            '  ->  Seq Scan on accounts_contactmessage  (cost=0.00..1.01 rows=1 width=8)'
+        )
+        self.assertEqual(len(find_full_scans(plan, 'postgresql')), 1)
+
+    def test_unindexed_filter_is_flagged(self):
+        plan = ContactMessage.objects.filter(email='someone@example.com').explain()
+        self.assertTrue(find_full_scans(plan, connection.vendor))
+
+
+class ExplainHotQueriesCommandTest(TestCase):
+
+    def test_all_hot_queries_use_indexes(self):
+        out = StringIO()
+        call_command('explain_hot_queries', '--strict', stdout=out)
+        self.assertIn(f'{len(HOT_QUERIES)} hot query plan(s) use indexes.', out.getvalue())
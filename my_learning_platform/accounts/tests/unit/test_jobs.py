@@ -0,0 +1,144 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts import jobs
+from accounts.jobs import enqueue, job_handler, requeue_stale_jobs, retry_jobs, run_pending_jobs
+from accounts.models import Job, Profile
+from accounts.notifications import queue_email
+
+User = get_user_model()
+
+CALLS = []
+
+
+@job_handler('test_record')
+def record(value):
+    CALLS.append(value)
+
+
+@job_handler('test_explode')
+def explode():
+    raise RuntimeError('boom')
+
+
+class JobQueueTest(TestCase):
+
+    def setUp(self):
+        CALLS.clear()
+
+    def test_enqueue_waits_for_commit(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            enqueue('test_record', {'value': 1})
+        self.assertFalse(Job.objects.exists())
+
+        callbacks[0]()
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.payload, job.status), ('test_record', {'value': 1}, 'pending'))
+
+    def test_unknown_handler_is_rejected(self):
+        with self.assertRaises(ValueError):
+            enqueue('no_such_job')
+
+    def test_successful_jobs_run_and_are_deleted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue('test_record', {'value': 1})
+            enqueue('test_record', {'value': 2})
+            enqueue('test_record', {'value': 3}, delay=60)
+
+        self.assertEqual(run_pending_jobs(), (2, 0))
+        self.assertEqual(CALLS, [1, 2])
+        # The delayed job is not due yet
+        self.assertEqual(list(Job.objects.values_list('payload', flat=True)), [{'value': 3}])
+
+    def test_failed_job_backs_off_then_fails_permanently(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue('test_explode', max_attempts=2)
+
+        self.assertEqual(run_pending_jobs(), (0, 1))
+        job = Job.objects.get()
+        self.assertEqual((job.status, job.attempts), ('pending', 1))
+        self.assertGreater(job.run_after, timezone.now())
+        self.assertIn('boom', job.last_error)
+
+        Job.objects.update(run_after=timezone.now())
+        self.assertEqual(run_pending_jobs(), (0, 1))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+        self.assertEqual(run_pending_jobs(), (0, 0))
+
+        self.assertEqual(retry_jobs(Job.objects.all()), 1)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('pending', 0))
+
+    def test_batch_size_and_stale_requeue(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for value in range(3):
+                enqueue('test_record', {'value': value})
+
+        claimed = jobs.claim_jobs(batch_size=2)
+        self.assertEqual(len(claimed), 2)
+        self.assertEqual(Job.objects.filter(status='running').count(), 2)
+
+        # The worker holding them died
+        Job.objects.filter(status='running').update(locked_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(requeue_stale_jobs(), 2)
+        self.assertEqual(run_pending_jobs(batch_size=10), (3, 0))
+        self.assertEqual(sorted(CALLS), [0, 1, 2])
+
+    def test_run_jobs_command_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue('test_record', {'value': 'cmd'})
+        call_command('run_jobs', once=True, stdout=open('/dev/null', 'w'))
+        self.assertEqual(CALLS, ['cmd'])
+        self.assertFalse(Job.objects.exists())
+
+
+class EmailJobTest(TestCase):
+
+    def test_emails_are_sent_by_the_worker(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_email('Hello', 'Body', ['a@example.com'])
+            queue_email('Hello again', 'Body', ['b@example.com'])
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(run_pending_jobs(), (2, 0))
+        self.assertEqual([m.to for m in mail.outbox], [['a@example.com'], ['b@example.com']])
+
+    def test_teacher_approval_api_queues_notification(self):
+        admin = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        teacher = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        profile = Profile.objects.create(user=teacher, is_teacher_application_pending=True)
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = client.patch(
+                reverse('api_admin_teacher_application_status', args=[profile.id]),
+                {'action': 'approve'}, format='json', secure=True,
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Job.objects.get().payload['to'], ['teacher1@example.com'])
+
+        run_pending_jobs()
+        self.assertEqual(mail.outbox[0].subject, 'Your teacher application was approved')
+
+    @override_settings(ADMINS=[('Admin', 'admin@example.com')])
+    def test_contact_form_notifies_admins(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('contact'), {
+                'name': 'Visitor', 'email': 'visitor@example.com', 'message': 'Hi there',
+            }, secure=True)
+        self.assertEqual(response.status_code, 302)
+        run_pending_jobs()
+        self.assertEqual(mail.outbox[0].to, ['admin@example.com'])
+        self.assertIn('Hi there', mail.outbox[0].body)
@@ -0,0 +1,81 @@
+from datetime import datetime
+from io import StringIO
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+
+from accounts.ledger import rebuild_ledger, verify_ledger
+from accounts.models import AllowedCard, CourseRevenueSnapshot, EnrolledCourse
+from accounts.tests.unit.fixtures import EnrolledCourseTestCase
+
+
+class RevenueLedgerTest(EnrolledCourseTestCase):
+
+    def test_enrollments_accumulate_into_one_daily_row(self):
+        for student in self.students:
+            self.enroll(student)
+
+        snapshot = CourseRevenueSnapshot.objects.get(course=self.course)
+        self.assertEqual(snapshot.enrollment_count, 3)
+        self.assertEqual(snapshot.revenue, Decimal('120.00'))
+        self.assertEqual(verify_ledger(), [])
+
+    def test_unenrollment_is_subtracted(self):
+        enrollment = self.enroll(self.students[0])
+        self.enroll(self.students[1])
+
+        enrollment.delete()
+
+        snapshot = CourseRevenueSnapshot.objects.get(course=self.course)
+        self.assertEqual(snapshot.enrollment_count, 1)
+        self.assertEqual(snapshot.revenue, Decimal('40.00'))
+
+    def test_deleted_students_leave_the_ledger(self):
+        for student in self.students:
+            self.enroll(student)
+
+        # Profile and user deletes cascade to the enrollments
+        self.students[0].delete()
+        self.students[1].user.delete()
+
+        snapshot = CourseRevenueSnapshot.objects.get(course=self.course)
+        self.assertEqual(snapshot.enrollment_count, 1)
+        self.assertEqual(snapshot.revenue, Decimal('40.00'))
+        self.assertEqual(verify_ledger(), [])
+
+    def test_verify_and_rebuild(self):
+        # Enrollments created without going through the ledger (e.g. a data import)
+        for student in self.students:
+            EnrolledCourse.objects.create(student=student, course=self.course, fee_paid=Decimal('10.00'))
+
+        mismatches = verify_ledger()
+        self.assertEqual(len(mismatches), 1)
+        self.assertEqual(mismatches[0][3], (3, Decimal('30.00')))
+
+        self.assertEqual(rebuild_ledger(), 1)
+        self.assertEqual(verify_ledger(), [])
+
+    def test_management_command(self):
+        EnrolledCourse.objects.create(student=self.students[0], course=self.course, fee_paid=Decimal('10.00'))
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_revenue_ledger', '--verify', stdout=StringIO())
+        call_command('rebuild_revenue_ledger', stdout=StringIO())
+        call_command('rebuild_revenue_ledger', '--verify', stdout=StringIO())
+
+    def test_register_for_course_updates_ledger(self):
+        card = AllowedCard.objects.create(card_number='4111111111111111', expiry_month=12, expiry_year=datetime.now().year + 1)
+        self.client.force_login(self.students[0].user)
+
+        response = self.client.post(
+            reverse('register_for_course', args=[self.course.id]),
+            {'card_number': card.card_number, 'expiry_month': card.expiry_month, 'expiry_year': card.expiry_year},
+            secure=True,
+        )
+
+        self.assertEqual(response.status_code, 302)
+        snapshot = CourseRevenueSnapshot.objects.get(course=self.course)
+        self.assertEqual(snapshot.enrollment_count, 1)
+        self.assertEqual(snapshot.revenue, Decimal('40.00'))
@@ -0,0 +1,66 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import Profile, TeacherCourse, EnrolledCourse
+
+User = get_user_model()
+
+
+class CursorPaginationTest(TestCase):
+    def setUp(self):
+        self.teacher_user = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.teacher_user)
+        for i in range(25):
+            TeacherCourse.objects.create(
+                teacher_profile=self.teacher_profile, title=f'Course {i}', description='Description',
+                price=Decimal('10.00'), status='published'
+            )
+
+    def collect_all_pages(self, url, **params):
+        ids = []
+        response = self.client.get(url, params, secure=True)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            ids.extend(item['id'] for item in response.data['results'])
+            if not response.data['next']:
+                return ids
+            response = self.client.get(response.data['next'], secure=True)
+
+    def test_first_page_is_bounded(self):
+        response = self.client.get(reverse('api_teacher_course_list_create'), secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 20)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+    def test_pages_cover_every_course_once_newest_first(self):
+        ids = self.collect_all_pages(reverse('api_teacher_course_list_create'), page_size=7)
+
+        expected = list(TeacherCourse.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_page_size_can_be_chosen_by_client(self):
+        response = self.client.get(reverse('api_teacher_course_list_create'), {'page_size': 1000}, secure=True)
+
+        self.assertEqual(len(response.data['results']), 25)
+
+    def test_enrollments_are_paginated(self):
+        student_user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        student = Profile.objects.create(user=student_user)
+        for course in TeacherCourse.objects.all():
+            EnrolledCourse.objects.create(student=student, course=course, fee_paid=course.price)
+        self.client.force_authenticate(user=student_user)
+
+        ids = self.collect_all_pages(reverse('api_my_enrollments'))
+
+        self.assertEqual(len(ids), 25)
+        self.assertEqual(len(set(ids)), 25)
@@ -0,0 +1,130 @@
+from datetime import datetime
+from importlib import import_module
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from accounts.forms import AllowedCardForm
+from accounts.models import AllowedCard, CourseRevenueSnapshot, EnrolledCourse, Profile, TeacherCourse
+from accounts.payments import (
+    AllowedCardGateway, AlreadyEnrolled, PaymentDeclined, PaymentGateway, StubGateway, card_fingerprint,
+    enroll_with_payment,
+)
+
+User = get_user_model()
+
+CARD_NUMBER = '4111111111111111'
+
+
+class CardFingerprintTest(TestCase):
+
+    def test_only_the_fingerprint_is_stored(self):
+        card = AllowedCard.objects.create(card_number=CARD_NUMBER, expiry_month=1, expiry_year=datetime.now().year + 1)
+        card = AllowedCard.objects.get(id=card.id)
+        self.assertEqual(len(card.card_fingerprint), 64)
+        self.assertEqual(card.card_fingerprint, card_fingerprint(CARD_NUMBER))
+        self.assertEqual(card.card_last4, '1111')
+        self.assertIsNone(card.card_number)
+
+    def test_fingerprint_ignores_separators_and_depends_on_the_key(self):
+        self.assertEqual(card_fingerprint('4111 1111-1111 1111'), card_fingerprint(CARD_NUMBER))
+        fingerprint = card_fingerprint(CARD_NUMBER)
+        with override_settings(CARD_FINGERPRINT_KEY='another-key'):
+            self.assertNotEqual(card_fingerprint(CARD_NUMBER), fingerprint)
+
+    def test_migration_backfill_matches_the_lookup(self):
+        migration = import_module('accounts.migrations.0029_allowed_card_fingerprint')
+        self.assertEqual(migration.card_fingerprint('4111 1111 1111 1111'), card_fingerprint(CARD_NUMBER))
+
+    def test_admin_form(self):
+        year = datetime.now().year + 1
+        form = AllowedCardForm(data={'card_number': '4111 1111 1111 1111', 'expiry_month': 2, 'expiry_year': year})
+        self.assertTrue(form.is_valid(), form.errors)
+        card = form.save()
+        self.assertEqual(card.card_fingerprint, card_fingerprint(CARD_NUMBER))
+
+        duplicate = AllowedCardForm(data={'card_number': CARD_NUMBER, 'expiry_month': 3, 'expiry_year': year})
+        self.assertIn('card_number', duplicate.errors)
+        # Editing keeps the stored card when the number is left blank
+        edit = AllowedCardForm(data={'card_number': '', 'expiry_month': 4, 'expiry_year': year}, instance=card)
+        self.assertTrue(edit.is_valid(), edit.errors)
+        edit.save()
+        card.refresh_from_db()
+        self.assertEqual((card.card_fingerprint, card.expiry_month), (card_fingerprint(CARD_NUMBER), 4))
+
+
+class PaymentGatewayTest(TestCase):
+
+    def test_gateways_must_implement_authorize(self):
+        with self.assertRaises(TypeError):
+            PaymentGateway()
+
+        class NoAuthorize(PaymentGateway):
+            pass
+
+        with self.assertRaises(TypeError):
+            NoAuthorize()
+
+
+class EnrollWithPaymentTest(TestCase):
+
+    def setUp(self):
+        teacher = User.objects.create_user(username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher')
+        self.course = TeacherCourse.objects.create(
+            teacher_profile=Profile.objects.create(user=teacher, is_teacher_approved=True),
+            title='Course', description='Description', price=Decimal('25.00'), status='published',
+        )
+        self.student_user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+        self.student = Profile.objects.create(user=self.student_user)
+        self.expiry_year = datetime.now().year + 1
+        AllowedCard.objects.create(card_number=CARD_NUMBER, expiry_month=12, expiry_year=self.expiry_year)
+
+    def test_enrolls_and_records_revenue(self):
+        enrollment = enroll_with_payment(self.student, self.course, CARD_NUMBER, 12, self.expiry_year)
+        self.assertEqual(enrollment.fee_paid, Decimal('25.00'))
+        self.assertEqual(CourseRevenueSnapshot.objects.get(course=self.course).enrollment_count, 1)
+
+    def test_declined_card(self):
+        for card_number, month in ((CARD_NUMBER, 11), ('4000000000000002', 12)):
+            with self.assertRaises(PaymentDeclined):
+                enroll_with_payment(self.student, self.course, card_number, month, self.expiry_year)
+        self.assertFalse(EnrolledCourse.objects.exists())
+
+    def test_second_enrollment_voids_the_authorization(self):
+        gateway = StubGateway()
+        enroll_with_payment(self.student, self.course, CARD_NUMBER, 12, self.expiry_year, gateway=gateway)
+        with mock.patch.object(gateway, 'void') as void, self.assertRaises(AlreadyEnrolled):
+            enroll_with_payment(self.student, self.course, CARD_NUMBER, 12, self.expiry_year, gateway=gateway)
+        void.assert_called_once()
+        self.assertEqual(CourseRevenueSnapshot.objects.get(course=self.course).enrollment_count, 1)
+
+    def test_checkout_query_count(self):
+        # Today's ledger row already exists after the first checkout
+        other = Profile.objects.create(user=User.objects.create_user(username='student2', email='student2@example.com'))
+        enroll_with_payment(other, self.course, CARD_NUMBER, 12, self.expiry_year)
+        # card lookup, savepoint, enrollment INSERT, ledger UPDATE, course totals UPDATE,
+        # release savepoint
+        with self.assertNumQueries(6):
+            enroll_with_payment(self.student, self.course, CARD_NUMBER, 12, self.expiry_year, gateway=AllowedCardGateway())
+
+    def test_view_reports_already_enrolled(self):
+        self.client.force_login(self.student_user)
+        url = reverse('register_for_course', args=[self.course.id])
+        data = {'card_number': CARD_NUMBER, 'expiry_month': 12, 'expiry_year': self.expiry_year}
+        self.assertEqual(self.client.post(url, data, secure=True).status_code, 302)
+        response = self.client.post(url, data, secure=True, follow=True)
+        self.assertContains(response, 'already enrolled')
+        self.assertEqual(EnrolledCourse.objects.filter(student=self.student).count(), 1)
+
+    def test_view_declined(self):
+        self.client.force_login(self.student_user)
+        response = self.client.post(
+            reverse('register_for_course', args=[self.course.id]),
+            {'card_number': '4000000000000002', 'expiry_month': 12, 'expiry_year': self.expiry_year},
+            secure=True,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Payment failed')
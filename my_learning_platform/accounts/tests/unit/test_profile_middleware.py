@@ -0,0 +1,45 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.backends import UsernameOrEmailBackend
+from accounts.models import Profile
+
+User = get_user_model()
+
+
+class ProfileMiddlewareTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='student1', email='student1@example.com', password='password123')
+
+    def profile_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, secure=True)
+        self.assertEqual(response.status_code, 200)
+        return [q['sql'] for q in context.captured_queries if q['sql'].startswith('SELECT') and ' FROM "accounts_profile"' in q['sql']]
+
+    def test_backend_loads_profile_with_user(self):
+        Profile.objects.create(user=self.user)
+        with self.assertNumQueries(1):
+            user = UsernameOrEmailBackend().get_user(self.user.pk)
+            self.assertEqual(user.profile.user_id, self.user.pk)
+
+    def test_profile_comes_with_the_session_user(self):
+        Profile.objects.create(user=self.user)
+        self.client.force_login(self.user)
+        for name in ('profile_edit', 'student_dashboard'):
+            self.assertEqual(self.profile_queries(reverse(name)), [], name)
+
+    def test_missing_profile_is_created_once(self):
+        self.client.force_login(self.user)
+        self.client.get(reverse('profile_edit'), secure=True)
+        self.assertTrue(Profile.objects.filter(user=self.user).exists())
+        self.assertEqual(self.profile_queries(reverse('profile_edit')), [])
+
+    def test_anonymous_requests_are_untouched(self):
+        response = self.client.get(reverse('profile_edit'), secure=True)
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Profile.objects.exists())
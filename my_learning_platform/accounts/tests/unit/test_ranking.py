@@ -0,0 +1,117 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import CourseRanking, CourseRevenueSnapshot, Profile, TeacherCourse
+from accounts.checks import check_ranking_cache_is_shared
+from accounts.ranking import (
+    RANKING_CACHE_TIMEOUT, RANKING_TOP_KEY, compute_rankings, get_top_course_ids, get_trending_courses,
+    refresh_rankings,
+)
+
+User = get_user_model()
+
+
+class CourseRankingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        teacher = User.objects.create_user(username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher')
+        self.teacher_profile = Profile.objects.create(user=teacher, is_teacher_approved=True)
+        self.today = timezone.localdate()
+        self.courses = [self.create_course(f'Course {i}') for i in range(4)]
+
+    def create_course(self, title, status='published'):
+        return TeacherCourse.objects.create(
+            teacher_profile=self.teacher_profile, title=title, description='Description',
+            price=Decimal('10.00'), status=status,
+        )
+
+    def enrollments(self, course, days_ago, count):
+        # The per-day ledger rows the ranking is computed from (kept by record_enrollment)
+        CourseRevenueSnapshot.objects.create(
+            course=course, date=self.today - timedelta(days=days_ago),
+            enrollment_count=count, revenue=Decimal('10.00') * count,
+        )
+
+    def test_scores_over_both_windows(self):
+        self.enrollments(self.courses[0], 1, 2) # recent: 2 + 3 * 2
+        self.enrollments(self.courses[1], 10, 5) # long window only
+        self.enrollments(self.courses[1], 40, 50) # outside both windows
+        self.enrollments(self.courses[2], 3, 1)
+        self.enrollments(self.courses[2], 20, 4)
+        draft = self.create_course('Draft', status='draft')
+        self.enrollments(draft, 0, 9)
+
+        self.assertEqual(compute_rankings(self.today), {
+            self.courses[0].id: (2, 2, 8.0),
+            self.courses[1].id: (0, 5, 5.0),
+            self.courses[2].id: (1, 5, 8.0),
+        })
+
+    def test_refresh_writes_only_changes(self):
+        self.enrollments(self.courses[0], 0, 3)
+        self.enrollments(self.courses[1], 0, 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(refresh_rankings(), (2, 0, 0))
+        self.assertEqual(get_top_course_ids(), [self.courses[0].id, self.courses[1].id])
+
+        CourseRevenueSnapshot.objects.filter(course=self.courses[0]).delete()
+        self.enrollments(self.courses[2], 0, 5)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(refresh_rankings(), (1, 0, 1))
+        self.assertEqual(refresh_rankings(), (0, 0, 0))
+        self.assertEqual(set(CourseRanking.objects.values_list('course_id', flat=True)), {self.courses[1].id, self.courses[2].id})
+        self.assertEqual(get_top_course_ids(), [self.courses[2].id, self.courses[1].id])
+
+    def test_top_ids_are_cached_for_a_refresh_interval(self):
+        # A worker's copy must expire: the refresh command may write to another process's cache
+        with mock.patch.object(cache, 'set', wraps=cache.set) as cache_set:
+            get_top_course_ids()
+        cache_set.assert_called_once_with(RANKING_TOP_KEY, [], RANKING_CACHE_TIMEOUT)
+        self.assertIsNotNone(RANKING_CACHE_TIMEOUT)
+
+    def test_check_flags_a_process_local_ranking_cache(self):
+        with override_settings(CATALOG_CACHE_ENABLED=True):
+            self.assertEqual([warning.id for warning in check_ranking_cache_is_shared(None)], ['accounts.W001'])
+        for overrides in (
+            {'CATALOG_CACHE_ENABLED': False},
+            {'CATALOG_CACHE_ENABLED': True,
+             'CACHES': {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://'}}},
+        ):
+            with override_settings(**overrides):
+                self.assertEqual(check_ranking_cache_is_shared(None), [], overrides)
+
+    def test_trending_courses_are_served_from_cache(self):
+        for index, course in enumerate(self.courses):
+            self.enrollments(course, 0, index + 1)
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('refresh_course_rankings', stdout=StringIO())
+
+        trending = get_trending_courses(3)
+        self.assertEqual([c.id for c in trending], [c.id for c in reversed(self.courses)][:3])
+        with self.assertNumQueries(0):
+            self.assertEqual(get_trending_courses(3), trending)
+            trending[0].categories.all()[:]
+            str(trending[0].teacher_profile.user)
+
+        # An unpublished course drops out as soon as the catalog is invalidated
+        self.courses[3].status = 'archived'
+        self.courses[3].save()
+        self.assertNotIn(self.courses[3].id, [c.id for c in get_trending_courses(3)])
+
+    def test_homepage(self):
+        self.enrollments(self.courses[1], 0, 4)
+        with self.captureOnCommitCallbacks(execute=True):
+            refresh_rankings()
+        response = self.client.get(reverse('index'), secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c.id for c in response.context['trending_courses']], [self.courses[1].id])
+        self.assertContains(response, 'Trending Courses')
@@ -0,0 +1,109 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.reports import (
+    build_course_summary, course_enrollment_page, course_enrollment_totals,
+)
+from accounts.tests.unit.fixtures import create_course, create_student_profiles, create_teacher_profile, enroll
+
+
+class CourseSummaryReportTest(TestCase):
+    def setUp(self):
+        self.teacher_profile = create_teacher_profile(commission_percentage=Decimal('10.00'))
+        self.teacher_user = self.teacher_profile.user
+        self.students = create_student_profiles(3)
+
+    def create_course(self, title, price, enrolled_students):
+        course = create_course(self.teacher_profile, title, price)
+        for student in enrolled_students:
+            enroll(student, course)
+        return course
+
+    def test_summary_values(self):
+        course = self.create_course('Python', Decimal('50.00'), self.students)
+        self.create_course('Empty', Decimal('20.00'), [])
+
+        report = build_course_summary(self.teacher_profile)
+
+        self.assertEqual(len(report), 1) # Courses without enrollments are skipped
+        row = report[0]
+        self.assertEqual(row['course_id'], course.id)
+        self.assertEqual(row['total_students'], 3)
+        self.assertEqual(row['total_fees_collected'], Decimal('150.00'))
+        self.assertEqual(row['commission_rate'], Decimal('10.00'))
+        self.assertEqual(row['commission_value'], Decimal('15.00'))
+        self.assertEqual(row['profit'], Decimal('135.00'))
+
+    def test_summary_is_a_single_query(self):
+        for i in range(5):
+            self.create_course(f'Course {i}', Decimal('30.00'), self.students[:i % 3 + 1])
+
+        with self.assertNumQueries(1):
+            report = build_course_summary(self.teacher_profile)
+        self.assertEqual(len(report), 5)
+        self.assertEqual([row['course_title'] for row in report], [f'Course {i}' for i in range(5)])
+
+    def test_summary_api_endpoint(self):
+        self.create_course('Python', Decimal('50.00'), self.students[:2])
+        client = APIClient()
+        client.force_authenticate(user=self.teacher_user)
+
+        response = client.get(reverse('api_teacher_course_summary', args=[self.teacher_profile.id]), secure=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['total_students'], 2)
+        self.assertEqual(response.data[0]['total_fees_collected'], '100.00')
+        self.assertEqual(response.data[0]['profit'], '90.00')
+
+    def test_summary_api_forbidden_for_other_users(self):
+        client = APIClient()
+        client.force_authenticate(user=self.students[0].user)
+
+        response = client.get(reverse('api_teacher_course_summary', args=[self.teacher_profile.id]), secure=True)
+
+        self.assertEqual(response.status_code, 403)
+
+
+class CourseEnrollmentReportTest(TestCase):
+    def setUp(self):
+        self.teacher_profile = create_teacher_profile()
+        self.teacher_user = self.teacher_profile.user
+        self.course = create_course(self.teacher_profile, price=Decimal('25.00'))
+        for student in create_student_profiles(5):
+            enroll(student, self.course)
+
+    def test_totals_in_one_query(self):
+        with self.assertNumQueries(1):
+            totals = course_enrollment_totals(self.course)
+        self.assertEqual(totals['total_students'], 5)
+        self.assertEqual(totals['total_fees'], Decimal('125.00'))
+
+    def test_keyset_pages(self):
+        first_page, cursor = course_enrollment_page(self.course, page_size=2)
+        self.assertEqual([row['username'] for row in first_page], ['student0', 'student1'])
+        self.assertEqual(cursor, 'student1')
+
+        second_page, cursor = course_enrollment_page(self.course, after=cursor, page_size=2)
+        self.assertEqual([row['username'] for row in second_page], ['student2', 'student3'])
+
+        last_page, cursor = course_enrollment_page(self.course, after=cursor, page_size=2)
+        self.assertEqual([row['username'] for row in last_page], ['student4'])
+        self.assertIsNone(cursor)
+
+    def test_csv_export_streams_all_rows(self):
+        self.client.force_login(self.teacher_user)
+
+        response = self.client.get(
+            reverse('teacher_single_course_report', args=[self.course.id]), {'export': 'csv'}, secure=True
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'Student Username,Full Name,Fee Paid,Enrolled On')
+        self.assertEqual(len(lines), 6)
+        self.assertTrue(lines[1].startswith('student0,Student 0,25.00,'))
@@ -0,0 +1,150 @@
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import Profile, TeacherCourse, CourseCategory
+from accounts.search import (
+    SEARCH_MAX_RESULTS, filter_matching_courses, rebuild_search_index, search_course_ids, search_terms,
+)
+
+User = get_user_model()
+
+
+class CourseSearchTest(TestCase):
+
+    def setUp(self):
+        self.teacher_user = User.objects.create_user(
+            username='teacher1', email='teacher1@example.com', password='password123', user_type='teacher'
+        )
+        self.teacher_profile = Profile.objects.create(user=self.teacher_user, is_teacher_approved=True)
+        self.client = APIClient()
+
+    def create_course(self, title, description='Description', status='published', categories=()):
+        with self.captureOnCommitCallbacks(execute=True):
+            course = TeacherCourse.objects.create(
+                teacher_profile=self.teacher_profile, title=title, description=description,
+                price=Decimal('10.00'), status=status
+            )
+            course.categories.set(categories)
+        return course
+
+    def test_search_terms_drop_query_syntax(self):
+        self.assertEqual(search_terms('python* OR "django" -(web)'), ['python', 'or', 'django', 'web'])
+        self.assertEqual(search_course_ids('"*()'), [])
+
+    def test_title_match_ranks_first(self):
+        in_description = self.create_course('Web Basics', description='A first look at Python for the web.')
+        in_title = self.create_course('Python Programming')
+        self.assertEqual(search_course_ids('python'), [in_title.id, in_description.id])
+
+    def test_prefix_and_category_match(self):
+        data = CourseCategory.objects.create(name='Databases')
+        course = self.create_course('SQL Fundamentals', categories=[data])
+        self.assertEqual(search_course_ids('datab'), [course.id])
+        self.assertEqual(search_course_ids('sql datab'), [course.id])
+        self.assertEqual(search_course_ids('sql python'), [])
+
+    def test_unpublished_courses_only_with_published_only_false(self):
+        draft = self.create_course('Python Drafts', status='draft')
+        self.assertEqual(search_course_ids('python'), [])
+        self.assertEqual(search_course_ids('python', published_only=False), [draft.id])
+
+    def test_index_follows_edits_and_deletes(self):
+        course = self.create_course('Python Programming')
+        with self.captureOnCommitCallbacks(execute=True):
+            course.title = 'Rust Programming'
+            course.save()
+        self.assertEqual(search_course_ids('python'), [])
+        self.assertEqual(search_course_ids('rust'), [course.id])
+
+        category = CourseCategory.objects.create(name='Systems')
+        with self.captureOnCommitCallbacks(execute=True):
+            course.categories.add(category)
+        self.assertEqual(search_course_ids('systems'), [course.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            category.name = 'Embedded'
+            category.save()
+        self.assertEqual(search_course_ids('embedded'), [course.id])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            course.delete()
+        self.assertEqual(search_course_ids('rust'), [])
+
+    def test_saves_of_other_columns_do_not_reindex(self):
+        course = self.create_course('Python Programming')
+        with mock.patch('accounts.signals.schedule_search_index_refresh') as schedule:
+            course.price = Decimal('20.00')
+            course.status = 'draft'
+            course.save(update_fields=['price', 'status', 'updated_at'])
+            schedule.assert_not_called()
+
+            course.title = 'Rust Programming'
+            course.save(update_fields=['title', 'updated_at'])
+            schedule.assert_called_once_with([course.id])
+
+    def test_rebuild_command(self):
+        course = self.create_course('Python Programming')
+        # Bypasses signals, so the index is stale until rebuilt
+        TeacherCourse.objects.filter(id=course.id).update(title='Go Programming')
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(search_course_ids('go'), [course.id])
+
+    def test_api_endpoint_paginates_ranked_results(self):
+        courses = [self.create_course(f'Python {i}') for i in range(3)]
+        url = reverse('api_course_search')
+
+        response = self.client.get(url, {'q': 'python', 'page_size': 2}, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual([c['id'] for c in response.data['results']], [courses[2].id, courses[1].id])
+        self.assertIsNotNone(response.data['next'])
+
+        self.assertEqual(self.client.get(url, secure=True).status_code, 400)
+
+    def test_admin_search_uses_index(self):
+        course = self.create_course('Python Programming', status='pending')
+        self.create_course('Rust Programming', status='pending')
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        self.client.force_login(admin_user)
+
+        response = self.client.get(reverse('admin:accounts_teachercourse_changelist'), {'q': 'python'}, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context['cl'].queryset), [course])
+
+    def test_admin_search_by_partial_username_and_language(self):
+        course = self.create_course('Python Programming')
+        other_teacher = User.objects.create_user(username='rustacean', email='rustacean@example.com', user_type='teacher')
+        with self.captureOnCommitCallbacks(execute=True):
+            other = TeacherCourse.objects.create(
+                teacher_profile=Profile.objects.create(user=other_teacher, is_teacher_approved=True),
+                title='Rust Programming', description='Description', price=Decimal('10.00'), language='ar',
+            )
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        self.client.force_login(admin_user)
+        url = reverse('admin:accounts_teachercourse_changelist')
+
+        for term, expected in (('teach', [course]), ('ar', [other]), ('programming', [other, course])):
+            response = self.client.get(url, {'q': term}, secure=True)
+            self.assertEqual(list(response.context['cl'].queryset), expected, term)
+
+    def test_admin_search_is_not_capped(self):
+        TeacherCourse.objects.bulk_create([
+            TeacherCourse(
+                teacher_profile=self.teacher_profile, title=f'Python {i}', description='Description',
+                price=Decimal('10.00'), status='pending',
+            )
+            for i in range(SEARCH_MAX_RESULTS + 1)
+        ])
+        rebuild_search_index()
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password123')
+        self.client.force_login(admin_user)
+
+        response = self.client.get(reverse('admin:accounts_teachercourse_changelist'), {'q': 'python'}, secure=True)
+        self.assertEqual(response.context['cl'].result_count, SEARCH_MAX_RESULTS + 1)
+        self.assertEqual(filter_matching_courses(TeacherCourse.objects.all(), 'python').count(), SEARCH_MAX_RESULTS + 1)
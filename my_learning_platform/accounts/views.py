@@ -9,23 +9,32 @@ from django.urls import reverse
 from django.contrib.auth import login, authenticate, logout, get_user_model
 from django.contrib.auth.forms import AuthenticationForm
 from django.contrib import messages
-from django.core.mail import send_mail
 from django.conf import settings
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.utils import timezone
-from django.db import IntegrityError
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import require_POST, condition
 from django.core.exceptions import PermissionDenied
-from django.db.models import Sum, Count, F
+from django.db.models import Sum, Count, F, Max
 from decimal import Decimal # Import Decimal from the decimal module
 from decimal import Decimal
 # --- Consolidated Model Imports ---
-from .models import CustomUser, Profile, TeacherCourse, CourseCategory, CourseLevel, EnrolledCourse, AllowedCard
+from .models import CustomUser, Profile, TeacherCourse, CourseCategory, CourseLevel, EnrolledCourse
 from .models import ContactMessage
+from .catalog import get_featured_courses, get_published_courses
+from .mixins import make_etag
+from .courses import save_course_changes
+from .ranking import get_trending_courses
+from .middleware import get_profile
+from .payments import AlreadyEnrolled, PaymentDeclined, enroll_with_payment
+from .notifications import notify_contact_message, notify_teacher_application_received
+from .reports import (
+    build_course_summary, get_commission_rate,
+    course_enrollment_page, course_enrollment_totals, iter_course_enrollments_csv,
+)
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import UpdateView # This should already be there if you're using UpdateView
 # ... other imports (e.g., render, redirect, forms, models)
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
 
 # --- Consolidated Form Imports ---
 from .forms import (
@@ -52,20 +61,17 @@ def is_approved_teacher(user):
     if not user.is_authenticated or user.user_type != 'teacher':
         return False
 
-    if not hasattr(user, 'profile') or not user.profile:
-        logging.warning(f"User {user.username} is a teacher but has no profile.")
-        return False
-
-    return user.profile.is_teacher_approved
+    return get_profile(user).is_teacher_approved
 
 
 # --- Core Homepage View ---
 def index_view(request):
-    published_courses = TeacherCourse.objects.filter(featured=True, status='published').select_related('teacher_profile__user').order_by('-created_at')
+    published_courses = get_featured_courses() # Served from the catalog cache
     context = {
         'page_title': 'Welcome to My Portfolio',
         'published_courses': published_courses,
         'featured_courses': published_courses,
+        'trending_courses': get_trending_courses(), # Top-k of the ranking table, cached
     }
     return render(request, 'index.html', context)
 
@@ -84,9 +90,41 @@ def certificates_view(request):
     context = {}
     return render(request, 'certificates.html', context)
 
+# --- Conditional GET Validators ---
+# Pages differ per visitor (navigation, enrollment state), so every ETag includes the user.
+def course_list_etag(request):
+    # Read from the database, like the API's ConditionalGetMixin: COUNT catches removals,
+    # MAX(updated_at) edits and additions (category, level and teacher username changes
+    # touch updated_at, see accounts.signals)
+    validators = TeacherCourse.objects.filter(status='published').aggregate(
+        count=Count('id'), last_updated=Max('updated_at')
+    )
+    last_updated = validators['last_updated'].isoformat() if validators['last_updated'] else ''
+    # The navigation shows the username and, for teachers, the approval state
+    user = request.user
+    viewer = (user.pk, user.username, get_profile(user).is_teacher_approved) if user.is_authenticated else ()
+    return make_etag('catalog', validators['count'], last_updated, *viewer)
+
+
+def course_detail_etag(request, course_id):
+    updated_at = (
+        TeacherCourse.objects.filter(id=course_id, status__in=['published', 'approved'])
+        .values_list('updated_at', flat=True)
+        .first()
+    )
+    if updated_at is None:
+        return None # Let the view raise its 404
+
+    is_enrolled = False
+    if request.user.is_authenticated:
+        is_enrolled = EnrolledCourse.objects.filter(student=request.user.profile, course_id=course_id).exists()
+    return make_etag('course', course_id, updated_at.isoformat(), request.user.pk, is_enrolled)
+
+
 # --- Course List View ---
+@condition(etag_func=course_list_etag)
 def course_list_view(request):
-    courses = TeacherCourse.objects.filter(status='published').select_related('teacher_profile__user').order_by('-created_at')
+    courses = get_published_courses() # Served from the catalog cache
     context = {
         'page_title': 'Our Courses & Learning',
         'courses': courses
@@ -94,15 +132,13 @@ def course_list_view(request):
     return render(request, 'courses.html', context)
 
 # --- Individual Course Detail View ---
+@condition(etag_func=course_detail_etag)
 def course_detail(request, course_id):
     course = get_object_or_404(TeacherCourse, id=course_id, status__in=['published', 'approved'])
 
     is_enrolled = False
     if request.user.is_authenticated:
-        if hasattr(request.user, 'profile') and request.user.profile:
-            is_enrolled = EnrolledCourse.objects.filter(student=request.user.profile, course=course).exists()
-        else:
-            logging.warning(f"User {request.user.username} is authenticated but has no profile.")
+        is_enrolled = EnrolledCourse.objects.filter(student=request.user.profile, course=course).exists()
 
     context = {
         'page_title': course.title,
@@ -117,6 +153,7 @@ def contact_view(request):
         form = ContactForm(request.POST)
         if form.is_valid():
             contact_message = form.save()
+            notify_contact_message(contact_message)
 
             messages.success(request, 'Your message has been sent successfully!')
             return redirect('contact')
@@ -173,14 +210,12 @@ def login_view(request):
         form = AuthenticationForm(request, data=request.POST)
 
         if form.is_valid():
-            username = form.cleaned_data.get('username')
-            password = form.cleaned_data.get('password')
-            user = authenticate(request, username=username, password=password)
+            # The form already authenticated (and hashed) once; don't hash again
+            user = form.get_user()
 
             if user is not None:
-                profile, created = Profile.objects.get_or_create(user=user)
-                if created:
-                    logging.info(f"Profile created for new user {user.username} during login.")
+                # Loaded with the user by the authentication backend (created if missing)
+                profile = get_profile(user)
 
                 if user.user_type == 'teacher':
                     if not profile.is_teacher_approved:
@@ -233,7 +268,7 @@ def dashboard(request):
 @login_required
 def profile_view(request):
     user = request.user
-    profile, created = Profile.objects.get_or_create(user=user)
+    profile = user.profile
 
     context = {
         'profile': profile,
@@ -246,7 +281,7 @@ def profile_view(request):
 @login_required
 def profile_edit(request):
     user = request.user
-    profile, created = Profile.objects.get_or_create(user=user)
+    profile = user.profile
 
     if request.method == 'POST':
         user_form = CustomUserChangeForm(request.POST, instance=user)
@@ -427,7 +462,7 @@ def teacher_register_password_setting(request):
     is_authenticated = teacher_data.get('is_authenticated_at_stage1')
     if is_authenticated and request.user.is_authenticated:
         user = request.user
-        profile, created_profile = Profile.objects.get_or_create(user=user)
+        profile = user.profile
 
         profile.full_name_en = teacher_data.get('full_name_en', profile.full_name_en)
         profile.full_name_ar = teacher_data.get('full_name_ar', profile.full_name_ar)
@@ -452,6 +487,7 @@ def teacher_register_password_setting(request):
 
         try:
             profile.save()
+            notify_teacher_application_received(profile)
             if 'teacher_data' in request.session:
                 del request.session['teacher_data']
                 request.session.modified = True
@@ -522,6 +558,7 @@ def teacher_register_password_setting(request):
                 profile.rejection_reason = None
 
                 profile.save()
+                notify_teacher_application_received(profile)
 
                 if 'teacher_data' in request.session:
                     del request.session['teacher_data']
@@ -566,47 +603,34 @@ def teacher_dashboard(request):
 def register_for_course(request, course_id):
     course = get_object_or_404(TeacherCourse, id=course_id, status='published')
 
-    if not hasattr(request.user, 'profile') or not request.user.profile:
-        messages.error(request, "Your user profile is incomplete. Please update your profile before registering.")
-        return redirect('course_detail', course_id=course.id)
-
-    if EnrolledCourse.objects.filter(student=request.user.profile, course=course).exists():
-        messages.info(request, f"You are already enrolled in {course.title}.")
-        return redirect('course_detail', course_id=course.id)
-
     if request.method == 'POST':
+        # No "already enrolled?" query here: enroll_with_payment relies on the unique constraint
         form = PaymentForm(request.POST)
         if form.is_valid():
-            card_number = form.cleaned_data['card_number']
-            expiry_month = form.cleaned_data['expiry_month']
-            expiry_year = form.cleaned_data['expiry_year']
-
-            is_card_allowed = AllowedCard.objects.filter(
-                card_number=card_number,
-                expiry_month=expiry_month,
-                expiry_year=expiry_year
-            ).exists()
-
-            if is_card_allowed:
-                try:
-                    EnrolledCourse.objects.create(
-                        student=request.user.profile,
-                        course=course,
-                        fee_paid=course.price
-                    )
-                    messages.success(request, f"Payment successful! You are now enrolled in {course.title}.")
-                    return redirect('course_detail', course_id=course.id)
-                except IntegrityError:
-                    messages.info(request, f"You are already enrolled in {course.title}.")
-                    return redirect('course_detail', course_id=course.id)
-                except Exception as e:
-                    messages.error(f"Error completing enrollment after payment: {e}")
-                    logging.error(f"Error enrolling user {request.user.username} in course {course.id}: {e}", exc_info=True)
-                    return redirect('register_for_course', course_id=course.id)
-            else:
-                messages.error(request, "Payment failed: Card details do not match any allowed method.")
+            try:
+                enroll_with_payment(
+                    request.user.profile,
+                    course,
+                    form.cleaned_data['card_number'],
+                    form.cleaned_data['expiry_month'],
+                    form.cleaned_data['expiry_year'],
+                )
+                messages.success(request, f"Payment successful! You are now enrolled in {course.title}.")
+                return redirect('course_detail', course_id=course.id)
+            except AlreadyEnrolled:
+                messages.info(request, f"You are already enrolled in {course.title}.")
+                return redirect('course_detail', course_id=course.id)
+            except PaymentDeclined as e:
+                messages.error(request, f"Payment failed: {e}")
+            except Exception as e:
+                messages.error(request, f"Error completing enrollment after payment: {e}")
+                logging.error(f"Error enrolling user {request.user.username} in course {course.id}: {e}", exc_info=True)
+                return redirect('register_for_course', course_id=course.id)
         else:
             messages.error(request, "Please correct the errors in the payment form.")
+    elif EnrolledCourse.objects.filter(student=request.user.profile, course=course).exists():
+        messages.info(request, f"You are already enrolled in {course.title}.")
+        return redirect('course_detail', course_id=course.id)
     else:
         form = PaymentForm()
 
@@ -616,7 +640,7 @@ def register_for_course(request, course_id):
 @login_required
 def student_dashboard_view(request):
     user = request.user
-    profile, created = Profile.objects.get_or_create(user=user)
+    profile = user.profile
 
     enrolled_courses_objects = EnrolledCourse.objects.filter(student=profile).select_related('course__teacher_profile__user').order_by('-enrolled_at')
     enrolled_courses = [enrolled_course.course for enrolled_course in enrolled_courses_objects]
@@ -638,6 +662,7 @@ def unenroll_from_course_view(request, course_id):
 
     try:
         enrolled_course = EnrolledCourse.objects.get(student=profile, course=course)
+        # The ledger and course totals follow through the post_delete signal
         enrolled_course.delete()
         messages.success(request, f"You have successfully unenrolled from '{course.title}'.")
         messages.info(request, "Please note: Refunds are processed manually. Our team will contact you within 3-5 business days regarding your refund.")
@@ -662,38 +687,8 @@ def teacher_course_reports(request):
     """
     teacher_profile = request.user.profile
 
-    # Safely convert commission_percentage to Decimal
-    commission_rate_decimal = Decimal(str(teacher_profile.commission_percentage)) if teacher_profile.commission_percentage is not None else Decimal('0.00')
-    commission_rate_decimal = commission_rate_decimal / Decimal('100') # Divide by 100 here to get the rate (e.g., 5.00 -> 0.05)
-
-    # Filter courses to include only those with at least one enrollment
-    # Use annotation to count students directly on the queryset
-    teacher_courses_with_enrollments = TeacherCourse.objects.filter(teacher_profile=teacher_profile) \
-                                                    .annotate(num_students=Count('enrolled_students')) \
-                                                    .filter(num_students__gt=0) \
-                                                    .order_by('title')
-
-    report_data = []
-    for course in teacher_courses_with_enrollments: # Iterate over filtered courses
-        # Since we've already counted num_students, we can use it directly if available,
-        # but for total_fees we still need Sum.
-        enrollments = EnrolledCourse.objects.filter(course=course).select_related('student__user')
-
-        total_fees_result = enrollments.aggregate(total_fees=Sum('fee_paid'))
-        total_fees_for_course = total_fees_result['total_fees'] if total_fees_result['total_fees'] is not None else Decimal('0.00')
-
-        commission_value = total_fees_for_course * commission_rate_decimal
-        profit = total_fees_for_course - commission_value
-
-        report_data.append({
-            'course_id': course.id,
-            'course_title': course.title,
-            'total_students': course.num_students, # Use the annotated count
-            'total_fees_collected': total_fees_for_course,
-            'commission_rate': teacher_profile.commission_percentage,
-            'commission_value': commission_value,
-            'profit': profit,
-        })
+    # All per-course totals come from a single annotated query (see accounts/reports.py)
+    report_data = build_course_summary(teacher_profile)
 
     context = {
         'report_data': report_data,
@@ -706,43 +701,42 @@ def teacher_course_reports(request):
 @user_passes_test(is_approved_teacher, login_url='login')
 def teacher_single_course_report(request, course_id):
     """
-    Displays a detailed report for a single course, listing all enrolled students
-    and their individual fees.
+    Displays a detailed report for a single course, listing enrolled students
+    and their individual fees one page at a time (keyset pagination on username).
+    With ?export=csv the full list is streamed as a CSV download instead.
     """
     teacher_profile = request.user.profile
 
     course = get_object_or_404(TeacherCourse, id=course_id, teacher_profile=teacher_profile)
 
-    enrollments = EnrolledCourse.objects.filter(course=course).select_related('student__user').order_by('student__user__username')
+    if request.GET.get('export') == 'csv':
+        response = StreamingHttpResponse(iter_course_enrollments_csv(course), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="course_{course.id}_enrollments.csv"'
+        return response
 
-    students_in_course = []
-    total_fees_for_course = Decimal('0.00') # Initialize as Decimal
+    after = request.GET.get('after')
+    students_in_course, next_cursor = course_enrollment_page(course, after=after)
 
-    for enrollment in enrollments:
-        students_in_course.append({
-            'username': enrollment.student.user.username,
-            'full_name': enrollment.student.full_name_en or enrollment.student.full_name_ar,
-            'fee_paid': enrollment.fee_paid,
-            'enrolled_at': enrollment.enrolled_at,
-        })
-        total_fees_for_course += enrollment.fee_paid
+    # Totals are computed by the database, independent of the page being shown
+    totals = course_enrollment_totals(course)
+    total_fees_for_course = totals['total_fees']
 
     # Safely convert commission_percentage to Decimal
     commission_rate = teacher_profile.commission_percentage if teacher_profile.commission_percentage is not None else Decimal('0.00')
-    commission_rate_decimal = Decimal(str(commission_rate)) / Decimal('100') # Convert to Decimal rate
-
-    commission_value = total_fees_for_course * commission_rate_decimal
+    commission_value = total_fees_for_course * get_commission_rate(teacher_profile)
     profit = total_fees_for_course - commission_value
 
 
     context = {
         'course': course,
         'students_in_course': students_in_course,
-        'total_students': enrollments.count(),
+        'total_students': totals['total_students'],
         'total_fees_collected': total_fees_for_course,
         'commission_rate': commission_rate,
         'commission_value': commission_value,
         'profit': profit,
+        'next_cursor': next_cursor,
+        'is_first_page': not after,
         'page_title': f"Report for {course.title}",
     }
     return render(request, 'accounts/teacher_single_course_report.html', context)
@@ -762,11 +756,15 @@ def edit_teacher_course(request, course_id):
             try:
                 # Set status to 'pending' if it was 'published' after an edit
                 # This ensures re-approval if changes are made to a published course
+                # The form already applied the posted values to `course`; write only what changed
+                changed_fields = [name for name in form.changed_data if name != 'categories']
                 if course.status == 'published' and form.has_changed():
                     course.status = 'pending'
+                    changed_fields.append('status')
                     messages.info(request, "Course updated and set to 'Pending Review' due to changes in a published course.")
-                
-                form.save()
+
+                categories = form.cleaned_data['categories'] if 'categories' in form.changed_data else None
+                save_course_changes(course, changed_fields, categories)
                 messages.success(request, f'Course "{course.title}" updated successfully!')
                 return redirect('teacher_dashboard')
             except Exception as e:
@@ -0,0 +1,25 @@
+# gunicorn.conf.py
+#
+# WSGI (default): sync workers serving my_learning_platform_core.wsgi.
+# ASGI: set SERVER_INTERFACE=asgi to run uvicorn workers on my_learning_platform_core.asgi,
+# which serves the async endpoints (accounts/async_views.py) concurrently.
+# Sync views still work under ASGI but run on a thread each, as does any request
+# passing through sync-only middleware (WhiteNoiseMiddleware is one).
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+# Read back by the Django settings (WEB_CONCURRENCY): process-local caches are not
+# shared between workers, see AUTH_CACHE_ENABLED
+os.environ['WEB_CONCURRENCY'] = str(workers)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+accesslog = '-'
+
+if os.environ.get('SERVER_INTERFACE', 'wsgi').lower() == 'asgi':
+    wsgi_app = 'my_learning_platform_core.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'my_learning_platform_core.wsgi:application'
+    worker_class = 'sync'
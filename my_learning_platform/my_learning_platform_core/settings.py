@@ -6,6 +6,8 @@ from pathlib import Path
 import os
 import dj_database_url
 
+from accounts.hashers import password_hashers_for_tier
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 # Load environment variables
@@ -51,13 +53,17 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # request.user arrives with its profile (created if missing)
+    'accounts.middleware.ProfileMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'django.middleware.locale.LocaleMiddleware',
 ]
 
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
+    # ModelBackend subclass accepting username or email; replaces ModelBackend so a
+    # failed login is not hashed a second time by another backend
+    'accounts.backends.UsernameOrEmailBackend',
 ]
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 ROOT_URLCONF = 'my_learning_platform_core.urls'
@@ -89,6 +95,88 @@ DATABASES = {
     )
 }
 
+# Cache
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at a shared cache
+# (e.g. django.core.cache.backends.redis.RedisCache) when running several workers.
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'learning-platform'),
+    }
+}
+# Backends whose entries live in one process and are invisible to the other workers
+PROCESS_LOCAL_CACHE_BACKENDS = ('django.core.cache.backends.locmem.LocMemCache',)
+
+# Worker processes serving requests; gunicorn.conf.py exports the count it starts
+WEB_CONCURRENCY = int(os.environ.get('WEB_CONCURRENCY', 1))
+
+# Cache the public course catalog (published / featured lists, facet counts, trending).
+# A course change bumps the catalog version only in the cache it can reach, so this is on
+# by default only when every worker shares the cache (system check accounts.E002).
+CATALOG_CACHE_ENABLED = os.environ.get(
+    'CATALOG_CACHE_ENABLED', str(CACHE_BACKEND not in PROCESS_LOCAL_CACHE_BACKENDS or WEB_CONCURRENCY == 1)
+) == 'True'
+# Seconds the public course catalog (homepage / course list) stays cached
+CATALOG_CACHE_TIMEOUT = int(os.environ.get('CATALOG_CACHE_TIMEOUT', 300))
+
+# Cache API token lookups and verified Basic credentials (accounts.authentication).
+# A logout, password change or deactivation only clears the cache it can reach, so this
+# is on by default only when every worker shares the cache (system check accounts.E001).
+AUTH_CACHE_ENABLED = os.environ.get(
+    'AUTH_CACHE_ENABLED', str(CACHE_BACKEND not in PROCESS_LOCAL_CACHE_BACKENDS or WEB_CONCURRENCY == 1)
+) == 'True'
+# Seconds an API token -> user lookup stays cached (accounts.authentication)
+AUTH_TOKEN_CACHE_TIMEOUT = int(os.environ.get('AUTH_TOKEN_CACHE_TIMEOUT', 300))
+# Seconds verified HTTP Basic credentials are remembered (skips the password hash)
+BASIC_AUTH_CACHE_TIMEOUT = int(os.environ.get('BASIC_AUTH_CACHE_TIMEOUT', 60))
+
+# Password hashing
+# 'argon2' (default, production), 'pbkdf2' or 'fast' (tests only). Stored hashes from
+# another tier keep working and are upgraded to the preferred hasher on next login.
+PASSWORD_HASHER_TIER = os.environ.get('PASSWORD_HASHER_TIER', 'argon2')
+PASSWORD_HASHERS = password_hashers_for_tier(PASSWORD_HASHER_TIER)
+
+# Email
+# Sent by the background worker (`manage.py run_jobs`), never inside a request.
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 25))
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'False') == 'True'
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'webmaster@localhost')
+# Comma-separated addresses receiving contact form submissions
+ADMINS = [('Admin', email.strip()) for email in os.environ.get('ADMIN_EMAILS', '').split(',') if email.strip()]
+
+# Background jobs (accounts.jobs)
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', 5))
+# Base retry delay in seconds, doubled after each failed attempt
+JOB_RETRY_DELAY = int(os.environ.get('JOB_RETRY_DELAY', 30))
+JOB_BATCH_SIZE = int(os.environ.get('JOB_BATCH_SIZE', 50))
+
+# Course popularity ranking (accounts.ranking, refreshed by `manage.py refresh_course_rankings`):
+# enrollments in the short and long windows (days), the short window counting
+# 1 + RANKING_RECENT_WEIGHT times
+RANKING_SHORT_WINDOW_DAYS = int(os.environ.get('RANKING_SHORT_WINDOW_DAYS', 7))
+RANKING_LONG_WINDOW_DAYS = int(os.environ.get('RANKING_LONG_WINDOW_DAYS', 30))
+RANKING_RECENT_WEIGHT = float(os.environ.get('RANKING_RECENT_WEIGHT', 3))
+# Seconds the top course ids stay cached; about one refresh interval, so workers that
+# cannot see the refresh command's cache (accounts.W001) pick up a new ranking anyway
+RANKING_CACHE_TIMEOUT = int(os.environ.get('RANKING_CACHE_TIMEOUT', 600))
+
+# Admin changelists estimate their row count from PostgreSQL statistics above this many
+# rows (append ?exact_count=1 to a changelist URL for an exact COUNT)
+ADMIN_APPROXIMATE_COUNT_THRESHOLD = int(os.environ.get('ADMIN_APPROXIMATE_COUNT_THRESHOLD', 100000))
+
+# Payments (accounts.payments)
+# Dotted path of the gateway used at checkout. accounts.payments.StubGateway accepts every
+# card after PAYMENT_STUB_LATENCY_MS of simulated latency (load testing only).
+PAYMENT_GATEWAY = os.environ.get('PAYMENT_GATEWAY', 'accounts.payments.AllowedCardGateway')
+PAYMENT_STUB_LATENCY_MS = int(os.environ.get('PAYMENT_STUB_LATENCY_MS', 0))
+# Key of the stored card fingerprints (falls back to SECRET_KEY). Changing it invalidates them.
+CARD_FINGERPRINT_KEY = os.environ.get('CARD_FINGERPRINT_KEY', '')
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -122,9 +210,9 @@ MEDIA_URL = '/media/'
 # REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'accounts.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.BasicAuthentication'
+        'accounts.authentication.CachedBasicAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly'
@@ -0,0 +1,12 @@
+"""
+Django settings for the test suite (see pytest.ini).
+"""
+
+from .settings import *  # noqa: F401,F403
+
+from accounts.hashers import password_hashers_for_tier
+
+# Password hashing dominates fixture setup (create_user / login); tests do not need
+# a slow hash. Tests that exercise a specific tier override PASSWORD_HASHERS.
+PASSWORD_HASHER_TIER = 'fast'
+PASSWORD_HASHERS = password_hashers_for_tier(PASSWORD_HASHER_TIER)